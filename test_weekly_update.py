@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""週次差分更新のテスト（分割番号・サブデータ番号が空欄の行の置き換え・削除）"""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from tmcloud_import_v2 import import_table
+from tmcloud_migrate import migrate
+from tmcloud_weekly_update import apply_update
+
+BASE_DIR = Path(__file__).parent
+
+SEARCH_HEADER = 'app_num\tsplit_num\tsub_data_num\tsearch_use_t_seq\tsearch_use_t\tadd_del_id'
+
+
+def _write_tsv(path, lines):
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+def _create_db(work_dir):
+    """空欄の分割番号で商標（検索用）を2件取り込んだDBを作る"""
+    conn = sqlite3.connect(str(work_dir / 'test.db'))
+    conn.executescript((BASE_DIR / 'tmcloud_schema_v2.sql').read_text(encoding='utf-8'))
+    tsv_path = work_dir / 'upd_search_use_t_art_table.tsv'
+    _write_tsv(tsv_path, [
+        SEARCH_HEADER,
+        '2024000001\t\t\t1\tソニー\t0',
+        '2024000002\t\t\t1\tパナソニック\t0',
+    ])
+    import_table(conn, 'trademark_search', tsv_path)
+    migrate(conn)
+    conn.commit()
+    return conn
+
+
+def _names(conn, app_num):
+    rows = conn.execute("SELECT search_use_t FROM trademark_search WHERE app_num = ?", (app_num,))
+    return [row[0] for row in rows]
+
+
+def _fts_app_nums(conn, term):
+    rows = conn.execute("""
+        SELECT ts.app_num FROM trademark_search_fts f
+        JOIN trademark_search ts ON ts.rowid = f.rowid
+        WHERE trademark_search_fts MATCH ?
+    """, (f'"{term}"',))
+    return sorted(row[0] for row in rows)
+
+
+def test_weekly_update_blank_split_num():
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        conn = _create_db(work_dir)
+        assert conn.execute("SELECT COUNT(*) FROM trademark_search WHERE split_num IS NULL").fetchone()[0] == 2
+
+        delta_dir = work_dir / 'delta'
+        delta_dir.mkdir()
+        _write_tsv(delta_dir / 'upd_search_use_t_art_table.tsv', [
+            SEARCH_HEADER,
+            '2024000001\t\t\t1\tソニック\t0',
+            '2024000002\t\t\t1\tパナソニック\t1',
+        ])
+        apply_update(conn, delta_dir)
+
+        # 置き換えた行は1件だけ残り、旧名称はFTSから消えている
+        assert _names(conn, '2024000001') == ['ソニック']
+        assert _fts_app_nums(conn, 'ソニック') == ['2024000001']
+        assert _fts_app_nums(conn, 'ソニー') == []
+        # 削除した行は残らない
+        assert _names(conn, '2024000002') == []
+        assert _fts_app_nums(conn, 'パナソ') == []
+        conn.execute("INSERT INTO trademark_search_fts(trademark_search_fts) VALUES('integrity-check')")
+        conn.close()
+
+    print("週次差分更新（空欄の分割番号）: OK")
+
+
+if __name__ == "__main__":
+    test_weekly_update_blank_split_num()
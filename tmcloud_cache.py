@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TMCloud 検索結果キャッシュ
+
+DBのビルドID（tmcloud_metaのbuild_id）ごとに次の2つを保持する。
+週次更新・再インポート・DBの切り替えでビルドIDが変わると、その後に使われなくなった
+ビルドの値は破棄される。
+
+- 検索結果キャッシュ: 同じ検索（メソッド・引数）の結果。プロセス内のLRU（合計バイト数・
+  有効期限で制限）に加え、複数のワーカープロセスで共有するSQLiteファイルの層を任意で使える
+- レコードキャッシュ: 出願番号ごとの統一フォーマットのbasic_info。異なる検索で同じ出願が
+  返る場合のハイドレーション（_format_unified_result）を省く
+
+値はJSON文字列で保持し、取り出すたびに復元する（呼び出し元が結果を書き換えても
+キャッシュに影響しない）。上限はキーとJSON文字列のUTF-8での合計バイト数で数える。
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+
+# プロセス内キャッシュの既定の上限（キーとJSON文字列の合計バイト数）と有効期限（秒）
+RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+RESULT_CACHE_TTL = 3600.0
+
+# レコードキャッシュの既定の上限（キーとJSON文字列の合計バイト数）
+RECORD_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+# 同時に保持するビルドの数（切り替え中の旧DBと新DBの両方の値を残す）
+BUILD_PARTITIONS = 2
+
+# ファイル層に保持する最大件数と、期限切れ・超過分を削除する書き込み間隔
+RESULT_CACHE_DISK_MAX_ENTRIES = 100000
+DISK_PRUNE_INTERVAL = 1000
+
+# ファイル層のテーブル
+RESULT_CACHE_DDL = """
+    CREATE TABLE IF NOT EXISTS result_cache (
+        build_id TEXT NOT NULL,             -- DBのビルドID
+        key TEXT NOT NULL,                  -- 検索のキー（メソッド名・引数のJSON）
+        created_at REAL NOT NULL,           -- 格納時刻（UNIX時刻）
+        value TEXT NOT NULL,                -- 結果のJSON
+        PRIMARY KEY (build_id, key)
+    ) WITHOUT ROWID
+"""
+
+# キャッシュに無いことを表す値（結果がNoneの検索もキャッシュするため）
+MISS = object()
+
+
+def result_cache_key(name: str, arguments: dict) -> str:
+    """検索のキー（メソッド名と引数のJSON。引数名順に並べる）"""
+    return json.dumps([name, arguments], sort_keys=True, ensure_ascii=False, default=str)
+
+
+class BuildScopedCache:
+    """DBのビルドIDごとに分けて保持するLRU（スレッドセーフ。合計バイト数で制限）
+
+    直近に使われたmax_builds個のビルドIDの値を保持し、別のビルドIDで読み書きされて
+    保持数を超えたときに最も前に使われたビルドの値を破棄する。ビルドIDの新旧は比較しないため、
+    以前のDBに戻した場合（tmcloud activate）や切り替え中の旧DBでもキャッシュを使える。
+    """
+
+    def __init__(self, max_bytes: int, max_builds: int = BUILD_PARTITIONS):
+        self.max_bytes = max_bytes
+        self.max_builds = max_builds
+        self._lock = threading.Lock()
+        # (ビルドID, key) -> (格納時刻, JSON文字列, バイト数)。末尾が直近に使われたもの
+        self._entries = OrderedDict()
+        self._bytes = 0
+        # 保持しているビルドID。末尾が直近に使われたもの
+        self._builds = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """全ての値を破棄する"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _use_build(self, build_id: str):
+        """ビルドIDを直近に使われたものとし、保持数を超えたビルドの値を破棄する"""
+        if build_id in self._builds:
+            self._builds.move_to_end(build_id)
+            return
+        self._builds[build_id] = None
+        if len(self._builds) <= self.max_builds:
+            return
+        while len(self._builds) > self.max_builds:
+            self._builds.popitem(last=False)
+        for entry_key in [entry_key for entry_key in self._entries if entry_key[0] not in self._builds]:
+            self._remove(entry_key)
+        self._drop_builds(tuple(self._builds))
+
+    def _drop_builds(self, kept_build_ids: tuple):
+        """保持するビルドが入れ替わったときに呼ばれる（プロセス外の層の削除用）"""
+
+    def _store(self, key, entry):
+        """格納し、上限を超えた分を古い順に捨てる（entryは(格納時刻, JSON文字列)）"""
+        created_at, value = entry[:2]
+        size = len(str(key).encode('utf-8')) + len(value.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = (created_at, value, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted[2]
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+
+class ResultCache(BuildScopedCache):
+    """検索結果キャッシュ（有効期限と、任意でワーカープロセス間で共有するファイル層）"""
+
+    def __init__(self, max_bytes: int = RESULT_CACHE_MAX_BYTES, ttl: float = RESULT_CACHE_TTL,
+                 disk_path: str = None, disk_max_entries: int = RESULT_CACHE_DISK_MAX_ENTRIES):
+        """初期化
+
+        Args:
+            max_bytes: プロセス内に保持する結果の合計バイト数（0の場合はプロセス内に保持しない）
+            ttl: 結果の有効期限（秒）
+            disk_path: ワーカープロセス間で共有するSQLiteファイル（Noneの場合はプロセス内のみ）
+            disk_max_entries: ファイル層に保持する最大件数
+        """
+        super().__init__(max_bytes)
+        self.ttl = ttl
+        self.disk_path = disk_path
+        self.disk_max_entries = disk_max_entries
+        self._disk = None
+        self._disk_pid = None
+        self._disk_puts = 0
+
+    def get(self, build_id: str, key: str) -> Any:
+        """結果を取り出す（無い・期限切れの場合はMISS）"""
+        build_id = build_id or ''
+        now = time.time()
+        with self._lock:
+            self._use_build(build_id)
+            entry_key = (build_id, key)
+            entry = self._entries.get(entry_key)
+            if entry is not None and now - entry[0] > self.ttl:
+                self._remove(entry_key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(entry_key)
+            else:
+                entry = self._disk_get(build_id, key, now)
+                if entry is not None:
+                    self._store(entry_key, entry)
+            if entry is None:
+                self.misses += 1
+                return MISS
+            self.hits += 1
+            value = entry[1]
+        return json.loads(value)
+
+    def put(self, build_id: str, key: str, result: Any):
+        """結果を格納する（JSONにできない結果は格納しない）"""
+        build_id = build_id or ''
+        try:
+            value = json.dumps(result, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return
+        entry = (time.time(), value)
+        with self._lock:
+            self._use_build(build_id)
+            self._store((build_id, key), entry)
+            self._disk_put(build_id, key, entry)
+
+    def clear(self):
+        """全ての結果を破棄する（ファイル層を含む）"""
+        super().clear()
+        with self._lock:
+            disk = self._disk_connection()
+            if disk is not None:
+                self._disk_execute(disk, "DELETE FROM result_cache")
+
+    def _drop_builds(self, kept_build_ids: tuple):
+        disk = self._disk_connection()
+        if disk is not None:
+            placeholders = ','.join('?' * len(kept_build_ids))
+            self._disk_execute(disk, f"DELETE FROM result_cache WHERE build_id NOT IN ({placeholders})",
+                               kept_build_ids)
+
+    # ---------- ファイル層 ----------
+
+    def _disk_connection(self) -> Optional[sqlite3.Connection]:
+        """ファイル層の接続（fork後のワーカーでは開き直す）"""
+        if self.disk_path is None:
+            return None
+        if self._disk is None or self._disk_pid != os.getpid():
+            try:
+                disk = sqlite3.connect(self.disk_path, timeout=1.0, check_same_thread=False,
+                                       isolation_level=None)
+                disk.execute("PRAGMA journal_mode=WAL")
+                disk.execute("PRAGMA synchronous=OFF")
+                disk.execute(RESULT_CACHE_DDL)
+            except sqlite3.Error as e:
+                print(f"警告: 検索結果キャッシュのファイルを開けません（{self.disk_path}）: {e}")
+                self.disk_path = None
+                return None
+            self._disk = disk
+            self._disk_pid = os.getpid()
+        return self._disk
+
+    def _disk_execute(self, disk: sqlite3.Connection, sql: str, params=()):
+        """ファイル層への書き込み（ロック待ちの超過などはキャッシュを使わないだけとする）"""
+        try:
+            disk.execute(sql, params)
+        except sqlite3.Error:
+            pass
+
+    def _disk_get(self, build_id: str, key: str, now: float):
+        disk = self._disk_connection()
+        if disk is None:
+            return None
+        try:
+            row = disk.execute("""
+                SELECT created_at, value FROM result_cache
+                WHERE build_id = ? AND key = ? AND created_at >= ?
+            """, (build_id, key, now - self.ttl)).fetchone()
+        except sqlite3.Error:
+            return None
+        return tuple(row) if row else None
+
+    def _disk_put(self, build_id: str, key: str, entry):
+        disk = self._disk_connection()
+        if disk is None:
+            return
+        self._disk_execute(disk, """
+            INSERT OR REPLACE INTO result_cache (build_id, key, created_at, value) VALUES (?, ?, ?, ?)
+        """, (build_id, key) + entry)
+
+        self._disk_puts += 1
+        if self._disk_puts % DISK_PRUNE_INTERVAL == 0:
+            # 期限切れと、新しい順に上限を超えた分を削除
+            self._disk_execute(disk, "DELETE FROM result_cache WHERE created_at < ?", (entry[0] - self.ttl,))
+            self._disk_execute(disk, """
+                DELETE FROM result_cache WHERE (build_id, key) IN (
+                    SELECT build_id, key FROM result_cache
+                    ORDER BY created_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+            """, (self.disk_max_entries,))
+
+
+class RecordCache(BuildScopedCache):
+    """出願番号ごとの整形済みレコード（統一フォーマットのbasic_info）のキャッシュ
+
+    取得したファセットの組み合わせ（fieldsの解決結果）ごとに別のレコードとして保持する。
+    """
+
+    def __init__(self, max_bytes: int = RECORD_CACHE_MAX_BYTES):
+        """初期化
+
+        Args:
+            max_bytes: 保持するレコードの合計バイト数
+        """
+        super().__init__(max_bytes)
+
+    def get_many(self, build_id: str, facets: tuple, app_nums: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """キャッシュにあるレコードを出願番号をキーとした辞書で返す（無いものは含めない）"""
+        build_id = build_id or ''
+        found = []
+        with self._lock:
+            self._use_build(build_id)
+            for app_num in app_nums:
+                key = (build_id, facets, app_num)
+                entry = self._entries.get(key)
+                if entry is None:
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end(key)
+                self.hits += 1
+                found.append((app_num, entry[1]))
+        return {app_num: json.loads(value) for app_num, value in found}
+
+    def put_many(self, build_id: str, facets: tuple, records: Dict[str, Dict[str, Any]]):
+        """レコードを格納する（出願番号をキーとした辞書）"""
+        build_id = build_id or ''
+        now = time.time()
+        entries = [((build_id, facets, app_num), (now, json.dumps(record, ensure_ascii=False)))
+                   for app_num, record in records.items()]
+        with self._lock:
+            self._use_build(build_id)
+            for key, entry in entries:
+                self._store(key, entry)
+
+
+# プロセス全体で共有するキャッシュ（検索プールの全インスタンスが使う）
+_default_caches = {}
+_default_caches_lock = threading.Lock()
+
+
+def _default_cache(cache_class):
+    cache = _default_caches.get(cache_class)
+    if cache is None:
+        with _default_caches_lock:
+            cache = _default_caches.setdefault(cache_class, cache_class())
+    return cache
+
+
+def default_result_cache() -> ResultCache:
+    """プロセス全体で共有する検索結果キャッシュ"""
+    return _default_cache(ResultCache)
+
+
+def default_record_cache() -> RecordCache:
+    """プロセス全体で共有するレコードキャッシュ"""
+    return _default_cache(RecordCache)
+
+
+def configure_default_result_cache(**kwargs) -> ResultCache:
+    """共有の検索結果キャッシュを設定し直す（引数はResultCacheと同じ）
+
+    検索インスタンスを作成する前に呼ぶ（作成済みのインスタンスは以前のキャッシュを使い続ける）。
+    """
+    with _default_caches_lock:
+        cache = _default_caches[ResultCache] = ResultCache(**kwargs)
+    return cache
+
+
+def configure_default_record_cache(**kwargs) -> RecordCache:
+    """共有のレコードキャッシュを設定し直す（引数はRecordCacheと同じ。検索インスタンスの作成前に呼ぶ）"""
+    with _default_caches_lock:
+        cache = _default_caches[RecordCache] = RecordCache(**kwargs)
+    return cache
@@ -6,23 +6,17 @@ TMCloud コマンドラインインターフェース（Windows/Linux共通）
 import sys
 import json
 from pathlib import Path
-from tmcloud_search_integrated import TMCloudIntegratedSearch
+from tmcloud_search_integrated import TMCloudIntegratedSearch, default_db_path
 
 def main():
     """メイン関数"""
     
-    # データベースファイルを探す
-    db_files = [
-        Path("tmcloud_v2_20250818_081655.db"),
-        Path("tmcloud_v2_20250805_232509.db"),
-        Path("/home/ygenk/TMCloud/tmcloud_v2_20250805_232509.db")  # WSL環境用
-    ]
-    
+    # データベースファイルを探す（tmcloud_current.jsonが指すDB > 最新のtmcloud_v2_*.db）
     db_path = None
-    for db in db_files:
-        if db.exists():
-            db_path = db
-            break
+    try:
+        db_path = Path(default_db_path(Path(__file__).parent))
+    except FileNotFoundError:
+        pass
     
     if not db_path:
         print("エラー: データベースファイルが見つかりません")
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TMCloud DB切り替え（ブルー/グリーン）
+
+新しくビルドしたDBを事前に準備（移行・ANALYZE・FTS最適化・ページキャッシュの
+読み込み）してから、稼働中DBのマニフェスト（tmcloud_current.json）を原子的に
+書き換える。Webサーバーはマニフェストの変更を検知して新しいDBの検索プールに
+切り替え、旧DBのプールは実行中の検索が終わってから閉じる。
+
+Usage:
+    python3 tmcloud_deploy.py activate <DBファイル> [--no-warm]
+    python3 tmcloud_deploy.py status
+    ./tmcloud activate <DBファイル> [--no-warm]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from tmcloud_migrate import get_meta, migrate, read_schema_version
+from tmcloud_search_integrated import CURRENT_MANIFEST, read_current_manifest
+
+
+# マニフェストを置くディレクトリ（Webサーバーと同じ場所）
+BASE_DIR = Path(__file__).parent
+
+# 切り替え前に最適化するFTSテーブル
+FTS_TABLES = ['trademark_search_fts', 'trademark_search_trigram', 'trademark_pronunciation_trigram']
+
+# ページキャッシュ読み込みの1回あたりのサイズ
+WARM_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def prepare_database(db_path: str):
+    """切り替え前の準備（スキーマ移行・WAL化・統計情報・FTSの最適化）"""
+    conn = sqlite3.connect(db_path)
+    try:
+        migrate(conn)
+        # 読み取り専用の検索接続と週次更新を同時に動かせるようにする
+        conn.execute("PRAGMA journal_mode = WAL")
+        print("  ANALYZE...")
+        conn.execute("ANALYZE")
+        print("  FTS最適化...")
+        for fts_table in FTS_TABLES:
+            conn.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES('optimize')")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def warm_page_cache(db_path: str) -> int:
+    """DBファイルを読み通してOSのページキャッシュに載せる（切り替え直後の遅延を防ぐ）
+
+    Returns:
+        読み込んだバイト数
+    """
+    total = 0
+    with open(db_path, 'rb') as f:
+        while True:
+            chunk = f.read(WARM_CHUNK_SIZE)
+            if not chunk:
+                break
+            total += len(chunk)
+    return total
+
+
+def write_current_manifest(db_path: str, base_dir=BASE_DIR) -> dict:
+    """マニフェストを書き換える（一時ファイル + os.replaceで原子的に差し替え）"""
+    base_dir = Path(base_dir).resolve()
+    db_path = Path(db_path).resolve()
+
+    conn = sqlite3.connect(db_path.as_uri() + '?mode=ro', uri=True)
+    try:
+        build_id = get_meta(conn, 'build_id')
+        schema_version = read_schema_version(conn)
+    finally:
+        conn.close()
+
+    previous = read_current_manifest(base_dir)
+    manifest = {
+        # 同じディレクトリのDBは相対パスで記録（ディレクトリごと移動しても使える）
+        'db': os.path.relpath(db_path, base_dir) if db_path.parent == base_dir else str(db_path),
+        'build_id': build_id,
+        'schema_version': schema_version,
+        'activated_at': datetime.now().isoformat(timespec='seconds'),
+        'previous_db': previous['db'] if previous else None,
+    }
+
+    fd, tmp_path = tempfile.mkstemp(prefix='.tmcloud_current.', dir=base_dir)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, base_dir / CURRENT_MANIFEST)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return manifest
+
+
+def activate(db_path: str, base_dir=BASE_DIR, warm: bool = True) -> dict:
+    """DBを準備して稼働中DBに切り替える"""
+    if not Path(db_path).is_file():
+        raise FileNotFoundError(f"データベースファイルが見つかりません: {db_path}")
+
+    print(f"準備中: {db_path}")
+    prepare_database(db_path)
+    if warm:
+        start_time = time.time()
+        size = warm_page_cache(db_path)
+        print(f"  ページキャッシュ読み込み: {size / 1024 / 1024:.0f}MB（{time.time() - start_time:.2f}秒）")
+
+    manifest = write_current_manifest(db_path, base_dir)
+    print(f"切り替え完了: {manifest['db']} (build {manifest['build_id']})")
+    return manifest
+
+
+def main(argv: List[str] = None):
+    """CLIエントリポイント"""
+    parser = argparse.ArgumentParser(description='TMCloud 稼働中DBの切り替え')
+    parser.add_argument('command', choices=['activate', 'status'],
+                        help='activate: DBを準備して切り替え / status: 稼働中のDBを表示')
+    parser.add_argument('db', nargs='?', help='切り替え先のデータベースファイル（activate）')
+    parser.add_argument('--dir', default=str(BASE_DIR),
+                        help=f'{CURRENT_MANIFEST}を置くディレクトリ（default: スクリプトと同じ場所）')
+    parser.add_argument('--no-warm', action='store_true',
+                        help='ページキャッシュの読み込みを省略する')
+    args = parser.parse_args(argv)
+
+    if args.command == 'status':
+        manifest = read_current_manifest(args.dir)
+        if manifest is None:
+            print(f"{CURRENT_MANIFEST}がありません（最新のtmcloud_v2_*.dbを使用）")
+            return 1
+        print(json.dumps(manifest, ensure_ascii=False, indent=2))
+        return 0
+
+    if not args.db:
+        parser.error('activateにはDBファイルの指定が必要です')
+    activate(args.db, base_dir=args.dir, warm=not args.no_warm)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TMCloud 商標画像ユーティリティ
+
+trademark_images（base64分割テキスト）から、出願番号ごとに最初のページを
+結合・デコードしたJPEGを trademark_image_primary（BLOB）に格納する。
+検索側の画像取得は主キー1回の参照になる。
+
+一覧表示用のサムネイル（thumbカラム）はプロセスプールで並列生成する（要Pillow）。
+
+Usage:
+    python3 tmcloud_images.py thumbnails [--db DBファイル] [--workers N] [--force]
+    ./tmcloud thumbnails [--db DBファイル] [--workers N] [--force]
+"""
+
+import argparse
+import base64
+import binascii
+import io
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from typing import Iterable, List, Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError:  # サムネイル生成はPillowがある環境のみ
+    Image = None
+
+
+# 主画像テーブル（1商標1行、デコード済みJPEG）
+IMAGE_PRIMARY_DDL = """
+    CREATE TABLE IF NOT EXISTS trademark_image_primary (
+        app_num TEXT PRIMARY KEY,           -- 出願番号（10桁）
+        mime TEXT,                          -- MIMEタイプ（image/jpeg）
+        width INTEGER,                      -- 画像の幅（ピクセル）
+        height INTEGER,                     -- 画像の高さ（ピクセル）
+        jpeg BLOB,                          -- 最初のページの画像データ
+        thumb BLOB                          -- サムネイル（THUMB_MAX_SIZE以内のJPEG）
+    )
+"""
+
+# 圧縮方式コード → MIMEタイプ（MMR等は対象外）
+MIME_TYPES = {
+    'JP': 'image/jpeg',
+}
+
+# executemanyの1回あたりの件数
+INSERT_BATCH_SIZE = 500
+
+# サムネイルの最大辺（ピクセル）とJPEG品質
+THUMB_MAX_SIZE = 200
+THUMB_QUALITY = 80
+
+# サムネイル生成で1回に読み込み・書き込む件数
+THUMB_CHUNK_SIZE = 256
+
+# JPEGのSOFマーカー（画像サイズを含む）
+_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def jpeg_size(data: bytes) -> Tuple[Optional[int], Optional[int]]:
+    """JPEGヘッダから(幅, 高さ)を取得（取得できない場合は(None, None)）"""
+    if not data or data[:2] != b'\xff\xd8':
+        return None, None
+
+    pos = 2
+    length = len(data)
+    while pos + 4 <= length:
+        if data[pos] != 0xFF:
+            pos += 1
+            continue
+        marker = data[pos + 1]
+        # フィルバイト・パラメータを持たないマーカー
+        if marker == 0xFF or marker == 0x01 or 0xD0 <= marker <= 0xD9:
+            pos += 2 if marker != 0xFF else 1
+            continue
+        segment_length = int.from_bytes(data[pos + 2:pos + 4], 'big')
+        if marker in _SOF_MARKERS and pos + 9 <= length:
+            height = int.from_bytes(data[pos + 5:pos + 7], 'big')
+            width = int.from_bytes(data[pos + 7:pos + 9], 'big')
+            return width, height
+        pos += 2 + segment_length
+    return None, None
+
+
+def select_primary_fragments(fragments: Iterable[Tuple[str, int, str]]) -> List[str]:
+    """1商標分の(page_num, rec_seq_num, image_data)から最初のページの断片を順に返す
+
+    ページ番号が空（None）の断片は最初のページのものとして扱う。
+    同じレコード順序番号が重複する場合は最初の行を採用する。
+    """
+    fragments = [f for f in fragments if f[2]]
+    if not fragments:
+        return []
+
+    pages = [f[0] for f in fragments if f[0] is not None]
+    first_page = min(pages) if pages else None
+    by_seq = {}
+    for page_num, rec_seq_num, image_data in fragments:
+        if (page_num is None or page_num == first_page) and rec_seq_num not in by_seq:
+            by_seq[rec_seq_num] = image_data
+    return [by_seq[seq] for seq in sorted(by_seq)]
+
+
+def primary_image_record(app_num: str, fragments: Iterable[Tuple[str, int, str]],
+                         compression_format: str = 'JP') -> Optional[Tuple]:
+    """主画像テーブルの1行を作成（デコードできない場合はNone）
+
+    Returns:
+        (app_num, mime, width, height, jpeg)
+    """
+    parts = select_primary_fragments(fragments)
+    if not app_num or not parts:
+        return None
+
+    try:
+        data = base64.b64decode(''.join(parts))
+    except (binascii.Error, ValueError) as e:
+        print(f"  画像デコードエラー ({app_num}): {e}")
+        return None
+    if not data:
+        return None
+
+    width, height = jpeg_size(data)
+    return (app_num, MIME_TYPES.get(compression_format, 'application/octet-stream'), width, height, data)
+
+
+def insert_image_primary(conn: sqlite3.Connection, records: Iterable[Optional[Tuple]]) -> int:
+    """主画像をまとめて書き込む（コミットは呼び出し元で行う）"""
+    cursor = conn.cursor()
+    count = 0
+    batch = []
+    for record in records:
+        if record is None:
+            continue
+        batch.append(record)
+        if len(batch) >= INSERT_BATCH_SIZE:
+            cursor.executemany("""
+                INSERT OR REPLACE INTO trademark_image_primary (app_num, mime, width, height, jpeg)
+                VALUES (?, ?, ?, ?, ?)
+            """, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        cursor.executemany("""
+            INSERT OR REPLACE INTO trademark_image_primary (app_num, mime, width, height, jpeg)
+            VALUES (?, ?, ?, ?, ?)
+        """, batch)
+        count += len(batch)
+    return count
+
+
+def build_image_primary(conn: sqlite3.Connection, app_nums: Iterable[str] = None) -> int:
+    """trademark_imagesから主画像テーブルを構築する
+
+    Args:
+        conn: データベース接続
+        app_nums: 対象の出願番号（Noneの場合は全件）。指定した出願番号の既存行は作り直す
+
+    Returns:
+        書き込んだ件数
+    """
+    conn.execute(IMAGE_PRIMARY_DDL)
+
+    where = ""
+    if app_nums is not None:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS image_primary_targets (app_num TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM temp.image_primary_targets")
+        conn.executemany("INSERT OR IGNORE INTO temp.image_primary_targets (app_num) VALUES (?)",
+                         ((app_num,) for app_num in app_nums))
+        conn.execute("""
+            DELETE FROM trademark_image_primary
+            WHERE app_num IN (SELECT app_num FROM temp.image_primary_targets)
+        """)
+        where = "AND app_num IN (SELECT app_num FROM temp.image_primary_targets)"
+
+    # 出願番号順に読み、1商標分ずつ組み立てる（全件をメモリに載せない）
+    cursor = conn.execute(f"""
+        SELECT app_num, page_num, rec_seq_num, image_data
+        FROM trademark_images
+        WHERE app_num IS NOT NULL
+        AND compression_format = 'JP'
+        AND image_data IS NOT NULL
+        {where}
+        ORDER BY app_num, ROWID
+    """)
+    records = (
+        primary_image_record(app_num, ((row[1], row[2], row[3]) for row in rows))
+        for app_num, rows in groupby(cursor, key=lambda row: row[0])
+    )
+    count = insert_image_primary(conn, records)
+
+    if app_nums is not None:
+        conn.execute("DELETE FROM temp.image_primary_targets")
+    return count
+
+
+# ========== サムネイル ==========
+
+def make_thumbnail(data: bytes, max_size: int = THUMB_MAX_SIZE, quality: int = THUMB_QUALITY) -> Optional[bytes]:
+    """JPEGからサムネイル（最大辺max_size）を作成（作成できない場合はNone）"""
+    if Image is None or not data:
+        return None
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            # JPEGはデコード時に縮小して読む（全画素を展開しない）
+            img.draft('RGB', (max_size, max_size))
+            if img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+            img.thumbnail((max_size, max_size))
+            out = io.BytesIO()
+            img.save(out, 'JPEG', quality=quality, optimize=True)
+            return out.getvalue()
+    except Exception as e:
+        print(f"  サムネイル作成エラー: {e}")
+        return None
+
+
+def _thumbnail_job(item: Tuple[str, bytes]) -> Tuple[str, Optional[bytes]]:
+    """プロセスプール用（トップレベル関数でないとpickleできない）"""
+    app_num, data = item
+    return app_num, make_thumbnail(data)
+
+
+def build_thumbnails(conn: sqlite3.Connection, workers: int = None, app_nums: Iterable[str] = None,
+                     force: bool = False) -> int:
+    """trademark_image_primaryのサムネイルを生成する
+
+    画像のデコード・縮小はプロセスプールで並列に行い、書き込みは
+    この接続（単一ライター）でまとめて行う。
+
+    Args:
+        conn: データベース接続
+        workers: ワーカープロセス数（Noneの場合はCPU数、1の場合はプールを使わない）
+        app_nums: 対象の出願番号（Noneの場合は全件）
+        force: Trueの場合は作成済みのサムネイルも作り直す
+
+    Returns:
+        生成した件数
+    """
+    if Image is None:
+        print("警告: Pillowがインストールされていないため、サムネイル生成をスキップします")
+        return 0
+
+    if app_nums is None:
+        where = "" if force else "WHERE thumb IS NULL"
+        targets = [row[0] for row in conn.execute(f"SELECT app_num FROM trademark_image_primary {where}")]
+    else:
+        targets = list(dict.fromkeys(app_nums))
+    if not targets:
+        return 0
+
+    def chunks():
+        """対象を分割して画像を読み込む（全件をメモリに載せない）"""
+        for start in range(0, len(targets), THUMB_CHUNK_SIZE):
+            chunk = targets[start:start + THUMB_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            yield conn.execute(f"""
+                SELECT app_num, jpeg FROM trademark_image_primary
+                WHERE app_num IN ({placeholders}) AND jpeg IS NOT NULL
+            """, chunk).fetchall()
+
+    def write(results):
+        rows = [(thumb, app_num) for app_num, thumb in results if thumb is not None]
+        conn.executemany("UPDATE trademark_image_primary SET thumb = ? WHERE app_num = ?", rows)
+        conn.commit()
+        return len(rows)
+
+    count = 0
+    if workers == 1:
+        for items in chunks():
+            count += write(map(_thumbnail_job, items))
+        return count
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for items in chunks():
+            count += write(executor.map(_thumbnail_job, items, chunksize=16))
+    return count
+
+
+def main(argv: List[str] = None):
+    """CLIエントリポイント"""
+    # 循環importを避けるため遅延import
+    from tmcloud_search_integrated import default_db_path
+
+    parser = argparse.ArgumentParser(description='TMCloud 商標画像ツール')
+    parser.add_argument('command', choices=['thumbnails'], help='thumbnails: サムネイル生成')
+    parser.add_argument('--db', default=None,
+                        help='データベースファイル（省略時は最新のtmcloud_v2_*.db）')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='ワーカープロセス数（default: CPU数）')
+    parser.add_argument('--force', action='store_true',
+                        help='作成済みのサムネイルも作り直す')
+    args = parser.parse_args(argv)
+
+    db_path = args.db or default_db_path()
+    conn = sqlite3.connect(db_path)
+    try:
+        print(f"サムネイル生成: {db_path}")
+        start_time = time.time()
+        count = build_thumbnails(conn, workers=args.workers, force=args.force)
+        print(f"完了！ {count}件（{time.time() - start_time:.2f}秒）")
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,11 +1,21 @@
 #!/usr/bin/env python3
 # tmcloud_import_v2_complete.py - 設計書のマッピングに基づく完全版
 
+import argparse
+import os
+import re
 import sqlite3
+import codecs
 import csv
+from contextlib import contextmanager
 from pathlib import Path
-import chardet
 from datetime import datetime
+from itertools import islice
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from queue import Empty
+
+from tmcloud_images import insert_image_primary, primary_image_record
 
 # 設定
 DB_PATH = "tmcloud_v2.db"
@@ -29,1491 +39,1082 @@ def cleanse_data(value):
         return None
     return value
 
+# ========== エンコーディング ==========
+
+# TSVファイル群（ファイル名の接頭辞）ごとのエンコーディング。最も長く一致したものを使う
+# （特許庁の仕様書ではすべてUTF-8）
+TSV_ENCODINGS = {
+    'upd_': 'utf-8',                      # 商標・登録・審判
+    'upd_jiken_c_t': 'utf-8',             # 事件フォルダ
+    'upd_intl_t_org': 'utf-8',            # 国際商標
+    'upd_design_state_gvrnmnt': 'utf-8',  # 指定国官庁マスタ
+}
+DEFAULT_TSV_ENCODING = 'utf-8'
+
+# UTF-8として不正なバイトを含み、こちらでは正しく読める場合に使うエンコーディング
+FALLBACK_ENCODING = 'cp932'
+
+# エンコーディング判定で読む先頭のバイト数
+ENCODING_PROBE_SIZE = 64 * 1024
+
+_BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+def tsv_encoding(filename):
+    """ファイル名からファイル群の既定エンコーディングを返す"""
+    matches = [prefix for prefix in TSV_ENCODINGS if filename.startswith(prefix)]
+    if not matches:
+        return DEFAULT_TSV_ENCODING
+    return TSV_ENCODINGS[max(matches, key=len)]
+
+def _decodes(data, encoding):
+    """dataが（末尾の途中で切れた文字を除いて）エラーなく読めるか"""
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(data, final=False)
+        return True
+    except UnicodeDecodeError:
+        return False
+
 def detect_encoding(file_path):
-    """ファイルのエンコーディングを検出"""
+    """ファイルのエンコーディングを判定
+
+    BOM → ファイル群の既定値の順に決め、既定値がUTF-8で先頭が
+    UTF-8として読めない場合のみFALLBACK_ENCODINGを試す。
+    """
     with open(file_path, 'rb') as f:
-        result = chardet.detect(f.read(100000))
-    return result['encoding'] or 'utf-8'
+        head = f.read(ENCODING_PROBE_SIZE)
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
 
-# 各テーブルのインポート関数
-def import_trademark_standard_char(conn, tsv_path):
-    """1-1: 商標（標準文字）テーブル"""
-    print("Importing trademark_standard_char...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_standard_char 
-                (app_num, split_num, sub_data_num, standard_char_t, add_del_id)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['split_num']),
-                cleanse_data(row['sub_data_num']),
-                cleanse_data(row['standard_char_t']),
-                cleanse_data(row['add_del_id'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+    encoding = tsv_encoding(Path(file_path).name)
+    if codecs.lookup(encoding).name == 'utf-8' and not _decodes(head, encoding):
+        if _decodes(head, FALLBACK_ENCODING):
+            return FALLBACK_ENCODING
+    return encoding
 
-def import_trademark_display(conn, tsv_path):
-    """1-2: 商標（表示用）テーブル"""
-    print("Importing trademark_display...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_display 
-                (app_num, split_num, sub_data_num, indct_use_t, add_del_id)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['split_num']),
-                cleanse_data(row['sub_data_num']),
-                cleanse_data(row['indct_use_t']),
-                cleanse_data(row['add_del_id'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+# 読み込み中に置換した不正なバイト数（プロセス内の累計）
+_decode_errors = 0
 
-def import_trademark_search(conn, tsv_path):
-    """1-3: 商標（検索用）テーブル"""
-    print("Importing trademark_search...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_search 
-                (app_num, split_num, sub_data_num, search_seq_num, search_use_t, add_del_id)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['split_num']),
-                cleanse_data(row['sub_data_num']),
-                int(row['search_use_t_seq']) if row.get('search_use_t_seq') else 1,
-                cleanse_data(row['search_use_t']),
-                cleanse_data(row['add_del_id'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+def _replace_decode_error(error):
+    """不正なバイトをU+FFFDに置換して読み進める（件数を数える）"""
+    global _decode_errors
+    _decode_errors += error.end - error.start
+    return '\ufffd', error.end
 
-def import_trademark_pronunciation(conn, tsv_path):
-    """1-4: 称呼テーブル"""
-    print("Importing trademark_pronunciation...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_pronunciations 
-                (app_num, split_num, sub_data_num, pronunciation_seq_num, pronunciation, add_del_id)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['split_num']),
-                cleanse_data(row['sub_data_num']),
-                int(row['dsgnt_seq']) if row.get('dsgnt_seq') else 1,
-                cleanse_data(row['dsgnt']),
-                cleanse_data(row['add_del_id'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+codecs.register_error('tmcloud_replace', _replace_decode_error)
 
-def import_trademark_detailed_descriptions(conn, tsv_path):
-    """1-5: 商標の詳細な説明テーブル"""
-    print("Importing trademark_detailed_descriptions...")
+@contextmanager
+def open_tsv(tsv_path):
+    """TSVをテキストとして開く（不正なバイトは置換し、閉じるときに件数を報告）"""
     encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_detailed_descriptions 
-                (law_code, app_num, history_num, creation_date, 
-                 length_exceed_flag, detailed_description)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['yonpo_code']),
-                normalize_app_num(row['shutugan_no']),
-                int(row['dtz_rireki_no']) if row.get('dtz_rireki_no') else 1,
-                cleanse_data(row['dtz_sakusei_bi']),
-                cleanse_data(row['lengthchoka_flag']),
-                cleanse_data(row['shohyonoshousaina_setumei'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+    before = _decode_errors
+    with open(tsv_path, 'r', encoding=encoding, errors='tmcloud_replace') as f:
+        yield f
+    errors = _decode_errors - before
+    if errors:
+        print(f"  Warning: {Path(tsv_path).name}: replaced {errors} undecodable bytes ({encoding})")
 
-def import_goods_services_info(conn, tsv_path):
-    """2-1: 商品・役務情報テーブル"""
-    print("Importing trademark_goods_services...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_goods_services 
-                (law_code, app_num, class_num, goods_seq_num, 
-                 length_exceed_flag, goods_services_name)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                '4',  # law_code
-                normalize_app_num(row['shutugan_no']),
-                cleanse_data(row['rui']),
-                cleanse_data(row['abz_junjo_no']),
-                cleanse_data(row.get('lengthchoka_flag', '0')),
-                cleanse_data(row['shohinekimumeisho'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
 
-def import_trademark_goods_classes(conn, tsv_path):
-    """2-2: 商品区分記事テーブル"""
-    print("Importing trademark_goods_classes...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_goods_classes 
-                (law_code, reg_num, split_num, app_num, mu_num,
-                 goods_class_art_upd_date, class_num_registered, processing_type)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['law_cd']),
-                cleanse_data(row['reg_num']),
-                cleanse_data(row['split_num']),
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['mu_num']),
-                cleanse_data(row['goods_cls_art_upd_ymd']),
-                cleanse_data(row['desig_goods_or_desig_wrk_class']),
-                cleanse_data(row['processing_type'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+# ========== 一括インポート ==========
 
-def import_trademark_similar_group_codes(conn, tsv_path):
-    """2-3: 類似群コードテーブル"""
-    print("Importing trademark_similar_group_codes...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            # 類似群コードの変換処理（5文字ずつ分割してカンマ区切り）
-            similar_codes = row['smlr_dsgn_group_cd']
-            if similar_codes:
-                # 5文字ずつに分割
-                codes = [similar_codes[i:i+5] for i in range(0, len(similar_codes), 5)]
-                similar_codes_csv = ','.join(codes)
-            else:
-                similar_codes_csv = None
-                
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_similar_group_codes 
-                (app_num, split_num, sub_data_num, class_num,
-                 similar_group_codes, add_del_id)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['split_num']),
-                cleanse_data(row['sub_data_num']),
-                cleanse_data(row['knd']),  # knd → class_num のマッピング
-                similar_codes_csv,
-                cleanse_data(row['add_del_id'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+# executemanyの1回あたりの件数
+IMPORT_BATCH_SIZE = 5000
 
-def import_trademark_vienna_codes(conn, tsv_path):
-    """2-4: ウィーン分類テーブル"""
-    print("Importing trademark_vienna_codes...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_vienna_codes 
-                (add_del_id, app_num, split_num, sub_data_num,
-                 large_class, mid_class, small_class, complement_sub_class)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['add_del_id']),
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['split_num']),
-                cleanse_data(row['sub_data_num']),
-                cleanse_data(row['grphc_term_large_class']),
-                cleanse_data(row['grphc_term_mid_class']),
-                cleanse_data(row['grphc_term_small_class']),
-                cleanse_data(row['grphc_term_complement_sub_cls'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+def to_int(default):
+    """整数変換（空の場合はdefault）"""
+    def convert(value):
+        return int(value) if value else default
+    return convert
 
-def import_trademark_right_goods(conn, tsv_path):
-    """2-5: 本権商品名テーブル"""
-    print("Importing trademark_right_goods...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_right_goods 
-                (processing_type, law_code, reg_num, split_num, app_num,
-                 class_num_registered, rec_num, master_update_date,
-                 goods_name_length, goods_name)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['processing_type']),
-                cleanse_data(row['law_cd']),
-                cleanse_data(row['reg_num']),
-                cleanse_data(row['split_num']),
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['desig_goods_or_desig_wrk_class']),
-                cleanse_data(row['rec_num']),
-                cleanse_data(row['mstr_updt_year_month_day']),
-                cleanse_data(row['desg_gds_desg_wrk_name_len']),
-                cleanse_data(row['desg_gds_name_desg_wrk_name'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+def constant(value):
+    """TSVの値によらず固定値を格納"""
+    def convert(_):
+        return value
+    return convert
 
-def import_trademark_right_holders(conn, tsv_path):
-    """3-1: 権利者記事テーブル"""
-    print("Importing trademark_right_holders...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_right_holders 
-                (processing_type, law_code, reg_num, split_num, app_num,
-                 rec_num, pe_num, right_person_update_date, right_person_id,
-                 right_person_addr_len, right_person_addr,
-                 right_person_name_len, right_person_name)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['processing_type']),
-                cleanse_data(row['law_cd']),
-                cleanse_data(row['reg_num']),
-                cleanse_data(row['split_num']),
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['rec_num']),
-                cleanse_data(row['pe_num']),
-                cleanse_data(row['right_psn_art_upd_ymd']),
-                cleanse_data(row['right_person_appl_id']),
-                cleanse_data(row['right_person_addr_len']),
-                cleanse_data(row['right_person_addr']),
-                cleanse_data(row['right_person_name_len']),
-                cleanse_data(row['right_person_name'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+def split_similar_group_codes(value):
+    """類似群コードの変換（5文字ずつ分割してカンマ区切り）"""
+    if not value:
+        return None
+    return ','.join(value[i:i+5] for i in range(0, len(value), 5))
 
-def import_trademark_applicants_agents(conn, tsv_path):
-    """3-2: 出願人・代理人情報テーブル"""
-    print("Importing trademark_applicants_agents...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_applicants_agents 
-                (law_code, app_num, applicant_agent_type, applicant_agent_code,
-                 change_num, individual_corp_type, country_prefecture_code,
-                 representative_flag, num_above_applicants, num_other_agents,
-                 applicant_agent_profession_type, applicant_agent_qualification_type,
-                 applicant_agent_address, applicant_agent_name, applicant_agent_seq_num)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['yonpo_code']),
-                normalize_app_num(row['shutugan_no']),
-                cleanse_data(row['shutugannindairinin_sikbt']),
-                cleanse_data(row['shutugannindairinin_code']),
-                cleanse_data(row.get('gez_henko_no')),
-                cleanse_data(row.get('gez_kohokan_kubun')),
-                cleanse_data(row.get('gez_kokken_code')),
-                cleanse_data(row.get('daihyoshutugannin_sikibetu')),
-                cleanse_data(row.get('jokishutugannin_nanmei')),
-                cleanse_data(row.get('dairininhoka_nanmei')),
-                cleanse_data(row.get('dairinin_shubetu')),
-                cleanse_data(row.get('dairininsikaku_shubetu')),
-                cleanse_data(row.get('shutugannindairinin_jusho')),
-                cleanse_data(row.get('shutugannindairinin_simei')),
-                cleanse_data(row['gez_junjo_no'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+# テーブルごとのTSVカラムマッピング
+#   'title':   仕様書の項番・テーブル名
+#   'filter':  (TSVカラム, 値) - 値が一致する行のみ取り込む
+#   'columns': [(DBカラム, TSVカラム, 変換関数[, TSVにカラムが無い場合の値]), ...]
+#              変換関数がNoneの場合はTSVの値をそのまま格納する
+TABLE_SPECS = {
+    'trademark_standard_char': {
+        'title': '1-1: 商標（標準文字）テーブル',
+        'columns': [
+            ('app_num', 'app_num', normalize_app_num),
+            ('split_num', 'split_num', cleanse_data),
+            ('sub_data_num', 'sub_data_num', cleanse_data),
+            ('standard_char_t', 'standard_char_t', cleanse_data),
+            ('add_del_id', 'add_del_id', cleanse_data),
+        ],
+    },
+    'trademark_display': {
+        'title': '1-2: 商標（表示用）テーブル',
+        'columns': [
+            ('app_num', 'app_num', normalize_app_num),
+            ('split_num', 'split_num', cleanse_data),
+            ('sub_data_num', 'sub_data_num', cleanse_data),
+            ('indct_use_t', 'indct_use_t', cleanse_data),
+            ('add_del_id', 'add_del_id', cleanse_data),
+        ],
+    },
+    'trademark_search': {
+        'title': '1-3: 商標（検索用）テーブル',
+        'columns': [
+            ('app_num', 'app_num', normalize_app_num),
+            ('split_num', 'split_num', cleanse_data),
+            ('sub_data_num', 'sub_data_num', cleanse_data),
+            ('search_seq_num', 'search_use_t_seq', to_int(1)),
+            ('search_use_t', 'search_use_t', cleanse_data),
+            ('add_del_id', 'add_del_id', cleanse_data),
+        ],
+    },
+    'trademark_pronunciations': {
+        'title': '1-4: 称呼テーブル',
+        'columns': [
+            ('app_num', 'app_num', normalize_app_num),
+            ('split_num', 'split_num', cleanse_data),
+            ('sub_data_num', 'sub_data_num', cleanse_data),
+            ('pronunciation_seq_num', 'dsgnt_seq', to_int(1)),
+            ('pronunciation', 'dsgnt', cleanse_data),
+            ('add_del_id', 'add_del_id', cleanse_data),
+        ],
+    },
+    'trademark_detailed_descriptions': {
+        'title': '1-5: 商標の詳細な説明テーブル',
+        'columns': [
+            ('law_code', 'yonpo_code', cleanse_data),
+            ('app_num', 'shutugan_no', normalize_app_num),
+            ('history_num', 'dtz_rireki_no', to_int(1)),
+            ('creation_date', 'dtz_sakusei_bi', cleanse_data),
+            ('length_exceed_flag', 'lengthchoka_flag', cleanse_data),
+            ('detailed_description', 'shohyonoshousaina_setumei', cleanse_data),
+        ],
+    },
+    'trademark_goods_services': {
+        'title': '2-1: 商品・役務情報テーブル',
+        'columns': [
+            ('law_code', None, constant('4')),  # 商標（四法コード4）固定
+            ('app_num', 'shutugan_no', normalize_app_num),
+            ('class_num', 'rui', cleanse_data),
+            ('goods_seq_num', 'abz_junjo_no', cleanse_data),
+            ('length_exceed_flag', 'lengthchoka_flag', cleanse_data, '0'),
+            ('goods_services_name', 'shohinekimumeisho', cleanse_data),
+        ],
+    },
+    'trademark_goods_classes': {
+        'title': '2-2: 商品区分記事テーブル',
+        'columns': [
+            ('law_code', 'law_cd', cleanse_data),
+            ('reg_num', 'reg_num', cleanse_data),
+            ('split_num', 'split_num', cleanse_data),
+            ('app_num', 'app_num', normalize_app_num),
+            ('mu_num', 'mu_num', cleanse_data),
+            ('goods_class_art_upd_date', 'goods_cls_art_upd_ymd', cleanse_data),
+            ('class_num_registered', 'desig_goods_or_desig_wrk_class', cleanse_data),
+            ('processing_type', 'processing_type', cleanse_data),
+        ],
+    },
+    'trademark_similar_group_codes': {
+        'title': '2-3: 類似群コードテーブル',
+        'columns': [
+            ('app_num', 'app_num', normalize_app_num),
+            ('split_num', 'split_num', cleanse_data),
+            ('sub_data_num', 'sub_data_num', cleanse_data),
+            ('class_num', 'knd', cleanse_data),  # knd → class_num のマッピング
+            ('similar_group_codes', 'smlr_dsgn_group_cd', split_similar_group_codes),  # 5文字ずつカンマ区切り
+            ('add_del_id', 'add_del_id', cleanse_data),
+        ],
+    },
+    'trademark_vienna_codes': {
+        'title': '2-4: ウィーン分類テーブル',
+        'columns': [
+            ('add_del_id', 'add_del_id', cleanse_data),
+            ('app_num', 'app_num', normalize_app_num),
+            ('split_num', 'split_num', cleanse_data),
+            ('sub_data_num', 'sub_data_num', cleanse_data),
+            ('large_class', 'grphc_term_large_class', cleanse_data),
+            ('mid_class', 'grphc_term_mid_class', cleanse_data),
+            ('small_class', 'grphc_term_small_class', cleanse_data),
+            ('complement_sub_class', 'grphc_term_complement_sub_cls', cleanse_data),
+        ],
+    },
+    'trademark_right_goods': {
+        'title': '2-5: 本権商品名テーブル',
+        'columns': [
+            ('processing_type', 'processing_type', cleanse_data),
+            ('law_code', 'law_cd', cleanse_data),
+            ('reg_num', 'reg_num', cleanse_data),
+            ('split_num', 'split_num', cleanse_data),
+            ('app_num', 'app_num', normalize_app_num),
+            ('class_num_registered', 'desig_goods_or_desig_wrk_class', cleanse_data),
+            ('rec_num', 'rec_num', cleanse_data),
+            ('master_update_date', 'mstr_updt_year_month_day', cleanse_data),
+            ('goods_name_length', 'desg_gds_desg_wrk_name_len', cleanse_data),
+            ('goods_name', 'desg_gds_name_desg_wrk_name', cleanse_data),
+        ],
+    },
+    'trademark_right_holders': {
+        'title': '3-1: 権利者記事テーブル',
+        'columns': [
+            ('processing_type', 'processing_type', cleanse_data),
+            ('law_code', 'law_cd', cleanse_data),
+            ('reg_num', 'reg_num', cleanse_data),
+            ('split_num', 'split_num', cleanse_data),
+            ('app_num', 'app_num', normalize_app_num),
+            ('rec_num', 'rec_num', cleanse_data),
+            ('pe_num', 'pe_num', cleanse_data),
+            ('right_person_update_date', 'right_psn_art_upd_ymd', cleanse_data),
+            ('right_person_id', 'right_person_appl_id', cleanse_data),
+            ('right_person_addr_len', 'right_person_addr_len', cleanse_data),
+            ('right_person_addr', 'right_person_addr', cleanse_data),
+            ('right_person_name_len', 'right_person_name_len', cleanse_data),
+            ('right_person_name', 'right_person_name', cleanse_data),
+        ],
+    },
+    'trademark_applicants_agents': {
+        'title': '3-2: 出願人・代理人情報テーブル',
+        'columns': [
+            ('law_code', 'yonpo_code', cleanse_data),
+            ('app_num', 'shutugan_no', normalize_app_num),
+            ('applicant_agent_type', 'shutugannindairinin_sikbt', cleanse_data),
+            ('applicant_agent_code', 'shutugannindairinin_code', cleanse_data),
+            ('change_num', 'gez_henko_no', cleanse_data),
+            ('individual_corp_type', 'gez_kohokan_kubun', cleanse_data),
+            ('country_prefecture_code', 'gez_kokken_code', cleanse_data),
+            ('representative_flag', 'daihyoshutugannin_sikibetu', cleanse_data),
+            ('num_above_applicants', 'jokishutugannin_nanmei', cleanse_data),
+            ('num_other_agents', 'dairininhoka_nanmei', cleanse_data),
+            ('applicant_agent_profession_type', 'dairinin_shubetu', cleanse_data),
+            ('applicant_agent_qualification_type', 'dairininsikaku_shubetu', cleanse_data),
+            ('applicant_agent_address', 'shutugannindairinin_jusho', cleanse_data),
+            ('applicant_agent_name', 'shutugannindairinin_simei', cleanse_data),
+            ('applicant_agent_seq_num', 'gez_junjo_no', cleanse_data),
+        ],
+    },
+    'trademark_attorney_articles': {
+        'title': '3-3: 代理人記事テーブル',
+        'columns': [
+            ('processing_type', 'processing_type', cleanse_data),
+            ('law_code', 'law_cd', cleanse_data),
+            ('reg_num', 'reg_num', cleanse_data),
+            ('split_num', 'split_num', cleanse_data),
+            ('app_num', 'app_num', normalize_app_num),
+            ('rec_num', 'rec_num', cleanse_data),
+            ('attorney_seq_num', 'pe_num', cleanse_data),
+            ('attorney_update_date', 'atty_art_upd_ymd', cleanse_data),
+            ('attorney_appl_id', 'atty_appl_id', cleanse_data),
+            ('attorney_type', 'atty_typ', cleanse_data),
+            ('attorney_name_length', 'atty_name_len', cleanse_data),
+            ('attorney_name', 'atty_name', cleanse_data),
+        ],
+    },
+    'trademark_case_info': {
+        'title': '4-1: 事件情報テーブル - 特許庁仕様書042_事件フォルダ_商標ファイル.csv準拠',
+        'columns': [
+            ('master_update_datetime', 'masterkosin_nitiji', cleanse_data),  # 1. マスタ更新日時
+            ('law_code', 'yonpo_code', cleanse_data, '4'),  # 2. 四法コード
+            ('app_num', 'shutugan_no', normalize_app_num),  # 3. 出願番号
+            ('app_date', 'shutugan_bi', cleanse_data),  # 4. 出願日
+            ('app_type1', 'shutugan_shubetu1', cleanse_data),  # 5. 出願種別1
+            ('app_type2', 'shutugan_shubetu2', cleanse_data),  # 6. 出願種別2
+            ('app_type3', 'shutugan_shubetu3', cleanse_data),  # 7. 出願種別3
+            ('app_type4', 'shutugan_shubetu4', cleanse_data),  # 8. 出願種別4
+            ('app_type5', 'shutugan_shubetu5', cleanse_data),  # 9. 出願種別5
+            ('reference_num', 'seiri_no', cleanse_data),  # 10. 整理番号
+            ('final_disposition_type', 'saishushobun_shubetu', cleanse_data),  # 11. 最終処分種別
+            ('final_disposition_date', 'saishushobun_bi', cleanse_data),  # 12. 最終処分日
+            ('reg_article_reg_num', 'raz_toroku_no', cleanse_data),  # 13. 登録記事登録番号
+            ('reg_article_split_num', 'raz_bunkatu_no', cleanse_data),  # 14. 登録記事分割番号
+            ('defensive_num', 'bogo_no', cleanse_data),  # 15. 防護番号
+            ('reg_date', 'toroku_bi', cleanse_data),  # 16. 登録日
+            ('reg_article_total_num', 'raz_sotugo_su', cleanse_data),  # 17. 登録記事総通号数
+            ('reg_article_annual_num', 'raz_nenkantugo_su', cleanse_data),  # 18. 登録記事年間通号数
+            ('reg_article_gazette_date', 'raz_kohohakko_bi', cleanse_data),  # 19. 登録記事公報発行日
+            ('examiner_code', 'tantokan_code', cleanse_data),  # 20. 担当官コード
+            ('pub_article_gazette_date', 'pcz_kokaikohohakko_bi', cleanse_data),  # 21. 公開公報記事公開公報発行日
+            ('class_count', 'kubun_su', cleanse_data),  # 22. 区分数
+            ('reg_decision_class_count', 'torokusateijikubun_su', cleanse_data),  # 23. 登録査定時区分数
+            ('standard_char_exist', 'hyojunmoji_umu', cleanse_data),  # 24. 標準文字有無
+            ('special_mark_exist', 'rittaishohyo_umu', cleanse_data),  # 25. 特殊商標識別
+            ('color_exist', 'hyoshosikisai_umu', cleanse_data),  # 26. 標章色彩有無
+            ('article3_2_flag', 'shohyoho3jo2ko_flag', cleanse_data),  # 27. 商標法3条2項フラグ
+            ('article5_4_flag', 'shohyoho5jo4ko_flag', cleanse_data),  # 28. 色彩の但し書フラグ
+            ('orig_app_type', 'genshutugan_shubetu', cleanse_data),  # 29. 原出願種別
+            ('orig_app_law_code', 'genshutuganyonpo_code', cleanse_data),  # 30. 原出願四法コード
+            ('orig_app_num', 'genshutugan_no', cleanse_data),  # 31. 原出願番号
+            ('retroactive_date', 'sokyu_bi', cleanse_data),  # 32. 遡及日
+            ('defensive_orig_app_num', 'obz_shutugan_no', cleanse_data),  # 33. 防護原登録記事出願番号
+            ('defensive_orig_reg_num', 'obz_toroku_no', cleanse_data),  # 34. 防護原登録記事登録番号
+            ('defensive_orig_split_num', 'obz_bunkatu_no', cleanse_data),  # 35. 防護原登録記事分割番号
+            ('renewal_reg_num', 'kosintoroku_no', cleanse_data),  # 36. 更新登録番号
+            ('renewal_split_num', 'pez_bunkatu_no', cleanse_data),  # 37. 更新登録記事分割番号
+            ('renewal_defensive_num', 'pez_bogo_no', cleanse_data),  # 38. 更新登録記事防護番号
+            ('rewrite_reg_num', 'kakikaetoroku_no', cleanse_data),  # 39. 書換登録番号
+            ('rewrite_split_num', 'ktz_bunkatu_no', cleanse_data),  # 40. 書換登録記事分割番号
+            ('rewrite_defensive_num', 'ktz_bogo_no', cleanse_data),  # 41. 書換登録記事防護番号
+            ('public_order_violation_flag', 'krz_kojoryozokuihan_flag', cleanse_data),  # 42. 公序良俗違反フラグ
+            ('accelerated_exam_mark', 'sokisinsa_mark', cleanse_data),  # 43. 早期審査マーク
+            ('applicable_law_class', 'tekiyohoki_kubun', cleanse_data),  # 44. 適用法規区分
+            ('exam_type', 'sinsa_shubetu', cleanse_data),  # 45. 審査種別
+            ('litigation_code', 'sosho_code', cleanse_data),  # 46. 訴訟コード
+            ('decision_type', 'satei_shubetu', cleanse_data),  # 47. 査定種別
+            ('opposition_count', 'igiken_su', cleanse_data),  # 48. 異議件数
+            ('opposition_valid_count', 'igiyuko_su', cleanse_data),  # 49. 異議有効数
+        ],
+    },
+    'trademark_basic_items': {
+        'title': '4-2: 商標基本項目記事テーブル',
+        'columns': [
+            ('add_del_id', 'add_del_id', cleanse_data),
+            ('mgt_num', 'mgt_num', cleanse_data),
+            ('rec_status_id', 'rec_status_id', cleanse_data),
+            ('app_num', 'app_num', normalize_app_num),
+            ('reg_num', 'reg_num', cleanse_data),
+            ('split_num', 'split_num', cleanse_data),
+            ('defensive_num', 'sec_num', cleanse_data, '000'),
+            ('app_typ_sec', 'app_typ_sec', cleanse_data),
+            ('app_typ_split', 'app_typ_split', cleanse_data),
+            ('app_typ_complement_rjct', 'app_typ_complement_rjct', cleanse_data),
+            ('app_typ_chan', 'app_typ_chan', cleanse_data),
+            ('app_typ_priorty', 'app_typ_priorty', cleanse_data),
+            ('app_typ_group', 'app_typ_group', cleanse_data),
+            ('app_typ_area_group', 'app_typ_area_group', cleanse_data),
+            ('app_date', 'app_dt', cleanse_data),
+            ('prior_app_right_occr_date', 'prior_app_right_occr_dt', cleanse_data),
+            ('rjct_finl_dcsn_dsptch_date', 'rjct_finl_dcsn_dsptch_dt', cleanse_data),
+            ('final_disposition_code', 'final_dspst_cd', cleanse_data),
+            ('final_disposition_date', 'final_dspst_dt', cleanse_data),
+            ('rewrite_app_num', 'rwrt_app_num', cleanse_data),
+            ('old_law', 'old_law', cleanse_data),
+            ('ver_num', 'ver_num', cleanse_data),
+            ('intl_reg_num', 'intl_reg_num', cleanse_data),
+            ('intl_reg_split_num', 'intl_reg_split_num', cleanse_data),
+            ('intl_reg_date', 'intl_reg_dt', cleanse_data),
+            ('rec_latest_updt_date', 'rec_latest_updt_dt', cleanse_data),
+            ('conti_prd_expire_date', 'conti_prd_expire_dt', cleanse_data),
+            ('instllmnt_expr_date_aft_des_date', 'instllmnt_expr_dt_aft_des_dt', cleanse_data),
+            ('installments_id', 'installments_id', cleanse_data),
+            ('set_reg_date', 'set_reg_dt', cleanse_data),
+        ],
+    },
+    'trademark_first_display': {
+        'title': '4-3: 商標第一表示部テーブル',
+        'columns': [
+            ('processing_type', 'processing_type', cleanse_data),
+            ('law_code', 'law_cd', cleanse_data),
+            ('reg_num', 'reg_num', cleanse_data),
+            ('split_num', 'split_num', cleanse_data),
+            ('history_num', 'history_num', cleanse_data),
+            ('master_update_date', 'mstr_updt_year_month_day', cleanse_data),
+            ('cancel_disposal_flag', 'cancel_and_disposal_id', cleanse_data),
+            ('intl_reg_num', 'intl_reg_num', cleanse_data),
+            ('intl_reg_date', 'intl_reg_year_month_day', cleanse_data),
+            ('after_designation_date', 'aft_desig_year_month_day', cleanse_data),
+        ],
+    },
+    'trademark_management_info': {
+        'title': '5-1: 管理情報テーブル',
+        'columns': [
+            ('processing_type', 'processing_type', cleanse_data),
+            ('law_code', 'law_cd', cleanse_data),
+            ('reg_num', 'reg_num', cleanse_data),
+            ('split_num', 'split_num', cleanse_data),
+            ('master_update_date', 'mstr_updt_year_month_day', cleanse_data),
+            ('tscript_inspct_prhbt_flg', 'tscript_inspct_prhbt_flg', cleanse_data),
+            ('conti_prd_expire_date', 'conti_prd_expire_ymd', cleanse_data),
+            ('next_pen_payment_limit_date', 'next_pen_pymnt_tm_lmt_ymd', cleanse_data),
+            ('last_pymnt_yearly', 'last_pymnt_yearly', cleanse_data),
+            ('share_rate', 'share_rate', cleanse_data),
+            ('pblc_prvt_trnsfr_reg_date', 'pblc_prvt_trnsfr_reg_ymd', cleanse_data),
+            ('right_ersr_id', 'right_ersr_id', cleanse_data),
+            ('right_disppr_date', 'right_disppr_year_month_day', cleanse_data),
+            ('close_orgnl_reg_trnsfr_rec_flg', 'close_orgnl_reg_trnsfr_rec_flg', cleanse_data),
+            ('close_reg_date', 'close_reg_year_month_day', cleanse_data),
+            ('gvrnmnt_relation_id_flg', 'gvrnmnt_relation_id_flg', cleanse_data),
+            ('pen_suppl_flg', 'pen_suppl_flg', cleanse_data),
+            ('apply_law', 'apply_law', cleanse_data),
+            ('group_t_flg', 'group_t_flg', cleanse_data),
+            ('special_mark_exist', 'special_t_id', cleanse_data),
+            ('standard_char_exist', 'standard_char_t_flg', cleanse_data),
+            ('area_group_t_flg', 'area_group_t_flg', cleanse_data),
+            ('trust_reg_flg', 'trust_reg_flg', cleanse_data),
+            ('app_num', 'app_num', normalize_app_num),
+            ('recvry_num', 'recvry_num', cleanse_data),
+            ('app_date', 'app_year_month_day', cleanse_data),
+            ('app_exam_pub_num', 'app_exam_pub_num', cleanse_data),
+            ('app_exam_pub_date', 'app_exam_pub_year_month_day', cleanse_data),
+            ('final_decision_date', 'finl_dcsn_year_month_day', cleanse_data),
+            ('trial_decision_date', 'trial_dcsn_year_month_day', cleanse_data),
+            ('set_reg_date', 'set_reg_year_month_day', cleanse_data),
+            ('t_rewrite_app_num', 't_rwrt_app_num', cleanse_data),
+            ('t_rewrite_app_date', 't_rwrt_app_year_month_day', cleanse_data),
+            ('t_rewrite_final_decision_date', 't_rwrt_finl_dcsn_ymd', cleanse_data),
+            ('t_rewrite_trial_decision_date', 't_rwrt_trial_dcsn_ymd', cleanse_data),
+            ('t_rewrite_reg_date', 't_rwrt_reg_year_month_day', cleanse_data),
+            ('invent_title_etc_len', 'invent_title_etc_len', cleanse_data),
+            ('pri_cntry_name_cd', 'pri_cntry_name_cd', cleanse_data),
+            ('pri_claim_date', 'pri_clim_year_month_day', cleanse_data),
+            ('pri_clim_cnt', 'pri_clim_cnt', cleanse_data),
+        ],
+    },
+    'trademark_updates': {
+        'title': '5-2: 商標更新記事テーブル',
+        'columns': [
+            ('processing_type', 'processing_type', cleanse_data),
+            ('law_code', 'law_cd', cleanse_data),
+            ('reg_num', 'reg_num', cleanse_data),
+            ('split_num', 'split_num', cleanse_data),
+            ('app_num', 'app_num', normalize_app_num),
+            ('pe_num', 'pe_num', cleanse_data),
+            ('t_updt_art_update_date', 't_updt_art_upd_ymd', cleanse_data),
+            ('t_updt_app_num', 't_updt_app_num', cleanse_data),
+            ('t_updt_temp_reg_flg', 't_updt_temp_reg_flg', cleanse_data),
+            ('t_updt_title_chan_flg', 't_updt_title_chan_flg', cleanse_data),
+            ('t_updt_recovery_num', 't_updt_recovery_num', cleanse_data),
+            ('t_updt_app_date', 't_updt_app_ymd_app_ymd', cleanse_data),
+            ('t_updt_final_decision_date', 't_updt_finl_dcsn_ymd', cleanse_data),
+            ('t_updt_trial_decision_date', 't_updt_trial_dcsn_ymd', cleanse_data),
+            ('t_updt_reg_date', 't_updt_reg_year_month_day', cleanse_data),
+            ('mu_num', 'mu_num', cleanse_data),
+        ],
+    },
+    'trademark_progress_info': {
+        'title': '5-3: 経過情報部テーブル',
+        'columns': [
+            ('processing_type', 'processing_type', cleanse_data),
+            ('law_code', 'law_cd', cleanse_data),
+            ('reg_num', 'reg_num', cleanse_data),
+            ('split_num', 'split_num', cleanse_data),
+            ('app_num', 'app_num', normalize_app_num),
+            ('rec_num', 'rec_num', cleanse_data),
+            ('pe_num', 'pe_num', cleanse_data),
+            ('progress_update_date', 'prog_info_upd_ymd', cleanse_data),
+            ('reg_intermediate_code', 'reg_intrmd_cd', cleanse_data),
+            ('correspondence_mark', 'crrspnd_mk', cleanse_data),
+            ('process_date', 'rcpt_pymnt_dsptch_ymd', cleanse_data),
+            ('progress_app_num', 'prog_info_div_app_num', cleanse_data),
+            ('receipt_num', 'rcpt_num_common_use', cleanse_data),
+        ],
+    },
+    'trademark_rewrite_applications': {
+        'title': '5-4: 書換申請番号テーブル',
+        'columns': [
+            ('processing_type', 'processing_type', cleanse_data),
+            ('law_code', 'law_cd', cleanse_data),
+            ('reg_num', 'reg_num', cleanse_data),
+            ('split_num', 'split_num', cleanse_data),
+            ('app_num', 'app_num', normalize_app_num),
+            ('mrgn_info_update_date', 'mrgn_info_upd_ymd', cleanse_data),
+            ('mu_num', 'mu_num', cleanse_data),
+            ('rewrite_app_num', 'mrgn_t_rwrt_app_num', cleanse_data),
+        ],
+    },
+    'trademark_transfer_receipts': {
+        'title': '5-5: 移転受付情報テーブル',
+        'columns': [
+            ('processing_type', 'processing_type', cleanse_data),
+            ('law_code', 'law_cd', cleanse_data),
+            ('reg_num', 'reg_num', cleanse_data),
+            ('split_num', 'split_num', cleanse_data),
+            ('app_num', 'app_num', normalize_app_num),
+            ('mrgn_info_update_date', 'mrgn_info_upd_ymd', cleanse_data),
+            ('mu_num', 'mu_num', cleanse_data),
+            ('transfer_receipt_info', 'trnsfr_rcpt_info', cleanse_data),
+        ],
+    },
+    'trademark_appeal_cases': {
+        'title': '6-1: 審判事件テーブル',
+        'filter': ('ynpu_kbn', '4'),
+        'columns': [
+            ('delete_flag', 'skbt_flg', cleanse_data),
+            ('appeal_num', 'snpn_bngu', cleanse_data),
+            ('app_num', 'sytgn_bngu', normalize_app_num),
+            ('law_division', 'ynpu_kbn', cleanse_data),
+            ('reg_num', 'turk_bngu', cleanse_data),
+            ('split_num', 'bnkt_bngu', cleanse_data),
+            ('similar_num', 'riz_bngu', cleanse_data),
+            ('defensive_num', 'bug_bngu', cleanse_data),
+            ('appeal_level_type', 'snkyu_sybt', cleanse_data),
+            ('appeal_type', 'snpn_sybt', cleanse_data),
+            ('appeal_request_date', 'snpn_sikyu_dt', cleanse_data),
+            ('app_num_division', 'sytgn_bngu_kbn', cleanse_data),
+            ('appeal_final_disposition_code', 'snpn_zkn_sisyu_sybn_cd', cleanse_data),
+            ('final_disposition_confirm_date', 'sisyu_sybn_kkti_dt', cleanse_data),
+            ('update_datetime', 'kusn_ntz_bat', cleanse_data),
+        ],
+    },
+    'trademark_decision_classifications': {
+        'title': '6-2: 審決分類テーブル',
+        'columns': [
+            ('delete_flag', 'skbt_flg', cleanse_data),
+            ('appeal_num', 'snpn_bngu', cleanse_data),
+            ('decision_num', 'snkt_bngu', cleanse_data),
+            ('repeat_num', 'krkes_bngu', cleanse_data),
+            ('law_division', 'ynpu_kbn', cleanse_data),
+            ('applied_law_identification', 'tkyu_huk_skbt', cleanse_data),
+            ('appeal_level_type', 'snkyu_sybt', cleanse_data),
+            ('appeal_type', 'snpn_sybt', cleanse_data),
+            ('judgment_item_code', 'hnz_zku_cd', cleanse_data),
+            ('decision_classification_conclusion_code', 'snkt_bnri_ktrn_cd', cleanse_data),
+            ('auxiliary_classification_identification', 'hj_bnri_skbt', cleanse_data),
+            ('update_datetime', 'kusn_ntz_bat', cleanse_data),
+        ],
+    },
+    'trademark_oppositions': {
+        'title': '6-3: 異議申立テーブル',
+        'columns': [
+            ('delete_flag', 'skbt_flg', cleanse_data),
+            ('appeal_num', 'snpn_bngu', cleanse_data),
+            ('opposition_num', 'mustt_bngu', cleanse_data),
+            ('opposition_app_date', 'ig_mustt_dt', cleanse_data),
+            ('opposition_final_disposition_code', 'ig_mustt_sisyu_sybn_cd', cleanse_data),
+            ('final_disposition_confirm_date', 'sisyu_sybn_kkti_dt', cleanse_data),
+            ('update_datetime', 'kusn_ntz_bat', cleanse_data),
+        ],
+    },
+    'trademark_opposition_decisions': {
+        'title': '6-4: 異議決定テーブル',
+        'columns': [
+            ('delete_flag', 'skbt_flg', cleanse_data),
+            ('appeal_num', 'snpn_bngu', cleanse_data),
+            ('opposition_num', 'mustt_bngu', cleanse_data),
+            ('decision_num', 'ig_ktti_bngu', cleanse_data),
+            ('dispatch_doc_num', 'hssu_syri_bngu', cleanse_data),
+            ('decision_confirmation_status', 'ig_ktti_kkti_stat', cleanse_data),
+            ('update_datetime', 'kusn_ntz_bat', cleanse_data),
+        ],
+    },
+    'trademark_draft_records': {
+        'title': '7-1: 起案中間記録テーブル',
+        'filter': ('yonpo_code', '4'),
+        'columns': [
+            ('law_code', 'yonpo_code', cleanse_data),
+            ('app_num', 'shutugan_no', normalize_app_num),
+            ('folder_creation_seq_num', 'folderbetusakusejnj_no', to_int(0)),
+            ('creation_date', 'sakusei_bi', cleanse_data),
+            ('intermediate_doc_code', 'chukanshorui_code', cleanse_data),
+            ('response_mark', 'taio_mark', cleanse_data),
+            ('draft_date', 'kian_bi', cleanse_data),
+            ('dispatch_date', 'hasso_bi', cleanse_data),
+            ('objection_num', 'aaz_igi_no', cleanse_data),
+            ('document_num', 'shorui_no', cleanse_data),
+            ('rejection_reason_code', 'kyozeturiyujobun_code', cleanse_data),
+            ('corresponding_doc_num', 'taioshorui_no', cleanse_data),
+            ('document_type', 'shorui_shubetu', cleanse_data),
+            ('version_num', 'version_no', cleanse_data),
+        ],
+    },
+    'trademark_application_records': {
+        'title': '7-2: 申請中間記録テーブル',
+        'filter': ('yonpo_code', '4'),
+        'columns': [
+            ('law_code', 'yonpo_code', cleanse_data),
+            ('app_num', 'shutugan_no', normalize_app_num),
+            ('folder_creation_seq_num', 'folderbetusakusejnj_no', to_int(0)),
+            ('creation_date', 'sakusei_bi', cleanse_data),
+            ('intermediate_doc_code', 'chukanshorui_code', cleanse_data),
+            ('correspondence_mark', 'taio_mark', cleanse_data),
+            ('dispatch_date', 'sasidasi_bi', cleanse_data),
+            ('receipt_date', 'uketuke_bi', cleanse_data),
+            ('opposition_num', 'aaz_igi_no', cleanse_data),
+            ('doc_num', 'shorui_no', cleanse_data),
+            ('procedure_complete_mark', 'hosikikan_mark', cleanse_data),
+            ('order_complete_flag', 'sireikan_flag', cleanse_data),
+            ('corresponding_doc_num', 'taioshorui_no', cleanse_data),
+            ('doc_type', 'shorui_shubetu', cleanse_data),
+            ('version_num', 'version_no', cleanse_data),
+            ('viewing_restriction_flag', 'eturankinsi_flag', cleanse_data),
+        ],
+    },
+    'trademark_priority_claims': {
+        'title': '8-1: 優先権情報テーブル',
+        'filter': ('yonpo_code', '4'),
+        'columns': [
+            ('law_code', 'yonpo_code', cleanse_data),
+            ('app_num', 'shutugan_no', normalize_app_num),
+            ('priority_seq_num', 'bmz_junjo_no', to_int(1)),
+            ('priority_country_code', 'yusenkenkuni_code', cleanse_data),
+            ('priority_app_num', 'yusenkenshutugan_no', cleanse_data),
+            ('priority_date', 'yusenkenshucho_bi', cleanse_data),
+        ],
+    },
+    'trademark_gazette_publications': {
+        'title': '8-2: 公報発行情報テーブル',
+        'filter': ('yonpo_code', '4'),
+        'columns': [
+            ('law_code', 'yonpo_code', cleanse_data),
+            ('app_num', 'shutugan_no', normalize_app_num),
+            ('gazette_seq_num', 'jaz_junjo_no', to_int(1)),
+            ('total_serial_num', 'jaz_sotugo_su', cleanse_data),
+            ('annual_serial_num', 'jaz_nenkantugo_su', cleanse_data),
+            ('dept_serial_num', 'jaz_bumonbetutugo_su', cleanse_data),
+            ('dept_annual_serial_num', 'jaz_bumonbetunenkantugo_su', cleanse_data),
+            ('gazette_publication_date', 'jaz_kohohakko_bi', cleanse_data),
+            ('correction_type', 'jaz_seigo_sikibetu', cleanse_data),
+            ('gazette_type', 'jaz_koho_sikibetu', cleanse_data),
+        ],
+    },
+    'applicant_registration_info': {
+        'title': '9-1: 申請人登録情報テーブル',
+        'columns': [
+            ('data_id_code', 'data_id_cd', cleanse_data),
+            ('applicant_code', 'appl_cd', cleanse_data),
+            ('applicant_name', 'appl_name', cleanse_data),
+            ('applicant_kana_name', 'appl_cana_name', cleanse_data),
+            ('applicant_postal_code', 'appl_postcode', cleanse_data),
+            ('applicant_address', 'appl_addr', cleanse_data),
+            ('roman_name', 'wes_join_name', cleanse_data),
+            ('roman_address', 'wes_join_addr', cleanse_data),
+            ('integrated_applicant_code', 'integ_appl_cd', cleanse_data),
+            ('double_reg_integration_num', 'dbl_reg_integ_mgt_srl_num', to_int(0)),
+        ],
+    },
+    'intl_trademark_registration': {
+        'title': '10-1: 国際商標登録管理情報テーブル',
+        'columns': [
+            ('add_del_id', 'add_del_id', cleanse_data),
+            ('intl_reg_num', 'intl_reg_num', cleanse_data),
+            ('intl_reg_num_update_count_code', 'intl_reg_num_updt_cnt_sign_cd', cleanse_data),
+            ('intl_reg_num_split_code', 'intl_reg_num_split_sign_cd', cleanse_data),
+            ('after_designation_date', 'aft_desig_year_month_day', cleanse_data),
+            ('intl_reg_date', 'intl_reg_year_month_day', cleanse_data),
+            ('jpo_reference_num', 'jpo_rfr_num', cleanse_data),
+            ('jpo_reference_num_split_code', 'jpo_rfr_num_split_sign_cd', cleanse_data),
+            ('set_registration_date', 'set_reg_year_month_day', cleanse_data),
+            ('right_erasure_id', 'right_ersr_id', cleanse_data),
+            ('right_disappearance_date', 'right_disppr_year_month_day', cleanse_data),
+            ('close_registration_date', 'close_reg_year_month_day', cleanse_data),
+            ('inspection_prohibition_flag', 'inspct_prhbt_flg', cleanse_data),
+            ('define_flag', 'define_flg', cleanse_data),
+            ('update_date', 'updt_year_month_day', cleanse_data),
+            ('batch_update_date', 'batch_updt_year_month_day', cleanse_data),
+        ],
+    },
+    'intl_trademark_progress': {
+        'title': '10-2: 国際商標経過情報テーブル',
+        'columns': [
+            ('add_del_id', 'add_del_id', cleanse_data),
+            ('intl_reg_num', 'intl_reg_num', cleanse_data),
+            ('intl_reg_num_update_count_code', 'intl_reg_num_updt_cnt_sign_cd', cleanse_data),
+            ('intl_reg_num_split_code', 'intl_reg_num_split_sign_cd', cleanse_data),
+            ('after_designation_date', 'aft_desig_year_month_day', cleanse_data),
+            ('intermediate_code', 'intrmd_cd', cleanse_data),
+            ('storage_num', 'string_num', cleanse_data),
+            ('intermediate_def_date_1', 'intrmd_dfn_1_dt', cleanse_data),
+            ('intermediate_def_date_2', 'intrmd_dfn_2_dt', cleanse_data),
+            ('intermediate_def_date_3', 'intrmd_dfn_3_dt', cleanse_data),
+            ('intermediate_def_date_4', 'intrmd_dfn_4_dt', cleanse_data),
+            ('intermediate_def_date_5', 'intrmd_dfn_5_dt', cleanse_data),
+            ('correspondence_mark', 'crrspnd_mk', cleanse_data),
+            ('define_flag', 'define_flg', cleanse_data),
+            ('status', 'stts', cleanse_data),
+            ('update_date', 'updt_year_month_day', cleanse_data),
+            ('batch_update_date', 'batch_updt_year_month_day', cleanse_data),
+        ],
+    },
+    'intl_trademark_holders': {
+        'title': '10-3: 国際商標名義人テーブル',
+        'columns': [
+            ('add_del_id', 'add_del_id', cleanse_data),
+            ('intl_reg_num', 'intl_reg_num', cleanse_data),
+            ('intl_reg_num_update_count_code', 'intl_reg_num_updt_cnt_sign_cd', cleanse_data),
+            ('intl_reg_num_split_code', 'intl_reg_num_split_sign_cd', cleanse_data),
+            ('after_designation_date', 'aft_desig_year_month_day', cleanse_data),
+            ('temp_principal_reg_id_flag', 'temp_principal_reg_id_flg', cleanse_data),
+            ('display_seq', 'indct_seq', to_int(0)),
+            ('holder_input_seq_num', 'crrcter_input_seq_num', to_int(0)),
+            ('holder_name', 'crrcter_name', cleanse_data),
+            ('holder_address', 'crrcter_addr', cleanse_data),
+            ('define_flag', 'define_flg', cleanse_data),
+            ('update_date', 'updt_year_month_day', cleanse_data),
+            ('batch_update_date', 'batch_updt_year_month_day', cleanse_data),
+        ],
+    },
+    'intl_trademark_goods_services': {
+        'title': '10-4: 国際商標商品・役務テーブル',
+        'columns': [
+            ('add_del_id', 'add_del_id', cleanse_data),
+            ('intl_reg_num', 'intl_reg_num', cleanse_data),
+            ('intl_reg_num_update_count_code', 'intl_reg_num_updt_cnt_sign_cd', cleanse_data),
+            ('intl_reg_num_split_code', 'intl_reg_num_split_sign_cd', cleanse_data),
+            ('after_designation_date', 'aft_desig_year_month_day', cleanse_data),
+            ('temp_principal_reg_id_flag', 'temp_principal_reg_id_flg', cleanse_data),
+            ('display_seq', 'indct_seq', to_int(0)),
+            ('seq_num', 'seq_num', to_int(0)),
+            ('madpro_class', 'madopro_class', cleanse_data),
+            ('goods_service_name', 'goods_service_name', cleanse_data),
+            ('intl_reg_record_date', 'intl_reg_rec_dt', cleanse_data),
+            ('define_flag', 'define_flg', cleanse_data),
+            ('update_date', 'updt_year_month_day', cleanse_data),
+            ('batch_update_date', 'batch_updt_year_month_day', cleanse_data),
+        ],
+    },
+    'intl_trademark_first_indication': {
+        'title': '10-5: 国際商標第一表示部テーブル',
+        'columns': [
+            ('add_del_id', 'add_del_id', cleanse_data),
+            ('intl_reg_num', 'intl_reg_num', cleanse_data),
+            ('intl_reg_num_update_count_code', 'intl_reg_num_updt_cnt_sign_cd', cleanse_data),
+            ('intl_reg_num_split_code', 'intl_reg_num_split_sign_cd', cleanse_data),
+            ('after_designation_date', 'aft_desig_year_month_day', cleanse_data),
+            ('temp_principal_reg_id_flag', 'temp_principal_reg_id_flg', cleanse_data),
+            ('display_seq', 'indct_seq', to_int(0)),
+            ('final_decision_date', 'finl_dcsn_year_month_day', cleanse_data),
+            ('trial_decision_date', 'trial_dcsn_year_month_day', cleanse_data),
+            ('priority_app_country_code', 'pri_app_gvrn_cntrcntry_cd', cleanse_data),
+            ('priority_app_date', 'pri_app_year_month_day', cleanse_data),
+            ('priority_claim_count', 'pri_clim_cnt', cleanse_data),
+            ('special_trademark_type_flag', 'special_t_typ_flg', cleanse_data),
+            ('group_cert_warranty_flag', 'group_cert_warranty_flg', cleanse_data),
+            ('define_flag', 'define_flg', cleanse_data),
+            ('update_date', 'updt_year_month_day', cleanse_data),
+            ('batch_update_date', 'batch_updt_year_month_day', cleanse_data),
+            ('trademark_detailed_explanation', 't_dtl_explntn', cleanse_data),
+        ],
+    },
+    'design_state_gvrnmnt_mstr_mk': {
+        'title': '指定国官庁マスタ_マークファイル',
+        'columns': [
+            ('add_del_id', 'add_del_id', cleanse_data),
+            ('jpo_rfr_num', 'jpo_rfr_num', cleanse_data),
+            ('jpo_rfr_num_split_sign_cd', 'jpo_rfr_num_split_sign_cd', cleanse_data),
+            ('history_num', 'history_num', cleanse_data),
+            ('standard_char_declarat_flg', 'standard_char_declarat_flg', cleanse_data),
+            ('color_clim_detail', 'color_clim_detail', cleanse_data),
+            ('color_clim_detail_japanese', 'color_clim_detail_japanese', cleanse_data),
+            ('emblem_transliterat_detail', 'emblem_transliterat_detail', cleanse_data),
+            ('three_dmns_emblem_flg', 'three_dmns_emblem_flg', cleanse_data),
+            ('sound_t_flg', 'sound_t_flg', cleanse_data),
+            ('group_cert_warranty_flg', 'group_cert_warranty_flg', cleanse_data),
+            ('emblem_doc_detail', 'emblem_doc_detail', cleanse_data),
+            ('emblem_doc_detail_japanese', 'emblem_doc_detail_japanese', cleanse_data),
+            ('vienna_class', 'vienna_class', cleanse_data),
+            ('exam_art_03_prgrph_02_flg', 'exam_art_03_prgrph_02_flg', cleanse_data),
+            ('exam_color_proviso_apply_flg', 'exam_color_proviso_apply_flg', cleanse_data),
+            ('exam_art_09_prgrph_01_flg', 'exam_art_09_prgrph_01_flg', cleanse_data),
+            ('acclrtd_exam_class', 'acclrtd_exam_class', cleanse_data),
+            ('define_flg', 'define_flg', cleanse_data),
+            ('updt_year_month_day', 'updt_year_month_day', cleanse_data),
+            ('batch_updt_year_month_day', 'batch_updt_year_month_day', cleanse_data),
+            ('special_t_typ', 'special_t_typ', cleanse_data),
+            ('t_dtl_explntn', 't_dtl_explntn', cleanse_data),
+            ('t_dtl_explntn_japanese', 't_dtl_explntn_japanese', cleanse_data),
+            ('dtl_explntn_doc_submt_dt', 'dtl_explntn_doc_submt_dt', cleanse_data),
+            ('color_chk_box', 'color_chk_box', cleanse_data),
+            ('disclaimer', 'disclaimer', cleanse_data),
+            ('opt_emblem_doc_detail', 'opt_emblem_doc_detail', cleanse_data),
+            ('opt_emblem_doc_detail_jp', 'opt_emblem_doc_detail_jp', cleanse_data),
+        ],
+    },
+    'design_state_gvrnmnt_mstr_pri': {
+        'title': '指定国官庁マスタ_優先権ファイル',
+        'columns': [
+            ('add_del_id', 'add_del_id', cleanse_data),
+            ('jpo_rfr_num', 'jpo_rfr_num', cleanse_data),
+            ('jpo_rfr_num_split_sign_cd', 'jpo_rfr_num_split_sign_cd', cleanse_data),
+            ('history_num', 'history_num', cleanse_data),
+            ('pri_clim_id', 'pri_clim_id', to_int(0)),
+            ('pri_finding_flg', 'pri_finding_flg', cleanse_data),
+            ('pri_app_gvrn_cntrcntry_cd', 'pri_app_gvrn_cntrcntry_cd', cleanse_data),
+            ('pri_app_num', 'pri_app_num', cleanse_data),
+            ('pri_app_year_month_day', 'pri_app_year_month_day', cleanse_data),
+            ('define_flg', 'define_flg', cleanse_data),
+            ('updt_year_month_day', 'updt_year_month_day', cleanse_data),
+            ('batch_updt_year_month_day', 'batch_updt_year_month_day', cleanse_data),
+        ],
+    },
+    'bougo_hyosho_articles': {
+        'title': '12-1: 防護標章記事テーブル',
+        'columns': [
+            ('processing_type', 'processing_type', cleanse_data),
+            ('law_code', 'law_cd', cleanse_data),
+            ('reg_num', 'reg_num', cleanse_data),
+            ('split_num', 'split_num', cleanse_data),
+            ('app_num', 'app_num', normalize_app_num),
+            ('pe_num', 'pe_num', cleanse_data),
+            ('defensive_art_upd_date', 'sec_art_upd_ymd', cleanse_data),
+            ('defensive_app_num', 'sec_app_num', cleanse_data),
+            ('defensive_num', 'sec_num', cleanse_data),
+            ('defensive_temp_reg_flg', 'sec_temp_reg_flg', cleanse_data),
+            ('defensive_conti_prd_expire_date', 'sec_conti_prd_expire_ymd', cleanse_data),
+            ('defensive_ersr_flg', 'sec_ersr_flg', cleanse_data),
+            ('defensive_apply_law', 'sec_apply_law', cleanse_data),
+            ('defensive_recovery_num', 'sec_recovery_num', cleanse_data),
+            ('defensive_app_date', 'sec_app_year_month_day', cleanse_data),
+            ('defensive_app_exam_pub_num', 'sec_app_exam_pub_num', cleanse_data),
+            ('defensive_app_exam_pub_date', 'sec_app_exam_pub_ymd', cleanse_data),
+            ('defensive_finl_dcsn_date', 'sec_finl_dcsn_year_month_day', cleanse_data),
+            ('defensive_trial_dcsn_date', 'sec_trial_dcsn_year_month_day', cleanse_data),
+            ('defensive_reg_date', 'sec_reg_year_month_day', cleanse_data),
+            ('defensive_rwrt_app_num', 'sec_rwrt_app_num', cleanse_data),
+            ('defensive_rwrt_app_date', 'sec_rwrt_app_year_month_day', cleanse_data),
+            ('defensive_rwrt_finl_dcsn_date', 'sec_rwrt_finl_dcsn_ymd', cleanse_data),
+            ('defensive_rwrt_trial_dcsn_date', 'sec_rwrt_trial_dcsn_ymd', cleanse_data),
+            ('defensive_rwrt_reg_date', 'sec_rwrt_reg_year_month_day', cleanse_data),
+            ('mu_num', 'mu_num', cleanse_data),
+            ('defensive_desig_goods_desig_wrk_cls', 'sec_desig_goods_desig_wrk_cls', cleanse_data),
+        ],
+    },
+    'bougo_shohin_mei': {
+        'title': '12-2: 防護商品名テーブル',
+        'columns': [
+            ('processing_type', 'processing_type', cleanse_data),
+            ('law_code', 'law_cd', cleanse_data),
+            ('reg_num', 'reg_num', cleanse_data),
+            ('split_num', 'split_num', cleanse_data),
+            ('defensive_num', 'sec_num', cleanse_data),
+            ('defensive_app_num', 'sec_app_num', cleanse_data),
+            ('defensive_desig_goods_desig_wrk_cls', 'sec_desig_goods_desig_wrk_cls', cleanse_data),
+            ('master_update_date', 'mstr_updt_year_month_day', cleanse_data),
+            ('defensive_desig_gds_desig_wrk_nm_len', 'sec_desig_gds_desig_wrk_nm_len', cleanse_data),
+            ('defensive_desig_gds_nm_desig_wrk_nm', 'sec_desig_gds_nm_desig_wrk_nm', cleanse_data),
+        ],
+    },
+    'bougo_koshin_kiji': {
+        'title': '12-3: 防護更新記事テーブル',
+        'columns': [
+            ('processing_type', 'processing_type', cleanse_data),
+            ('law_code', 'law_cd', cleanse_data),
+            ('reg_num', 'reg_num', cleanse_data),
+            ('split_num', 'split_num', cleanse_data),
+            ('app_num', 'app_num', normalize_app_num),
+            ('pe_num', 'pe_num', cleanse_data),
+            ('defensive_updt_art_upd_date', 'sec_updt_art_upd_ymd', cleanse_data),
+            ('defensive_updt_app_num', 'sec_updt_app_num', cleanse_data),
+            ('defensive_updt_num', 'sec_updt_sec_num', cleanse_data),
+            ('defensive_updt_temp_reg_flg', 'sec_updt_temp_reg_flg', cleanse_data),
+            ('defensive_updt_title_chan_flg', 'sec_updt_title_chan_flg', cleanse_data),
+            ('defensive_updt_recovery_num', 'sec_updt_recovery_num', cleanse_data),
+            ('defensive_updt_app_date', 'sec_updt_app_year_month_day', cleanse_data),
+            ('defensive_updt_finl_dcsn_date', 'sec_updt_finl_dcsn_ymd', cleanse_data),
+            ('defensive_updt_trial_dcsn_date', 'sec_updt_trial_dcsn_ymd', cleanse_data),
+            ('defensive_updt_reg_date', 'sec_updt_reg_year_month_day', cleanse_data),
+            ('mu_num', 'mu_num', cleanse_data),
+        ],
+    },
+    'shohyo_fuka_joho': {
+        'title': '13-1: 商標付加情報テーブル',
+        'columns': [
+            ('add_del_id', 'add_del_id', cleanse_data),
+            ('app_num', 'app_num', normalize_app_num),
+            ('split_num', 'split_num', cleanse_data),
+            ('sub_data_num', 'sub_data_num', cleanse_data),
+            ('right_request', 'right_request', cleanse_data),
+            ('grphc_id', 'grphc_id', cleanse_data),
+            ('color_harftone', 'color_harftone', cleanse_data),
+            ('gdmral_flg', 'gdmral_flg', cleanse_data),
+            ('duplicate_reg_flg', 'duplicate_reg_flg', cleanse_data),
+            ('special_exception_clim_flg', 'special_exception_clim_flg', cleanse_data),
+            ('consent_coe_reg_id', 'consent_coe_reg_id', cleanse_data),
+        ],
+    },
+}
 
-def import_trademark_attorney_articles(conn, tsv_path):
-    """3-3: 代理人記事テーブル"""
-    print("Importing trademark_attorney_articles...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_attorney_articles 
-                (processing_type, law_code, reg_num, split_num, app_num,
-                 rec_num, attorney_seq_num, attorney_update_date,
-                 attorney_appl_id, attorney_type, attorney_name_length,
-                 attorney_name)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['processing_type']),
-                cleanse_data(row['law_cd']),
-                cleanse_data(row['reg_num']),
-                cleanse_data(row['split_num']),
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['rec_num']),
-                cleanse_data(row['pe_num']),
-                cleanse_data(row['atty_art_upd_ymd']),
-                cleanse_data(row['atty_appl_id']),
-                cleanse_data(row['atty_typ']),
-                cleanse_data(row['atty_name_len']),
-                cleanse_data(row['atty_name'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+def iter_table_rows(table, tsv_path):
+    """TSVを1行ずつ読み、INSERT用のタプルを返す（全件をメモリに載せない）"""
+    spec = TABLE_SPECS[table]
 
-def import_case_info(conn, tsv_path):
-    """4-1: 事件情報テーブル - 特許庁仕様書042_事件フォルダ_商標ファイル.csv準拠"""
-    print("Importing trademark_case_info...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            # 特許庁仕様書の全49項目を完全に反映
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_case_info 
-                (master_update_datetime, law_code, app_num, app_date, 
-                 app_type1, app_type2, app_type3, app_type4, app_type5,
-                 reference_num, final_disposition_type, final_disposition_date,
-                 reg_article_reg_num, reg_article_split_num, defensive_num,
-                 reg_date, reg_article_total_num, reg_article_annual_num,
-                 reg_article_gazette_date, examiner_code, pub_article_gazette_date,
-                 class_count, reg_decision_class_count, standard_char_exist,
-                 special_mark_exist, color_exist, article3_2_flag, article5_4_flag,
-                 orig_app_type, orig_app_law_code, orig_app_num, retroactive_date,
-                 defensive_orig_app_num, defensive_orig_reg_num, defensive_orig_split_num,
-                 renewal_reg_num, renewal_split_num, renewal_defensive_num,
-                 rewrite_reg_num, rewrite_split_num, rewrite_defensive_num,
-                 public_order_violation_flag, accelerated_exam_mark,
-                 applicable_law_class, exam_type, litigation_code,
-                 decision_type, opposition_count, opposition_valid_count)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row.get('masterkosin_nitiji')),  # 1. マスタ更新日時
-                cleanse_data(row.get('yonpo_code', '4')),     # 2. 四法コード
-                normalize_app_num(row['shutugan_no']),        # 3. 出願番号
-                cleanse_data(row.get('shutugan_bi')),         # 4. 出願日
-                cleanse_data(row.get('shutugan_shubetu1')),   # 5. 出願種別1
-                cleanse_data(row.get('shutugan_shubetu2')),   # 6. 出願種別2
-                cleanse_data(row.get('shutugan_shubetu3')),   # 7. 出願種別3
-                cleanse_data(row.get('shutugan_shubetu4')),   # 8. 出願種別4
-                cleanse_data(row.get('shutugan_shubetu5')),   # 9. 出願種別5
-                cleanse_data(row.get('seiri_no')),            # 10. 整理番号
-                cleanse_data(row.get('saishushobun_shubetu')), # 11. 最終処分種別
-                cleanse_data(row.get('saishushobun_bi')),     # 12. 最終処分日
-                cleanse_data(row.get('raz_toroku_no')),       # 13. 登録記事登録番号
-                cleanse_data(row.get('raz_bunkatu_no')),      # 14. 登録記事分割番号
-                cleanse_data(row.get('bogo_no')),             # 15. 防護番号
-                cleanse_data(row.get('toroku_bi')),           # 16. 登録日
-                cleanse_data(row.get('raz_sotugo_su')),       # 17. 登録記事総通号数
-                cleanse_data(row.get('raz_nenkantugo_su')),   # 18. 登録記事年間通号数
-                cleanse_data(row.get('raz_kohohakko_bi')),    # 19. 登録記事公報発行日
-                cleanse_data(row.get('tantokan_code')),       # 20. 担当官コード
-                cleanse_data(row.get('pcz_kokaikohohakko_bi')), # 21. 公開公報記事公開公報発行日
-                cleanse_data(row.get('kubun_su')),            # 22. 区分数
-                cleanse_data(row.get('torokusateijikubun_su')), # 23. 登録査定時区分数
-                cleanse_data(row.get('hyojunmoji_umu')),      # 24. 標準文字有無
-                cleanse_data(row.get('rittaishohyo_umu')),    # 25. 特殊商標識別
-                cleanse_data(row.get('hyoshosikisai_umu')),   # 26. 標章色彩有無
-                cleanse_data(row.get('shohyoho3jo2ko_flag')), # 27. 商標法3条2項フラグ
-                cleanse_data(row.get('shohyoho5jo4ko_flag')), # 28. 色彩の但し書フラグ
-                cleanse_data(row.get('genshutugan_shubetu')), # 29. 原出願種別
-                cleanse_data(row.get('genshutuganyonpo_code')), # 30. 原出願四法コード
-                cleanse_data(row.get('genshutugan_no')),      # 31. 原出願番号
-                cleanse_data(row.get('sokyu_bi')),            # 32. 遡及日
-                cleanse_data(row.get('obz_shutugan_no')),     # 33. 防護原登録記事出願番号
-                cleanse_data(row.get('obz_toroku_no')),       # 34. 防護原登録記事登録番号
-                cleanse_data(row.get('obz_bunkatu_no')),      # 35. 防護原登録記事分割番号
-                cleanse_data(row.get('kosintoroku_no')),      # 36. 更新登録番号
-                cleanse_data(row.get('pez_bunkatu_no')),      # 37. 更新登録記事分割番号
-                cleanse_data(row.get('pez_bogo_no')),         # 38. 更新登録記事防護番号
-                cleanse_data(row.get('kakikaetoroku_no')),    # 39. 書換登録番号
-                cleanse_data(row.get('ktz_bunkatu_no')),      # 40. 書換登録記事分割番号
-                cleanse_data(row.get('ktz_bogo_no')),         # 41. 書換登録記事防護番号
-                cleanse_data(row.get('krz_kojoryozokuihan_flag')), # 42. 公序良俗違反フラグ
-                cleanse_data(row.get('sokisinsa_mark')),      # 43. 早期審査マーク
-                cleanse_data(row.get('tekiyohoki_kubun')),    # 44. 適用法規区分
-                cleanse_data(row.get('sinsa_shubetu')),       # 45. 審査種別
-                cleanse_data(row.get('sosho_code')),          # 46. 訴訟コード
-                cleanse_data(row.get('satei_shubetu')),       # 47. 査定種別
-                cleanse_data(row.get('igiken_su')),           # 48. 異議件数
-                cleanse_data(row.get('igiyuko_su'))           # 49. 異議有効数
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+    with open_tsv(tsv_path) as f:
+        reader = csv.reader(f, delimiter='\t')
+        header = next(reader, None)
+        if header is None:
+            return
+        index = {name: i for i, name in enumerate(header)}
+        width = len(header)
 
-def import_trademark_basic_items(conn, tsv_path):
-    """4-2: 商標基本項目記事テーブル"""
-    print("Importing trademark_basic_items...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_basic_items 
-                (add_del_id, mgt_num, rec_status_id, app_num, reg_num,
-                 split_num, defensive_num, app_typ_sec, app_typ_split,
-                 app_typ_complement_rjct, app_typ_chan, app_typ_priorty,
-                 app_typ_group, app_typ_area_group, app_date,
-                 prior_app_right_occr_date, rjct_finl_dcsn_dsptch_date,
-                 final_disposition_code, final_disposition_date,
-                 rewrite_app_num, old_law, ver_num, intl_reg_num,
-                 intl_reg_split_num, intl_reg_date, rec_latest_updt_date,
-                 conti_prd_expire_date, instllmnt_expr_date_aft_des_date,
-                 installments_id, set_reg_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['add_del_id']),
-                cleanse_data(row['mgt_num']),
-                cleanse_data(row['rec_status_id']),
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['reg_num']),
-                cleanse_data(row['split_num']),
-                cleanse_data(row.get('sec_num', '000')),
-                cleanse_data(row['app_typ_sec']),
-                cleanse_data(row['app_typ_split']),
-                cleanse_data(row['app_typ_complement_rjct']),
-                cleanse_data(row['app_typ_chan']),
-                cleanse_data(row['app_typ_priorty']),
-                cleanse_data(row['app_typ_group']),
-                cleanse_data(row['app_typ_area_group']),
-                cleanse_data(row['app_dt']),
-                cleanse_data(row.get('prior_app_right_occr_dt')),
-                cleanse_data(row.get('rjct_finl_dcsn_dsptch_dt')),
-                cleanse_data(row.get('final_dspst_cd')),
-                cleanse_data(row.get('final_dspst_dt')),
-                cleanse_data(row.get('rwrt_app_num')),
-                cleanse_data(row.get('old_law')),
-                cleanse_data(row.get('ver_num')),
-                cleanse_data(row.get('intl_reg_num')),
-                cleanse_data(row.get('intl_reg_split_num')),
-                cleanse_data(row.get('intl_reg_dt')),
-                cleanse_data(row.get('rec_latest_updt_dt')),
-                cleanse_data(row.get('conti_prd_expire_dt')),
-                cleanse_data(row.get('instllmnt_expr_dt_aft_des_dt')),
-                cleanse_data(row.get('installments_id')),
-                cleanse_data(row.get('set_reg_dt'))
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+        # (TSVの列位置, 変換関数, TSVにカラムが無い場合の値)
+        getters = []
+        for column in spec['columns']:
+            _, field, convert = column[:3]
+            missing = column[3] if len(column) > 3 else None
+            getters.append((index.get(field), convert, missing))
 
-def import_trademark_first_display(conn, tsv_path):
-    """4-3: 商標第一表示部テーブル"""
-    print("Importing trademark_first_display...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_first_display 
-                (processing_type, law_code, reg_num, split_num,
-                 history_num, master_update_date, cancel_disposal_flag,
-                 intl_reg_num, intl_reg_date, after_designation_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['processing_type']),
-                cleanse_data(row['law_cd']),
-                cleanse_data(row['reg_num']),
-                cleanse_data(row['split_num']),
-                cleanse_data(row['history_num']),
-                cleanse_data(row['mstr_updt_year_month_day']),
-                cleanse_data(row['cancel_and_disposal_id']),
-                cleanse_data(row['intl_reg_num']),
-                cleanse_data(row['intl_reg_year_month_day']),
-                cleanse_data(row['aft_desig_year_month_day'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+        filter_pos = filter_value = None
+        if 'filter' in spec:
+            field, filter_value = spec['filter']
+            filter_pos = index.get(field)
 
-def import_trademark_management_info(conn, tsv_path):
-    """5-1: 管理情報テーブル"""
-    print("Importing trademark_management_info...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
         for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_management_info 
-                (processing_type, law_code, reg_num, split_num, master_update_date,
-                 tscript_inspct_prhbt_flg, conti_prd_expire_date, next_pen_payment_limit_date,
-                 last_pymnt_yearly, share_rate, pblc_prvt_trnsfr_reg_date, right_ersr_id,
-                 right_disppr_date, close_orgnl_reg_trnsfr_rec_flg, close_reg_date,
-                 gvrnmnt_relation_id_flg, pen_suppl_flg, apply_law, group_t_flg,
-                 special_mark_exist, standard_char_exist, area_group_t_flg, trust_reg_flg,
-                 app_num, recvry_num, app_date, app_exam_pub_num, app_exam_pub_date,
-                 final_decision_date, trial_decision_date, set_reg_date, t_rewrite_app_num,
-                 t_rewrite_app_date, t_rewrite_final_decision_date, t_rewrite_trial_decision_date,
-                 t_rewrite_reg_date, invent_title_etc_len, pri_cntry_name_cd, pri_claim_date, pri_clim_cnt)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['processing_type']),
-                cleanse_data(row['law_cd']),
-                cleanse_data(row['reg_num']),
-                cleanse_data(row['split_num']),
-                cleanse_data(row['mstr_updt_year_month_day']),
-                cleanse_data(row['tscript_inspct_prhbt_flg']),
-                cleanse_data(row['conti_prd_expire_ymd']),
-                cleanse_data(row['next_pen_pymnt_tm_lmt_ymd']),
-                cleanse_data(row['last_pymnt_yearly']),
-                cleanse_data(row['share_rate']),
-                cleanse_data(row['pblc_prvt_trnsfr_reg_ymd']),
-                cleanse_data(row['right_ersr_id']),
-                cleanse_data(row['right_disppr_year_month_day']),
-                cleanse_data(row['close_orgnl_reg_trnsfr_rec_flg']),
-                cleanse_data(row['close_reg_year_month_day']),
-                cleanse_data(row['gvrnmnt_relation_id_flg']),
-                cleanse_data(row['pen_suppl_flg']),
-                cleanse_data(row['apply_law']),
-                cleanse_data(row['group_t_flg']),
-                cleanse_data(row['special_t_id']),
-                cleanse_data(row['standard_char_t_flg']),
-                cleanse_data(row['area_group_t_flg']),
-                cleanse_data(row['trust_reg_flg']),
-                normalize_app_num(row['app_num']),
-                cleanse_data(row.get('recvry_num')),
-                cleanse_data(row['app_year_month_day']),
-                cleanse_data(row.get('app_exam_pub_num')),
-                cleanse_data(row.get('app_exam_pub_year_month_day')),
-                cleanse_data(row.get('finl_dcsn_year_month_day')),
-                cleanse_data(row.get('trial_dcsn_year_month_day')),
-                cleanse_data(row.get('set_reg_year_month_day')),
-                cleanse_data(row.get('t_rwrt_app_num')),
-                cleanse_data(row.get('t_rwrt_app_year_month_day')),
-                cleanse_data(row.get('t_rwrt_finl_dcsn_ymd')),
-                cleanse_data(row.get('t_rwrt_trial_dcsn_ymd')),
-                cleanse_data(row.get('t_rwrt_reg_year_month_day')),
-                cleanse_data(row.get('invent_title_etc_len')),
-                cleanse_data(row.get('pri_cntry_name_cd')),
-                cleanse_data(row.get('pri_clim_year_month_day')),
-                cleanse_data(row.get('pri_clim_cnt'))
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+            if not row:
+                continue
+            if len(row) < width:
+                row += [None] * (width - len(row))
+            if 'filter' in spec and (filter_pos is None or row[filter_pos] != filter_value):
+                continue
 
-def import_trademark_updates(conn, tsv_path):
-    """5-2: 商標更新記事テーブル"""
-    print("Importing trademark_updates...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_updates 
-                (processing_type, law_code, reg_num, split_num, app_num,
-                 pe_num, t_updt_art_update_date, t_updt_app_num,
-                 t_updt_temp_reg_flg, t_updt_title_chan_flg,
-                 t_updt_recovery_num, t_updt_app_date,
-                 t_updt_final_decision_date, t_updt_trial_decision_date,
-                 t_updt_reg_date, mu_num)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['processing_type']),
-                cleanse_data(row['law_cd']),
-                cleanse_data(row['reg_num']),
-                cleanse_data(row['split_num']),
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['pe_num']),
-                cleanse_data(row['t_updt_art_upd_ymd']),
-                cleanse_data(row['t_updt_app_num']),
-                cleanse_data(row['t_updt_temp_reg_flg']),
-                cleanse_data(row['t_updt_title_chan_flg']),
-                cleanse_data(row['t_updt_recovery_num']),
-                cleanse_data(row['t_updt_app_ymd_app_ymd']),
-                cleanse_data(row.get('t_updt_finl_dcsn_ymd')),
-                cleanse_data(row.get('t_updt_trial_dcsn_ymd')),
-                cleanse_data(row['t_updt_reg_year_month_day']),
-                cleanse_data(row['mu_num'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+            values = []
+            for pos, convert, missing in getters:
+                value = row[pos] if pos is not None else missing
+                values.append(convert(value) if convert else value)
+            yield tuple(values)
 
-def import_trademark_progress_info(conn, tsv_path):
-    """5-3: 経過情報部テーブル"""
-    print("Importing trademark_progress_info...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            app_num = normalize_app_num(row['app_num'])
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_progress_info (
-                    processing_type, law_code, reg_num, split_num,
-                    app_num, rec_num, pe_num, progress_update_date,
-                    reg_intermediate_code, correspondence_mark,
-                    process_date, progress_app_num, receipt_num
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['processing_type']), 
-                cleanse_data(row['law_cd']),
-                cleanse_data(row['reg_num']), 
-                cleanse_data(row['split_num']),
-                app_num, 
-                cleanse_data(row['rec_num']),
-                cleanse_data(row['pe_num']), 
-                cleanse_data(row['prog_info_upd_ymd']),
-                cleanse_data(row['reg_intrmd_cd']), 
-                cleanse_data(row['crrspnd_mk']),
-                cleanse_data(row['rcpt_pymnt_dsptch_ymd']),
-                cleanse_data(row['prog_info_div_app_num']),
-                cleanse_data(row['rcpt_num_common_use'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+def insert_sql(table):
+    """TABLE_SPECSのカラム順のINSERT文"""
+    columns = [column[0] for column in TABLE_SPECS[table]['columns']]
+    return f"""
+        INSERT OR REPLACE INTO {table}
+        ({', '.join(columns)})
+        VALUES ({', '.join('?' * len(columns))})
+    """
 
-def import_trademark_rewrite_applications(conn, tsv_path):
-    """5-4: 書換申請番号テーブル"""
-    print("Importing trademark_rewrite_applications...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_rewrite_applications 
-                (processing_type, law_code, reg_num, split_num,
-                 app_num, mrgn_info_update_date, mu_num, rewrite_app_num)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['processing_type']),
-                cleanse_data(row['law_cd']),
-                cleanse_data(row['reg_num']),
-                cleanse_data(row['split_num']),
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['mrgn_info_upd_ymd']),
-                cleanse_data(row['mu_num']),
-                cleanse_data(row['mrgn_t_rwrt_app_num'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+def iter_batches(rows, size=None):
+    """行をsize件（default: IMPORT_BATCH_SIZE）ずつのリストに分割"""
+    size = size or IMPORT_BATCH_SIZE
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
 
-def import_trademark_transfer_receipts(conn, tsv_path):
-    """5-5: 移転受付情報テーブル"""
-    print("Importing trademark_transfer_receipts...")
-    encoding = detect_encoding(tsv_path)
+def insert_rows(conn, table, rows):
+    """行をIMPORT_BATCH_SIZE件ずつexecutemanyで書き込む（コミットは呼び出し元で行う）"""
+    sql = insert_sql(table)
     cursor = conn.cursor()
     count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_transfer_receipts 
-                (processing_type, law_code, reg_num, split_num,
-                 app_num, mrgn_info_update_date, mu_num, transfer_receipt_info)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['processing_type']),
-                cleanse_data(row['law_cd']),
-                cleanse_data(row['reg_num']),
-                cleanse_data(row['split_num']),
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['mrgn_info_upd_ymd']),
-                cleanse_data(row['mu_num']),
-                cleanse_data(row['trnsfr_rcpt_info'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
+    for batch in iter_batches(rows):
+        cursor.executemany(sql, batch)
+        count += len(batch)
     return count
 
-def import_trademark_appeal_cases(conn, tsv_path):
-    """6-1: 審判事件テーブル"""
-    print("Importing trademark_appeal_cases...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            # 商標のみ（law_divisionが4）をフィルタリング
-            if row.get('ynpu_kbn') != '4':
-                continue
-                
-            app_num = normalize_app_num(row.get('sytgn_bngu'))
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_appeal_cases (
-                    delete_flag, appeal_num, app_num, law_division,
-                    reg_num, split_num, similar_num, defensive_num,
-                    appeal_level_type, appeal_type, appeal_request_date,
-                    app_num_division, appeal_final_disposition_code,
-                    final_disposition_confirm_date, update_datetime
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['skbt_flg']),
-                cleanse_data(row['snpn_bngu']),
-                app_num,
-                cleanse_data(row['ynpu_kbn']),
-                cleanse_data(row.get('turk_bngu')),
-                cleanse_data(row.get('bnkt_bngu')),
-                cleanse_data(row.get('riz_bngu')),
-                cleanse_data(row.get('bug_bngu')),
-                cleanse_data(row['snkyu_sybt']),
-                cleanse_data(row['snpn_sybt']),
-                cleanse_data(row['snpn_sikyu_dt']),
-                cleanse_data(row['sytgn_bngu_kbn']),
-                cleanse_data(row.get('snpn_zkn_sisyu_sybn_cd')),
-                cleanse_data(row.get('sisyu_sybn_kkti_dt')),
-                cleanse_data(row['kusn_ntz_bat'])
-            ))
-            count += 1
-    
+def import_table(conn, table, tsv_path):
+    """TABLE_SPECSに従ってTSVを1テーブルに取り込む"""
+    print(f"Importing {table}...")
+    count = insert_rows(conn, table, iter_table_rows(table, tsv_path))
     conn.commit()
     print(f"  Imported {count} records")
     return count
 
-def import_trademark_decision_classifications(conn, tsv_path):
-    """6-2: 審決分類テーブル"""
-    print("Importing trademark_decision_classifications...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_decision_classifications (
-                    delete_flag, appeal_num, decision_num, repeat_num,
-                    law_division, applied_law_identification, appeal_level_type,
-                    appeal_type, judgment_item_code, decision_classification_conclusion_code,
-                    auxiliary_classification_identification, update_datetime
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['skbt_flg']),
-                cleanse_data(row['snpn_bngu']),
-                cleanse_data(row['snkt_bngu']),
-                cleanse_data(row['krkes_bngu']),
-                cleanse_data(row['ynpu_kbn']),
-                cleanse_data(row.get('tkyu_huk_skbt')),
-                cleanse_data(row['snkyu_sybt']),
-                cleanse_data(row['snpn_sybt']),
-                cleanse_data(row['hnz_zku_cd']),
-                cleanse_data(row['snkt_bnri_ktrn_cd']),
-                cleanse_data(row.get('hj_bnri_skbt')),
-                cleanse_data(row['kusn_ntz_bat'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+# ========== 並列インポート ==========
 
-def import_trademark_oppositions(conn, tsv_path):
-    """6-3: 異議申立テーブル"""
-    print("Importing trademark_oppositions...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_oppositions (
-                    delete_flag, appeal_num, opposition_num,
-                    opposition_app_date, opposition_final_disposition_code,
-                    final_disposition_confirm_date, update_datetime
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['skbt_flg']),
-                cleanse_data(row['snpn_bngu']),
-                cleanse_data(row['mustt_bngu']),
-                cleanse_data(row['ig_mustt_dt']),
-                cleanse_data(row['ig_mustt_sisyu_sybn_cd']),
-                cleanse_data(row.get('sisyu_sybn_kkti_dt')),
-                cleanse_data(row['kusn_ntz_bat'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+# ワーカー → 書き込み側のキューに溜められるバッチ数（メモリ使用量の上限）
+PARSE_QUEUE_BATCHES = 32
 
-def import_trademark_opposition_decisions(conn, tsv_path):
-    """6-4: 異議決定テーブル"""
-    print("Importing trademark_opposition_decisions...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_opposition_decisions (
-                    delete_flag, appeal_num, opposition_num, decision_num,
-                    dispatch_doc_num, decision_confirmation_status, update_datetime
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['skbt_flg']),
-                cleanse_data(row['snpn_bngu']),
-                cleanse_data(row['mustt_bngu']),
-                cleanse_data(row['ig_ktti_bngu']),
-                cleanse_data(row['hssu_syri_bngu']),
-                cleanse_data(row['ig_ktti_kkti_stat']),
-                cleanse_data(row['kusn_ntz_bat'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+# ワーカープロセス内の送信キュー（_init_parse_workerで設定）
+_row_queue = None
 
-def import_trademark_draft_records(conn, tsv_path):
-    """7-1: 起案中間記録テーブル"""
-    print("Importing trademark_draft_records...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            # 商標のみ（law_codeが4）をフィルタリング
-            if row.get('yonpo_code') != '4':
-                continue
-                
-            app_num = normalize_app_num(row['shutugan_no'])
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_draft_records (
-                    law_code, app_num, folder_creation_seq_num,
-                    creation_date, intermediate_doc_code, response_mark,
-                    draft_date, dispatch_date, objection_num,
-                    document_num, rejection_reason_code, corresponding_doc_num,
-                    document_type, version_num
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['yonpo_code']),
-                app_num,
-                int(row['folderbetusakusejnj_no']) if row.get('folderbetusakusejnj_no') else 0,
-                cleanse_data(row['sakusei_bi']),
-                cleanse_data(row['chukanshorui_code']),
-                cleanse_data(row['taio_mark']),
-                cleanse_data(row['kian_bi']),
-                cleanse_data(row['hasso_bi']),
-                cleanse_data(row.get('aaz_igi_no')),
-                cleanse_data(row['shorui_no']),
-                cleanse_data(row.get('kyozeturiyujobun_code')),
-                cleanse_data(row['taioshorui_no']),
-                cleanse_data(row['shorui_shubetu']),
-                cleanse_data(row['version_no'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+def _init_parse_worker(queue):
+    """ワーカープロセスの初期化（キューはタスク引数ではなく継承で渡す）"""
+    global _row_queue
+    _row_queue = queue
 
-def import_trademark_application_records(conn, tsv_path):
-    """7-2: 申請中間記録テーブル"""
-    print("Importing trademark_application_records...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            # 商標のみ（law_codeが4）をフィルタリング
-            if row.get('yonpo_code') != '4':
-                continue
-                
-            app_num = normalize_app_num(row['shutugan_no'])
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_application_records (
-                    law_code, app_num, folder_creation_seq_num,
-                    creation_date, intermediate_doc_code, correspondence_mark,
-                    dispatch_date, receipt_date, opposition_num,
-                    doc_num, procedure_complete_mark, order_complete_flag,
-                    corresponding_doc_num, doc_type, version_num,
-                    viewing_restriction_flag
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['yonpo_code']),
-                app_num,
-                int(row['folderbetusakusejnj_no']) if row.get('folderbetusakusejnj_no') else 0,
-                cleanse_data(row['sakusei_bi']),
-                cleanse_data(row['chukanshorui_code']),
-                cleanse_data(row['taio_mark']),
-                cleanse_data(row['sasidasi_bi']),
-                cleanse_data(row['uketuke_bi']),
-                cleanse_data(row.get('aaz_igi_no')),
-                cleanse_data(row['shorui_no']),
-                cleanse_data(row['hosikikan_mark']),
-                cleanse_data(row['sireikan_flag']),
-                cleanse_data(row['taioshorui_no']),
-                cleanse_data(row['shorui_shubetu']),
-                cleanse_data(row['version_no']),
-                cleanse_data(row['eturankinsi_flag'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+def _parse_table_job(table, tsv_path):
+    """ワーカープロセスでTSVを解析・クレンジングし、バッチをキューに送る
 
-def import_trademark_priority_claims(conn, tsv_path):
-    """8-1: 優先権情報テーブル"""
-    print("Importing trademark_priority_claims...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            # 商標のみ（law_codeが4）をフィルタリング
-            if row.get('yonpo_code') != '4':
-                continue
-                
-            app_num = normalize_app_num(row['shutugan_no'])
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_priority_claims (
-                    law_code, app_num, priority_seq_num, priority_country_code,
-                    priority_app_num, priority_date
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['yonpo_code']),
-                app_num,
-                int(row['bmz_junjo_no']) if row.get('bmz_junjo_no') else 1,
-                cleanse_data(row['yusenkenkuni_code']),
-                cleanse_data(row['yusenkenshutugan_no']),
-                cleanse_data(row['yusenkenshucho_bi'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+    送るメッセージは (table, payload):
+        payload がlist: 行のバッチ / None: 完了 / str: エラー内容
+    """
+    try:
+        for batch in iter_batches(iter_table_rows(table, tsv_path)):
+            _row_queue.put((table, batch))
+    except Exception as e:
+        # 例外オブジェクトはpickleできない場合があるため文字列で送る
+        _row_queue.put((table, f"{type(e).__name__}: {e}"))
+        return
+    _row_queue.put((table, None))
 
-def import_trademark_gazette_publications(conn, tsv_path):
-    """8-2: 公報発行情報テーブル"""
-    print("Importing trademark_gazette_publications...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            # 商標のみ（law_codeが4）をフィルタリング
-            if row.get('yonpo_code') != '4':
-                continue
-                
-            app_num = normalize_app_num(row['shutugan_no'])
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_gazette_publications (
-                    law_code, app_num, gazette_seq_num, total_serial_num,
-                    annual_serial_num, dept_serial_num, dept_annual_serial_num,
-                    gazette_publication_date, correction_type, gazette_type
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['yonpo_code']),
-                app_num,
-                int(row['jaz_junjo_no']) if row.get('jaz_junjo_no') else 1,
-                cleanse_data(row['jaz_sotugo_su']),
-                cleanse_data(row['jaz_nenkantugo_su']),
-                cleanse_data(row.get('jaz_bumonbetutugo_su')),
-                cleanse_data(row.get('jaz_bumonbetunenkantugo_su')),
-                cleanse_data(row['jaz_kohohakko_bi']),
-                cleanse_data(row['jaz_seigo_sikibetu']),
-                cleanse_data(row['jaz_koho_sikibetu'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+def import_tables_parallel(conn, targets, workers=None):
+    """複数のTSVをプロセスプールで並列に解析し、この接続（単一ライター）で書き込む
 
-def import_applicant_registration_info(conn, tsv_path):
-    """9-1: 申請人登録情報テーブル"""
-    print("Importing applicant_registration_info...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO applicant_registration_info (
-                    data_id_code, applicant_code, applicant_name,
-                    applicant_kana_name, applicant_postal_code, applicant_address,
-                    roman_name, roman_address, integrated_applicant_code,
-                    double_reg_integration_num
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['data_id_cd']),
-                cleanse_data(row['appl_cd']),
-                cleanse_data(row['appl_name']),
-                cleanse_data(row['appl_cana_name']),
-                cleanse_data(row['appl_postcode']),
-                cleanse_data(row['appl_addr']),
-                cleanse_data(row['wes_join_name']),
-                cleanse_data(row['wes_join_addr']),
-                cleanse_data(row['integ_appl_cd']),
-                int(row['dbl_reg_integ_mgt_srl_num']) if row.get('dbl_reg_integ_mgt_srl_num') else 0
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+    SQLiteの書き込みは1接続に限られるため、解析・クレンジング（CPU処理）のみを
+    ワーカーに分担させ、解析済みのバッチをキュー経由で受け取ってexecutemanyする。
 
-def import_intl_trademark_registration(conn, tsv_path):
-    """10-1: 国際商標登録管理情報テーブル"""
-    print("Importing intl_trademark_registration...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO intl_trademark_registration (
-                    add_del_id, intl_reg_num, intl_reg_num_update_count_code,
-                    intl_reg_num_split_code, after_designation_date, intl_reg_date,
-                    jpo_reference_num, jpo_reference_num_split_code, set_registration_date,
-                    right_erasure_id, right_disappearance_date, close_registration_date,
-                    inspection_prohibition_flag, define_flag, update_date, batch_update_date
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['add_del_id']),
-                cleanse_data(row['intl_reg_num']),
-                cleanse_data(row['intl_reg_num_updt_cnt_sign_cd']),
-                cleanse_data(row['intl_reg_num_split_sign_cd']),
-                cleanse_data(row['aft_desig_year_month_day']),
-                cleanse_data(row['intl_reg_year_month_day']),
-                cleanse_data(row['jpo_rfr_num']),
-                cleanse_data(row['jpo_rfr_num_split_sign_cd']),
-                cleanse_data(row['set_reg_year_month_day']),
-                cleanse_data(row['right_ersr_id']),
-                cleanse_data(row['right_disppr_year_month_day']),
-                cleanse_data(row['close_reg_year_month_day']),
-                cleanse_data(row['inspct_prhbt_flg']),
-                cleanse_data(row['define_flg']),
-                cleanse_data(row['updt_year_month_day']),
-                cleanse_data(row['batch_updt_year_month_day'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+    Args:
+        conn: データベース接続
+        targets: [(TSVファイルのパス, テーブル名), ...]（TABLE_SPECSのテーブルのみ）
+        workers: ワーカープロセス数（Noneの場合はCPU数）
 
-def import_intl_trademark_progress(conn, tsv_path):
-    """10-2: 国際商標経過情報テーブル"""
-    print("Importing intl_trademark_progress...")
-    encoding = detect_encoding(tsv_path)
+    Returns:
+        {テーブル名: 件数}（エラーになったテーブルは含まない）
+    """
+    queue = multiprocessing.Queue(maxsize=PARSE_QUEUE_BATCHES)
     cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO intl_trademark_progress (
-                    add_del_id, intl_reg_num, intl_reg_num_update_count_code,
-                    intl_reg_num_split_code, after_designation_date, intermediate_code,
-                    storage_num, intermediate_def_date_1, intermediate_def_date_2,
-                    intermediate_def_date_3, intermediate_def_date_4, intermediate_def_date_5,
-                    correspondence_mark, define_flag, status, update_date, batch_update_date
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['add_del_id']),
-                cleanse_data(row['intl_reg_num']),
-                cleanse_data(row['intl_reg_num_updt_cnt_sign_cd']),
-                cleanse_data(row['intl_reg_num_split_sign_cd']),
-                cleanse_data(row['aft_desig_year_month_day']),
-                cleanse_data(row['intrmd_cd']),
-                cleanse_data(row['string_num']),
-                cleanse_data(row['intrmd_dfn_1_dt']),
-                cleanse_data(row['intrmd_dfn_2_dt']),
-                cleanse_data(row['intrmd_dfn_3_dt']),
-                cleanse_data(row['intrmd_dfn_4_dt']),
-                cleanse_data(row['intrmd_dfn_5_dt']),
-                cleanse_data(row['crrspnd_mk']),
-                cleanse_data(row['define_flg']),
-                cleanse_data(row['stts']),
-                cleanse_data(row['updt_year_month_day']),
-                cleanse_data(row['batch_updt_year_month_day'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+    counts = {table: 0 for _, table in targets}
+    failed = set()
+    pending = set(counts)
+    start_time = datetime.now()
 
-def import_intl_trademark_holders(conn, tsv_path):
-    """10-3: 国際商標名義人テーブル"""
-    print("Importing intl_trademark_holders...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO intl_trademark_holders (
-                    add_del_id, intl_reg_num, intl_reg_num_update_count_code,
-                    intl_reg_num_split_code, after_designation_date,
-                    temp_principal_reg_id_flag, display_seq, holder_input_seq_num,
-                    holder_name, holder_address, define_flag, update_date, batch_update_date
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['add_del_id']),
-                cleanse_data(row['intl_reg_num']),
-                cleanse_data(row['intl_reg_num_updt_cnt_sign_cd']),
-                cleanse_data(row['intl_reg_num_split_sign_cd']),
-                cleanse_data(row['aft_desig_year_month_day']),
-                cleanse_data(row['temp_principal_reg_id_flg']),
-                int(row['indct_seq']) if row.get('indct_seq') else 0,
-                int(row['crrcter_input_seq_num']) if row.get('crrcter_input_seq_num') else 0,
-                cleanse_data(row['crrcter_name']),
-                cleanse_data(row['crrcter_addr']),
-                cleanse_data(row['define_flg']),
-                cleanse_data(row['updt_year_month_day']),
-                cleanse_data(row['batch_updt_year_month_day'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+    def finish(table, error=None):
+        pending.discard(table)
+        elapsed = (datetime.now() - start_time).total_seconds()
+        if error:
+            failed.add(table)
+            print(f"  Error importing {table}: {error}")
+        elif table not in failed:
+            conn.commit()
+            print(f"  {table}: Imported {counts[table]} records ({elapsed:.2f} seconds)")
 
-def import_intl_trademark_goods_services(conn, tsv_path):
-    """10-4: 国際商標商品・役務テーブル"""
-    print("Importing intl_trademark_goods_services...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO intl_trademark_goods_services (
-                    add_del_id, intl_reg_num, intl_reg_num_update_count_code,
-                    intl_reg_num_split_code, after_designation_date,
-                    temp_principal_reg_id_flag, display_seq, seq_num,
-                    madpro_class, goods_service_name, intl_reg_record_date,
-                    define_flag, update_date, batch_update_date
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['add_del_id']),
-                cleanse_data(row['intl_reg_num']),
-                cleanse_data(row['intl_reg_num_updt_cnt_sign_cd']),
-                cleanse_data(row['intl_reg_num_split_sign_cd']),
-                cleanse_data(row['aft_desig_year_month_day']),
-                cleanse_data(row['temp_principal_reg_id_flg']),
-                int(row['indct_seq']) if row.get('indct_seq') else 0,
-                int(row['seq_num']) if row.get('seq_num') else 0,
-                cleanse_data(row['madopro_class']),
-                cleanse_data(row['goods_service_name']),
-                cleanse_data(row['intl_reg_rec_dt']),
-                cleanse_data(row['define_flg']),
-                cleanse_data(row['updt_year_month_day']),
-                cleanse_data(row['batch_updt_year_month_day'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker,
+                             initargs=(queue,)) as executor:
+        futures = {
+            executor.submit(_parse_table_job, table, str(tsv_path)): table
+            for tsv_path, table in targets
+        }
+        while pending:
+            try:
+                table, payload = queue.get(timeout=1)
+            except Empty:
+                # ワーカープロセスが異常終了した場合は完了通知が届かない
+                for future, table in futures.items():
+                    if table in pending and future.done() and future.exception():
+                        finish(table, future.exception())
+                continue
 
-def import_intl_trademark_first_indication(conn, tsv_path):
-    """10-5: 国際商標第一表示部テーブル"""
-    print("Importing intl_trademark_first_indication...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO intl_trademark_first_indication (
-                    add_del_id, intl_reg_num, intl_reg_num_update_count_code,
-                    intl_reg_num_split_code, after_designation_date,
-                    temp_principal_reg_id_flag, display_seq, final_decision_date,
-                    trial_decision_date, priority_app_country_code, priority_app_date,
-                    priority_claim_count, special_trademark_type_flag,
-                    group_cert_warranty_flag, define_flag, update_date,
-                    batch_update_date, trademark_detailed_explanation
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['add_del_id']),
-                cleanse_data(row['intl_reg_num']),
-                cleanse_data(row['intl_reg_num_updt_cnt_sign_cd']),
-                cleanse_data(row['intl_reg_num_split_sign_cd']),
-                cleanse_data(row['aft_desig_year_month_day']),
-                cleanse_data(row['temp_principal_reg_id_flg']),
-                int(row['indct_seq']) if row.get('indct_seq') else 0,
-                cleanse_data(row['finl_dcsn_year_month_day']),
-                cleanse_data(row['trial_dcsn_year_month_day']),
-                cleanse_data(row['pri_app_gvrn_cntrcntry_cd']),
-                cleanse_data(row['pri_app_year_month_day']),
-                cleanse_data(row['pri_clim_cnt']),
-                cleanse_data(row['special_t_typ_flg']),
-                cleanse_data(row['group_cert_warranty_flg']),
-                cleanse_data(row['define_flg']),
-                cleanse_data(row['updt_year_month_day']),
-                cleanse_data(row['batch_updt_year_month_day']),
-                cleanse_data(row['t_dtl_explntn'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+            if payload is None or isinstance(payload, str):
+                finish(table, payload)
+            elif table not in failed:
+                try:
+                    cursor.executemany(insert_sql(table), payload)
+                    counts[table] += len(payload)
+                except sqlite3.Error as e:
+                    # 残りのバッチは読み捨てる（完了通知まで待つ）
+                    failed.add(table)
+                    print(f"  Error importing {table}: {e}")
 
-def import_design_state_gvrnmnt_mstr_mk(conn, tsv_path):
-    """指定国官庁マスタ_マークファイル"""
-    print("Importing design_state_gvrnmnt_mstr_mk...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO design_state_gvrnmnt_mstr_mk (
-                    add_del_id, jpo_rfr_num, jpo_rfr_num_split_sign_cd, history_num,
-                    standard_char_declarat_flg, color_clim_detail, color_clim_detail_japanese,
-                    emblem_transliterat_detail, three_dmns_emblem_flg, sound_t_flg,
-                    group_cert_warranty_flg, emblem_doc_detail, emblem_doc_detail_japanese,
-                    vienna_class, exam_art_03_prgrph_02_flg, exam_color_proviso_apply_flg,
-                    exam_art_09_prgrph_01_flg, acclrtd_exam_class, define_flg,
-                    updt_year_month_day, batch_updt_year_month_day, special_t_typ,
-                    t_dtl_explntn, t_dtl_explntn_japanese, dtl_explntn_doc_submt_dt,
-                    color_chk_box, disclaimer, opt_emblem_doc_detail, opt_emblem_doc_detail_jp
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row.get('add_del_id')),
-                cleanse_data(row.get('jpo_rfr_num')),
-                cleanse_data(row.get('jpo_rfr_num_split_sign_cd')),
-                cleanse_data(row.get('history_num')),
-                cleanse_data(row.get('standard_char_declarat_flg')),
-                cleanse_data(row.get('color_clim_detail')),
-                cleanse_data(row.get('color_clim_detail_japanese')),
-                cleanse_data(row.get('emblem_transliterat_detail')),
-                cleanse_data(row.get('three_dmns_emblem_flg')),
-                cleanse_data(row.get('sound_t_flg')),
-                cleanse_data(row.get('group_cert_warranty_flg')),
-                cleanse_data(row.get('emblem_doc_detail')),
-                cleanse_data(row.get('emblem_doc_detail_japanese')),
-                cleanse_data(row.get('vienna_class')),
-                cleanse_data(row.get('exam_art_03_prgrph_02_flg')),
-                cleanse_data(row.get('exam_color_proviso_apply_flg')),
-                cleanse_data(row.get('exam_art_09_prgrph_01_flg')),
-                cleanse_data(row.get('acclrtd_exam_class')),
-                cleanse_data(row.get('define_flg')),
-                cleanse_data(row.get('updt_year_month_day')),
-                cleanse_data(row.get('batch_updt_year_month_day')),
-                cleanse_data(row.get('special_t_typ')),
-                cleanse_data(row.get('t_dtl_explntn')),
-                cleanse_data(row.get('t_dtl_explntn_japanese')),
-                cleanse_data(row.get('dtl_explntn_doc_submt_dt')),
-                cleanse_data(row.get('color_chk_box')),
-                cleanse_data(row.get('disclaimer')),
-                cleanse_data(row.get('opt_emblem_doc_detail')),
-                cleanse_data(row.get('opt_emblem_doc_detail_jp'))
-            ))
-            count += 1
-    
     conn.commit()
-    print(f"  Imported {count} records")
-    return count
+    return {table: count for table, count in counts.items() if table not in failed}
 
-def import_design_state_gvrnmnt_mstr_pri(conn, tsv_path):
-    """指定国官庁マスタ_優先権ファイル"""
-    print("Importing design_state_gvrnmnt_mstr_pri...")
-    encoding = detect_encoding(tsv_path)
+# TABLE_SPECSで表せない取り込み処理
+IMAGE_COLUMNS = [
+    'country_code', 'doc_type', 'doc_num', 'app_num', 'page_num',
+    'rec_seq_num', 'year_issue_code', 'data_creation_date',
+    'all_page_count', 'final_rec_seq_num', 'fullsize_length',
+    'fullsize_width', 'compression_format', 'resolution',
+    'line_count_length', 'line_count_width', 'image_data_length',
+    'image_data',
+]
+
+def insert_image_rows(conn, images):
+    """結合済みの画像レコード（dict）をexecutemanyで書き込む"""
     cursor = conn.cursor()
     count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO design_state_gvrnmnt_mstr_pri (
-                    add_del_id, jpo_rfr_num, jpo_rfr_num_split_sign_cd, history_num,
-                    pri_clim_id, pri_finding_flg, pri_app_gvrn_cntrcntry_cd,
-                    pri_app_num, pri_app_year_month_day, define_flg,
-                    updt_year_month_day, batch_updt_year_month_day
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row.get('add_del_id')),
-                cleanse_data(row.get('jpo_rfr_num')),
-                cleanse_data(row.get('jpo_rfr_num_split_sign_cd')),
-                cleanse_data(row.get('history_num')),
-                int(row['pri_clim_id']) if row.get('pri_clim_id') else 0,
-                cleanse_data(row.get('pri_finding_flg')),
-                cleanse_data(row.get('pri_app_gvrn_cntrcntry_cd')),
-                cleanse_data(row.get('pri_app_num')),
-                cleanse_data(row.get('pri_app_year_month_day')),
-                cleanse_data(row.get('define_flg')),
-                cleanse_data(row.get('updt_year_month_day')),
-                cleanse_data(row.get('batch_updt_year_month_day'))
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
+    images = iter(images)
+    while True:
+        batch = [tuple(img[column] for column in IMAGE_COLUMNS)
+                 for img in islice(images, IMPORT_BATCH_SIZE)]
+        if not batch:
+            break
+        cursor.executemany(f"""
+            INSERT OR REPLACE INTO trademark_images ({', '.join(IMAGE_COLUMNS)})
+            VALUES ({', '.join('?' * len(IMAGE_COLUMNS))})
+        """, batch)
+        count += len(batch)
     return count
 
-def import_trademark_images(conn, tsv_path):
-    """11-1: 商標画像テーブル"""
-    print("Importing trademark_images...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
+def read_image_rows(tsv_path):
+    """商標画像TSVを読み、複数行に分かれた画像データを結合したレコード（dict）のリストを返す"""
+    with open_tsv(tsv_path) as f:
         reader = csv.DictReader(f, delimiter='\t')
         
         # 複数行データを結合するためのバッファ
@@ -1553,263 +1154,138 @@ def import_trademark_images(conn, tsv_path):
             else:
                 # 複数行の場合はデータを結合
                 images[key]['image_data'] += row['image_data']
-        
-        # 結合されたデータをインサート
-        for img in images.values():
-            cursor.execute("""
-                INSERT OR REPLACE INTO trademark_images (
-                    country_code, doc_type, doc_num, app_num, page_num,
-                    rec_seq_num, year_issue_code, data_creation_date,
-                    all_page_count, final_rec_seq_num, fullsize_length,
-                    fullsize_width, compression_format, resolution,
-                    line_count_length, line_count_width, image_data_length,
-                    image_data
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                img['country_code'], img['doc_type'], img['doc_num'],
-                img['app_num'], img['page_num'], img['rec_seq_num'],
-                img['year_issue_code'], img['data_creation_date'],
-                img['all_page_count'], img['final_rec_seq_num'],
-                img['fullsize_length'], img['fullsize_width'],
-                img['compression_format'], img['resolution'],
-                img['line_count_length'], img['line_count_width'],
-                img['image_data_length'], img['image_data']
-            ))
-            count += 1
     
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+    return list(images.values())
 
-def import_bougo_hyosho_articles(conn, tsv_path):
-    """12-1: 防護標章記事テーブル"""
-    print("Importing bougo_hyosho_articles...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO bougo_hyosho_articles (
-                    processing_type, law_code, reg_num, split_num, app_num, pe_num,
-                    defensive_art_upd_date, defensive_app_num, defensive_num,
-                    defensive_temp_reg_flg, defensive_conti_prd_expire_date,
-                    defensive_ersr_flg, defensive_apply_law, defensive_recovery_num,
-                    defensive_app_date, defensive_app_exam_pub_num,
-                    defensive_app_exam_pub_date, defensive_finl_dcsn_date,
-                    defensive_trial_dcsn_date, defensive_reg_date,
-                    defensive_rwrt_app_num, defensive_rwrt_app_date,
-                    defensive_rwrt_finl_dcsn_date, defensive_rwrt_trial_dcsn_date,
-                    defensive_rwrt_reg_date, mu_num, defensive_desig_goods_desig_wrk_cls
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['processing_type']),
-                cleanse_data(row['law_cd']),
-                cleanse_data(row['reg_num']),
-                cleanse_data(row['split_num']),
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['pe_num']),
-                cleanse_data(row['sec_art_upd_ymd']),
-                cleanse_data(row['sec_app_num']),
-                cleanse_data(row['sec_num']),
-                cleanse_data(row['sec_temp_reg_flg']),
-                cleanse_data(row['sec_conti_prd_expire_ymd']),
-                cleanse_data(row['sec_ersr_flg']),
-                cleanse_data(row['sec_apply_law']),
-                cleanse_data(row['sec_recovery_num']),
-                cleanse_data(row['sec_app_year_month_day']),
-                cleanse_data(row['sec_app_exam_pub_num']),
-                cleanse_data(row['sec_app_exam_pub_ymd']),
-                cleanse_data(row['sec_finl_dcsn_year_month_day']),
-                cleanse_data(row['sec_trial_dcsn_year_month_day']),
-                cleanse_data(row['sec_reg_year_month_day']),
-                cleanse_data(row['sec_rwrt_app_num']),
-                cleanse_data(row['sec_rwrt_app_year_month_day']),
-                cleanse_data(row['sec_rwrt_finl_dcsn_ymd']),
-                cleanse_data(row['sec_rwrt_trial_dcsn_ymd']),
-                cleanse_data(row['sec_rwrt_reg_year_month_day']),
-                cleanse_data(row['mu_num']),
-                cleanse_data(row['sec_desig_goods_desig_wrk_cls'])
-            ))
-            count += 1
+def import_trademark_images(conn, tsv_path):
+    """11-1: 商標画像テーブル"""
+    print("Importing trademark_images...")
+    images = read_image_rows(tsv_path)
     
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
-
-def import_bougo_shohin_mei(conn, tsv_path):
-    """12-2: 防護商品名テーブル"""
-    print("Importing bougo_shohin_mei...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
+    # 結合されたデータをまとめてインサート
+    count = insert_image_rows(conn, images)
     
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO bougo_shohin_mei (
-                    processing_type, law_code, reg_num, split_num,
-                    defensive_num, defensive_app_num, defensive_desig_goods_desig_wrk_cls,
-                    master_update_date, defensive_desig_gds_desig_wrk_nm_len,
-                    defensive_desig_gds_nm_desig_wrk_nm
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['processing_type']),
-                cleanse_data(row['law_cd']),
-                cleanse_data(row['reg_num']),
-                cleanse_data(row['split_num']),
-                cleanse_data(row['sec_num']),
-                cleanse_data(row['sec_app_num']),
-                cleanse_data(row['sec_desig_goods_desig_wrk_cls']),
-                cleanse_data(row['mstr_updt_year_month_day']),
-                cleanse_data(row['sec_desig_gds_desig_wrk_nm_len']),
-                cleanse_data(row['sec_desig_gds_nm_desig_wrk_nm'])
-            ))
-            count += 1
+    # 主画像テーブル（出願番号ごとに最初のページをデコードしてBLOBで保持）
+    fragments_by_app = {}
+    for img in images:
+        if img['app_num'] and img['compression_format'] == 'JP' and img['image_data']:
+            fragments_by_app.setdefault(img['app_num'], []).append(
+                (img['page_num'], img['rec_seq_num'], img['image_data'])
+            )
+    primary_count = insert_image_primary(
+        conn,
+        (primary_image_record(app_num, fragments) for app_num, fragments in fragments_by_app.items())
+    )
     
     conn.commit()
-    print(f"  Imported {count} records")
+    print(f"  Imported {count} records ({primary_count} primary images)")
     return count
 
-def import_bougo_koshin_kiji(conn, tsv_path):
-    """12-3: 防護更新記事テーブル"""
-    print("Importing bougo_koshin_kiji...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO bougo_koshin_kiji (
-                    processing_type, law_code, reg_num, split_num, app_num, pe_num,
-                    defensive_updt_art_upd_date, defensive_updt_app_num,
-                    defensive_updt_num, defensive_updt_temp_reg_flg,
-                    defensive_updt_title_chan_flg, defensive_updt_recovery_num,
-                    defensive_updt_app_date, defensive_updt_finl_dcsn_date,
-                    defensive_updt_trial_dcsn_date, defensive_updt_reg_date, mu_num
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['processing_type']),
-                cleanse_data(row['law_cd']),
-                cleanse_data(row['reg_num']),
-                cleanse_data(row['split_num']),
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['pe_num']),
-                cleanse_data(row['sec_updt_art_upd_ymd']),
-                cleanse_data(row['sec_updt_app_num']),
-                cleanse_data(row['sec_updt_sec_num']),
-                cleanse_data(row['sec_updt_temp_reg_flg']),
-                cleanse_data(row['sec_updt_title_chan_flg']),
-                cleanse_data(row['sec_updt_recovery_num']),
-                cleanse_data(row['sec_updt_app_year_month_day']),
-                cleanse_data(row['sec_updt_finl_dcsn_ymd']),
-                cleanse_data(row['sec_updt_trial_dcsn_ymd']),
-                cleanse_data(row['sec_updt_reg_year_month_day']),
-                cleanse_data(row['mu_num'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+# テーブル → 専用のインポート関数（それ以外はimport_tableで取り込む）
+CUSTOM_IMPORTERS = {
+    'trademark_images': import_trademark_images,
+}
 
-def import_shohyo_fuka_joho(conn, tsv_path):
-    """13-1: 商標付加情報テーブル"""
-    print("Importing shohyo_fuka_joho...")
-    encoding = detect_encoding(tsv_path)
-    cursor = conn.cursor()
-    count = 0
-    
-    with open(tsv_path, 'r', encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            cursor.execute("""
-                INSERT OR REPLACE INTO shohyo_fuka_joho (
-                    add_del_id, app_num, split_num, sub_data_num,
-                    right_request, grphc_id, color_harftone, gdmral_flg,
-                    duplicate_reg_flg, special_exception_clim_flg, consent_coe_reg_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cleanse_data(row['add_del_id']),
-                normalize_app_num(row['app_num']),
-                cleanse_data(row['split_num']),
-                cleanse_data(row['sub_data_num']),
-                cleanse_data(row['right_request']),
-                cleanse_data(row['grphc_id']),
-                cleanse_data(row['color_harftone']),
-                cleanse_data(row['gdmral_flg']),
-                cleanse_data(row['duplicate_reg_flg']),
-                cleanse_data(row['special_exception_clim_flg']),
-                cleanse_data(row['consent_coe_reg_id'])
-            ))
-            count += 1
-    
-    conn.commit()
-    print(f"  Imported {count} records")
-    return count
+# TSVファイルと取り込み先テーブルのマッピング
+IMPORT_MAPPINGS = [
+    ('upd_standard_char_t_art.tsv', 'trademark_standard_char'),
+    ('upd_indct_use_t_art.tsv', 'trademark_display'),
+    ('upd_search_use_t_art_table.tsv', 'trademark_search'),
+    ('upd_t_dsgnt_art.tsv', 'trademark_pronunciations'),
+    ('upd_jiken_c_t_shousaina_setumei.tsv', 'trademark_detailed_descriptions'),
+    ('upd_jiken_c_t_shohin_joho.tsv', 'trademark_goods_services'),
+    ('upd_goods_class_art.tsv', 'trademark_goods_classes'),
+    ('upd_t_knd_info_art_table.tsv', 'trademark_similar_group_codes'),
+    ('upd_t_vienna_class_grphc_term_art.tsv', 'trademark_vienna_codes'),
+    ('upd_right_goods_name.tsv', 'trademark_right_goods'),
+    ('upd_right_person_art_t.tsv', 'trademark_right_holders'),
+    ('upd_jiken_c_t_shutugannindairinin.tsv', 'trademark_applicants_agents'),
+    ('upd_atty_art_t.tsv', 'trademark_attorney_articles'),
+    ('upd_jiken_c_t.tsv', 'trademark_case_info'),
+    ('upd_t_basic_item_art.tsv', 'trademark_basic_items'),
+    ('upd_t_first_indct_div.tsv', 'trademark_first_display'),
+    ('upd_mgt_info_t.tsv', 'trademark_management_info'),
+    ('upd_t_updt_art.tsv', 'trademark_updates'),
+    ('upd_prog_info_div_t.tsv', 'trademark_progress_info'),
+    ('upd_mrgn_t_rwrt_app_num.tsv', 'trademark_rewrite_applications'),
+    ('upd_trnsfr_rcpt_info_t.tsv', 'trademark_transfer_receipts'),
+    ('upd_snpn_zkn.tsv', 'trademark_appeal_cases'),
+    ('upd_snkt_bnri.tsv', 'trademark_decision_classifications'),
+    ('upd_ig_mustt.tsv', 'trademark_oppositions'),
+    ('upd_ig_ktti.tsv', 'trademark_opposition_decisions'),
+    ('upd_jiken_c_t_kian_dv.tsv', 'trademark_draft_records'),
+    ('upd_jiken_c_t_sinsei_dv.tsv', 'trademark_application_records'),
+    ('upd_jiken_c_t_yusenken_joho.tsv', 'trademark_priority_claims'),
+    ('upd_jiken_c_t_kohohako_joho.tsv', 'trademark_gazette_publications'),
+    ('upd_appl_reg_info.tsv', 'applicant_registration_info'),
+    ('upd_intl_t_org_org_reg_mgt_info.tsv', 'intl_trademark_registration'),
+    ('upd_intl_t_org_prog_info.tsv', 'intl_trademark_progress'),
+    ('upd_intl_t_org_set_crr_nm_addr.tsv', 'intl_trademark_holders'),
+    ('upd_intl_t_org_set_dsgn_gds_srvc.tsv', 'intl_trademark_goods_services'),
+    ('upd_intl_t_org_set_frst_indct.tsv', 'intl_trademark_first_indication'),
+    ('upd_design_state_gvrnmnt_mstr_mk.tsv', 'design_state_gvrnmnt_mstr_mk'),
+    ('upd_design_state_gvrnmnt_mstr_pri.tsv', 'design_state_gvrnmnt_mstr_pri'),
+    ('upd_t_sample.tsv', 'trademark_images'),
+    ('upd_sec_art.tsv', 'bougo_hyosho_articles'),
+    ('upd_sec_goods_name.tsv', 'bougo_shohin_mei'),
+    ('upd_sec_updt_art.tsv', 'bougo_koshin_kiji'),
+    ('upd_t_add_info.tsv', 'shohyo_fuka_joho'),
+]
 
-def import_all_tables(conn):
-    """全テーブルのインポート"""
-    
-    # TSVファイルとインポート関数のマッピング
-    import_mappings = [
-        ('upd_standard_char_t_art.tsv', import_trademark_standard_char),
-        ('upd_indct_use_t_art.tsv', import_trademark_display),
-        ('upd_search_use_t_art_table.tsv', import_trademark_search),
-        ('upd_t_dsgnt_art.tsv', import_trademark_pronunciation),
-        ('upd_jiken_c_t_shousaina_setumei.tsv', import_trademark_detailed_descriptions),
-        ('upd_jiken_c_t_shohin_joho.tsv', import_goods_services_info),
-        ('upd_goods_class_art.tsv', import_trademark_goods_classes),
-        ('upd_t_knd_info_art_table.tsv', import_trademark_similar_group_codes),
-        ('upd_t_vienna_class_grphc_term_art.tsv', import_trademark_vienna_codes),
-        ('upd_right_goods_name.tsv', import_trademark_right_goods),
-        ('upd_right_person_art_t.tsv', import_trademark_right_holders),
-        ('upd_jiken_c_t_shutugannindairinin.tsv', import_trademark_applicants_agents),
-        ('upd_atty_art_t.tsv', import_trademark_attorney_articles),
-        ('upd_jiken_c_t.tsv', import_case_info),
-        ('upd_t_basic_item_art.tsv', import_trademark_basic_items),
-        ('upd_t_first_indct_div.tsv', import_trademark_first_display),
-        ('upd_mgt_info_t.tsv', import_trademark_management_info),
-        ('upd_t_updt_art.tsv', import_trademark_updates),
-        ('upd_prog_info_div_t.tsv', import_trademark_progress_info),
-        ('upd_mrgn_t_rwrt_app_num.tsv', import_trademark_rewrite_applications),
-        ('upd_trnsfr_rcpt_info_t.tsv', import_trademark_transfer_receipts),
-        ('upd_snpn_zkn.tsv', import_trademark_appeal_cases),
-        ('upd_snkt_bnri.tsv', import_trademark_decision_classifications),
-        ('upd_ig_mustt.tsv', import_trademark_oppositions),
-        ('upd_ig_ktti.tsv', import_trademark_opposition_decisions),
-        ('upd_jiken_c_t_kian_dv.tsv', import_trademark_draft_records),
-        ('upd_jiken_c_t_sinsei_dv.tsv', import_trademark_application_records),
-        ('upd_jiken_c_t_yusenken_joho.tsv', import_trademark_priority_claims),
-        ('upd_jiken_c_t_kohohako_joho.tsv', import_trademark_gazette_publications),
-        ('upd_appl_reg_info.tsv', import_applicant_registration_info),
-        ('upd_intl_t_org_org_reg_mgt_info.tsv', import_intl_trademark_registration),
-        ('upd_intl_t_org_prog_info.tsv', import_intl_trademark_progress),
-        ('upd_intl_t_org_set_crr_nm_addr.tsv', import_intl_trademark_holders),
-        ('upd_intl_t_org_set_dsgn_gds_srvc.tsv', import_intl_trademark_goods_services),
-        ('upd_intl_t_org_set_frst_indct.tsv', import_intl_trademark_first_indication),
-        ('upd_design_state_gvrnmnt_mstr_mk.tsv', import_design_state_gvrnmnt_mstr_mk),
-        ('upd_design_state_gvrnmnt_mstr_pri.tsv', import_design_state_gvrnmnt_mstr_pri),
-        ('upd_t_sample.tsv', import_trademark_images),
-        ('upd_sec_art.tsv', import_bougo_hyosho_articles),
-        ('upd_sec_goods_name.tsv', import_bougo_shohin_mei),
-        ('upd_sec_updt_art.tsv', import_bougo_koshin_kiji),
-        ('upd_t_add_info.tsv', import_shohyo_fuka_joho),
-    ]
-    
-    total_files = len(import_mappings)
-    for index, (tsv_filename, import_func) in enumerate(import_mappings, 1):
+def import_all_tables(conn, workers=None):
+    """全テーブルのインポート
+
+    Args:
+        conn: データベース接続
+        workers: TSV解析のワーカープロセス数（Noneの場合はCPU数、1の場合は順に取り込む）
+    """
+    if workers == 1:
+        import_all_tables_sequential(conn)
+        return
+
+    targets = []
+    custom = []
+    for tsv_filename, table in IMPORT_MAPPINGS:
+        tsv_path = TSV_DIR / tsv_filename
+        if not tsv_path.exists():
+            print(f"  Warning: {tsv_filename} not found, skipping...")
+        elif table in CUSTOM_IMPORTERS:
+            custom.append((tsv_path, table))
+        else:
+            targets.append((tsv_path, table))
+
+    print(f"\nImporting {len(targets)} files in parallel (workers: {workers or os.cpu_count()})...")
+    start_time = datetime.now()
+    import_tables_parallel(conn, targets, workers=workers)
+    elapsed = (datetime.now() - start_time).total_seconds()
+    print(f"  Completed in {elapsed:.2f} seconds")
+
+    # 専用のインポート関数は書き込み側で順に実行
+    for tsv_path, table in custom:
+        print(f"\nProcessing {tsv_path.name}...")
+        try:
+            start_time = datetime.now()
+            CUSTOM_IMPORTERS[table](conn, tsv_path)
+            elapsed = (datetime.now() - start_time).total_seconds()
+            print(f"  Completed in {elapsed:.2f} seconds")
+        except Exception as e:
+            print(f"  Error importing {tsv_path.name}: {e}")
+            import traceback
+            traceback.print_exc()
+
+def import_all_tables_sequential(conn):
+    """全テーブルのインポート（1ファイルずつ順に取り込む）"""
+    total_files = len(IMPORT_MAPPINGS)
+    for index, (tsv_filename, table) in enumerate(IMPORT_MAPPINGS, 1):
         tsv_path = TSV_DIR / tsv_filename
         print(f"\n[{index}/{total_files}] Processing {tsv_filename}...")
         if tsv_path.exists():
             try:
                 start_time = datetime.now()
-                import_func(conn, tsv_path)
+                if table in CUSTOM_IMPORTERS:
+                    CUSTOM_IMPORTERS[table](conn, tsv_path)
+                else:
+                    import_table(conn, table, tsv_path)
                 elapsed = (datetime.now() - start_time).total_seconds()
                 print(f"  Completed in {elapsed:.2f} seconds")
             except Exception as e:
@@ -1819,11 +1295,45 @@ def import_all_tables(conn):
         else:
             print(f"  Warning: {tsv_filename} not found, skipping...")
 
-def main():
-    print(f"Starting TMCloud import at {datetime.now()}")
+# ========== フルビルド（--fresh） ==========
+
+# フルビルド時のページキャッシュ（KiB単位）とメモリマップの上限
+FRESH_CACHE_SIZE_KB = 1024 * 1024
+FRESH_MMAP_SIZE = 8 * 1024 ** 3
+
+# スキーマSQLの二次インデックス（主キー・UNIQUE制約はテーブル定義側に残る）
+_CREATE_INDEX_RE = re.compile(r'^CREATE INDEX\b[^;]*;', re.MULTILINE)
+
+def split_schema_indexes(schema_sql):
+    """スキーマSQLを(テーブル定義, CREATE INDEX文のリスト)に分ける"""
+    indexes = _CREATE_INDEX_RE.findall(schema_sql)
+    return _CREATE_INDEX_RE.sub('', schema_sql), indexes
+
+def apply_fresh_pragmas(conn):
+    """新規DBへの一括投入用の設定（他の接続からは読めなくなる）"""
+    conn.execute("PRAGMA locking_mode = EXCLUSIVE")
+    conn.execute(f"PRAGMA cache_size = -{FRESH_CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size = {FRESH_MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+
+def build_deferred_indexes(conn, indexes):
+    """投入後にまとめてインデックスを作成（1件ずつ更新するよりソート1回で済む）"""
+    for sql in indexes:
+        start_time = datetime.now()
+        conn.execute(sql)
+        elapsed = (datetime.now() - start_time).total_seconds()
+        print(f"  {sql.split()[2]} ({elapsed:.2f} seconds)")
+    conn.commit()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='TMCloud TSVインポート（新しいデータベースを作成）')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='TSV解析のワーカープロセス数（default: CPU数、1: 順に取り込む）')
+    parser.add_argument('--fresh', action='store_true',
+                        help='フルビルド: インデックスは投入後にまとめて作成し、ANALYZEまで行う')
+    args = parser.parse_args(argv)
     
-    # シンプルなアプローチで新しいデータベースを作成
-    import os
+    print(f"Starting TMCloud import at {datetime.now()}")
     
     # タイムスタンプ付きの新しいデータベース名を使用
     db_name = f"tmcloud_v2_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
@@ -1837,15 +1347,22 @@ def main():
         conn.execute("PRAGMA synchronous = OFF")
         conn.execute("PRAGMA journal_mode = MEMORY")
         conn.execute("PRAGMA cache_size = 10000")
+        if args.fresh:
+            apply_fresh_pragmas(conn)
     except sqlite3.OperationalError as e:
         print(f"Error connecting to database: {e}")
         return
     
     # 2. テーブル作成（完全なスキーマ読み込み）
     print("Creating database schema...")
+    deferred_indexes = []
     try:
         with open('tmcloud_schema_v2.sql', 'r', encoding='utf-8') as f:
-            conn.executescript(f.read())
+            schema_sql = f.read()
+        if args.fresh:
+            # 二次インデックスは投入後に作成する
+            schema_sql, deferred_indexes = split_schema_indexes(schema_sql)
+        conn.executescript(schema_sql)
     except Exception as e:
         print(f"Error creating schema: {e}")
         conn.close()
@@ -1854,13 +1371,35 @@ def main():
     # 3. TSVファイルをインポート
     print("Importing TSV files...")
     try:
-        import_all_tables(conn)
+        import_all_tables(conn, workers=args.workers)
     except Exception as e:
         print(f"Error during import: {e}")
         conn.close()
         return
     
-    # 4. 完了
+    # 4. 検索用の派生カラム・インデックスを構築（スキーマバージョンを記録）
+    print("Building search indexes...")
+    try:
+        if deferred_indexes:
+            build_deferred_indexes(conn, deferred_indexes)
+        from tmcloud_migrate import migrate, stamp_build
+        migrate(conn)
+        if args.fresh:
+            print("Analyzing...")
+            conn.execute("ANALYZE")
+        stamp_build(conn, 'import')
+        conn.commit()
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        conn.close()
+        return
+    
+    # 5. 一覧表示用サムネイル（Pillowが無い環境ではスキップ）
+    print("Building thumbnails...")
+    from tmcloud_images import build_thumbnails
+    build_thumbnails(conn)
+    
+    # 6. 完了
     conn.close()
     print(f"Import completed at {datetime.now()}")
     print("完了！")
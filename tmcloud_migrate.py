@@ -0,0 +1,598 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TMCloud スキーマ移行ツール
+
+検索用の派生カラム・インデックス・FTSテーブルをオフラインで一度だけ構築し、
+tmcloud_metaテーブルにスキーマバージョンを記録する。
+検索側（TMCloudIntegratedSearch）は読み取り専用モードではDDLを一切実行せず、
+このバージョンの確認のみを行う。
+
+Usage:
+    python3 tmcloud_migrate.py [--db DBファイル]
+    ./tmcloud migrate [--db DBファイル]
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Iterator, List, Optional, Set, Tuple
+
+
+# メタ情報テーブル（key/value）
+META_TABLE = 'tmcloud_meta'
+
+# v1の派生カラムの計算式（v9でTextNormalizerによる値に計算し直す）
+SEARCH_USE_T_NORM_EXPR = "UPPER(REPLACE(REPLACE(search_use_t, ' ', ''), '　', ''))"
+PRONUNCIATION_NORM_EXPR = "pronunciation"
+
+
+# ========== メタ情報 ==========
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    """テーブル（仮想テーブル含む）の存在確認"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table,)
+    ).fetchone()
+    return row is not None
+
+
+def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    """カラムの存在確認"""
+    cols = {row[1] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+    return column in cols
+
+
+def get_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+    """メタ情報の取得（テーブルが無い場合はNone）"""
+    try:
+        row = conn.execute(f"SELECT value FROM {META_TABLE} WHERE key = ?", (key,)).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+def set_meta(conn: sqlite3.Connection, key: str, value: str):
+    """メタ情報の書き込み（コミットは呼び出し元で行う）"""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {META_TABLE} (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    """)
+    conn.execute(f"INSERT OR REPLACE INTO {META_TABLE} (key, value) VALUES (?, ?)", (key, str(value)))
+
+
+def read_schema_version(conn: sqlite3.Connection) -> int:
+    """DBに記録されたスキーマバージョン（未移行のDBは0）"""
+    value = get_meta(conn, 'schema_version')
+    return int(value) if value else 0
+
+
+def stamp_build(conn: sqlite3.Connection, source: str) -> str:
+    """DBの内容が変わるたびに新しいビルドIDを記録する（コミットは呼び出し元で行う）
+
+    Args:
+        source: 変更元（'import' / 'update:<TSVディレクトリ名>' など）
+
+    Returns:
+        ビルドID
+    """
+    build_id = datetime.now().strftime('%Y%m%d%H%M%S%f')
+    set_meta(conn, 'build_id', build_id)
+    set_meta(conn, 'build_source', source)
+    return build_id
+
+
+# ========== 移行ステップ ==========
+
+def _migrate_v1(conn: sqlite3.Connection):
+    """v1: 検索用正規化カラム・FTSテーブル・画像インデックス"""
+    cursor = conn.cursor()
+
+    # trademark_searchの_normカラム
+    if not _column_exists(conn, 'trademark_search', 'search_use_t_norm'):
+        cursor.execute("ALTER TABLE trademark_search ADD COLUMN search_use_t_norm TEXT")
+        # 既存データの正規化（簡易版）
+        cursor.execute(f"""
+            UPDATE trademark_search
+            SET search_use_t_norm = {SEARCH_USE_T_NORM_EXPR}
+            WHERE search_use_t_norm IS NULL
+        """)
+        print("  search_use_t_normカラムを追加しました")
+
+    # trademark_pronunciationsの_normカラム
+    if not _column_exists(conn, 'trademark_pronunciations', 'pronunciation_norm'):
+        cursor.execute("ALTER TABLE trademark_pronunciations ADD COLUMN pronunciation_norm TEXT")
+        # 既存データの正規化（簡易版）
+        cursor.execute(f"""
+            UPDATE trademark_pronunciations
+            SET pronunciation_norm = {PRONUNCIATION_NORM_EXPR}
+            WHERE pronunciation_norm IS NULL
+        """)
+        print("  pronunciation_normカラムを追加しました")
+
+    # 商標名FTSテーブル
+    if not _table_exists(conn, 'trademark_search_fts'):
+        cursor.execute("""
+            CREATE VIRTUAL TABLE trademark_search_fts
+            USING fts5(
+                search_use_t,
+                content='trademark_search',
+                content_rowid='rowid',
+                tokenize='unicode61'
+            )
+        """)
+        cursor.execute("""
+            INSERT INTO trademark_search_fts(rowid, search_use_t)
+            SELECT rowid, search_use_t FROM trademark_search WHERE search_use_t IS NOT NULL
+        """)
+        print("  trademark_search_ftsテーブルを作成しました")
+
+    # 画像取得用インデックス
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_trademark_images_app_num ON trademark_images(app_num)")
+
+
+# 統一フォーマットのファセット取得で出願番号から引くテーブル
+# （主キーの先頭がapp_numでないもの）: (テーブル, カラム)
+FACET_APP_NUM_INDEXES = [
+    ('trademark_case_info', 'app_num'),
+    ('trademark_management_info', 'app_num'),
+    ('trademark_basic_items', 'app_num'),
+    ('trademark_applicants_agents', 'app_num'),
+    ('trademark_right_holders', 'app_num'),
+    ('trademark_goods_services', 'app_num'),
+    ('trademark_draft_records', 'app_num'),
+    ('trademark_detailed_descriptions', 'app_num'),
+    ('trademark_appeal_cases', 'app_num'),
+    ('trademark_application_records', 'app_num'),
+    ('trademark_progress_info', 'progress_app_num'),
+    ('trial_cases', 'app_num'),
+]
+
+
+def _migrate_v2(conn: sqlite3.Connection):
+    """v2: ファセット取得用のapp_numインデックス"""
+    cursor = conn.cursor()
+    for table, column in FACET_APP_NUM_INDEXES:
+        # 審判系テーブルは存在しないDBもある
+        if not _table_exists(conn, table):
+            continue
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table}({column})")
+
+
+def _migrate_v3(conn: sqlite3.Connection):
+    """v3: 商標画像の主画像テーブル（デコード済みBLOB）"""
+    from tmcloud_images import IMAGE_PRIMARY_DDL, build_image_primary
+
+    conn.execute(IMAGE_PRIMARY_DDL)
+    # インポート時に作成済みの場合は作り直さない
+    if conn.execute("SELECT 1 FROM trademark_image_primary LIMIT 1").fetchone():
+        return
+    count = build_image_primary(conn)
+    print(f"  trademark_image_primaryに{count}件を格納しました")
+
+
+def _migrate_v4(conn: sqlite3.Connection):
+    """v4: 主画像テーブルのサムネイルカラム（生成は `tmcloud thumbnails`）"""
+    if not _column_exists(conn, 'trademark_image_primary', 'thumb'):
+        conn.execute("ALTER TABLE trademark_image_primary ADD COLUMN thumb BLOB")
+
+
+# Pythonの正規化関数で計算する_normカラム
+# (テーブル, 元カラム, 正規化カラム, TextNormalizerのメソッド名)
+NORM_COLUMNS = [
+    ('trademark_goods_services', 'goods_services_name', 'goods_services_name_norm', 'normalize_text_jp'),
+    ('trademark_detailed_descriptions', 'detailed_description', 'detailed_description_norm', 'normalize_text_jp'),
+    ('applicant_registration_info', 'applicant_name', 'applicant_name_norm', 'normalize_company_name'),
+    ('applicant_registration_info', 'applicant_address', 'applicant_address_norm', 'normalize_address'),
+    ('trademark_applicants_agents', 'applicant_agent_address', 'applicant_agent_address_norm', 'normalize_address'),
+]
+
+# 検索語と同じ正規化関数で計算する商標名・称呼の_normカラム（v1で追加）
+# (テーブル, 元カラム, 正規化カラム, TextNormalizerのメソッド名)
+SEARCH_NORM_COLUMNS = [
+    ('trademark_search', 'search_use_t', 'search_use_t_norm', 'normalize_trademark_name'),
+    ('trademark_pronunciations', 'pronunciation', 'pronunciation_norm', 'transduce_kana_for_pron'),
+]
+
+# 正規化カラムを計算・書き込む1回あたりの件数
+NORM_BATCH_SIZE = 5000
+
+
+def fill_derived_column(conn: sqlite3.Connection, table: str, column: str, derived_column: str,
+                        func: Callable[[List[str]], List[str]]) -> int:
+    """派生カラムの未計算（NULL）の行をPythonの関数で埋める（コミットは呼び出し元で行う）
+
+    作成済みの派生カラムのインデックスがあればNULLの行だけを読む。
+    funcはNORM_BATCH_SIZE件ずつの値のリストを受け取り、同じ順の派生値のリストを返す。
+
+    Returns:
+        書き込んだ件数
+    """
+    total = 0
+    last_rowid = 0
+    while True:
+        # 書き込みながら読まないよう、rowid順に区切って取得する
+        rows = conn.execute(f"""
+            SELECT rowid, {column} FROM {table}
+            WHERE {derived_column} IS NULL AND {column} IS NOT NULL AND rowid > ?
+            ORDER BY rowid
+            LIMIT ?
+        """, (last_rowid, NORM_BATCH_SIZE)).fetchall()
+        if not rows:
+            break
+        conn.executemany(f"UPDATE {table} SET {derived_column} = ? WHERE rowid = ?",
+                         zip(func([value for _, value in rows]), [rowid for rowid, _ in rows]))
+        last_rowid = rows[-1][0]
+        total += len(rows)
+    return total
+
+
+def refill_derived_column(conn: sqlite3.Connection, table: str, column: str, derived_column: str,
+                          func: Callable[[List[str]], List[str]]) -> int:
+    """派生カラムを全行計算し直し、値が変わった行だけ書き込む（コミットは呼び出し元で行う）
+
+    Returns:
+        書き換えた件数
+    """
+    total = 0
+    last_rowid = 0
+    while True:
+        rows = conn.execute(f"""
+            SELECT rowid, {column}, {derived_column} FROM {table}
+            WHERE {column} IS NOT NULL AND rowid > ?
+            ORDER BY rowid
+            LIMIT ?
+        """, (last_rowid, NORM_BATCH_SIZE)).fetchall()
+        if not rows:
+            break
+        values = func([value for _, value, _ in rows])
+        changed = [(value, rowid) for (rowid, _, old_value), value in zip(rows, values) if value != old_value]
+        conn.executemany(f"UPDATE {table} SET {derived_column} = ? WHERE rowid = ?", changed)
+        last_rowid = rows[-1][0]
+        total += len(changed)
+    return total
+
+
+def normalizer_batch(method: str) -> Callable[[List[str]], List[str]]:
+    """TextNormalizerのメソッド名から、値のリストを一括正規化する関数を作る"""
+    # 循環importを避けるため遅延import
+    from tmcloud_search_integrated import TextNormalizer
+
+    normalizer = getattr(TextNormalizer, method)
+    return lambda values: TextNormalizer.normalize_many(values, normalizer)
+
+
+def fill_norm_columns(conn: sqlite3.Connection) -> int:
+    """未計算（NULL）の_normカラムをTextNormalizerで埋める（コミットは呼び出し元で行う）
+
+    差分更新で置き換えた行は_normカラムがNULLに戻るため、同じ関数で埋め直す。
+
+    Returns:
+        書き込んだ件数
+    """
+    total = 0
+    for table, column, norm_column, method in SEARCH_NORM_COLUMNS + NORM_COLUMNS:
+        total += fill_derived_column(conn, table, column, norm_column, normalizer_batch(method))
+    return total
+
+
+def _migrate_v5(conn: sqlite3.Connection):
+    """v5: 商品・役務／詳細な説明／出願人名・住所の正規化カラム"""
+    for table, _, norm_column, _ in NORM_COLUMNS:
+        if not _column_exists(conn, table, norm_column):
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {norm_column} TEXT")
+
+    # インデックスは値を埋めてから作成する（商標名・称呼の_normカラムはv1・v9で計算する）
+    count = sum(fill_derived_column(conn, table, column, norm_column, normalizer_batch(method))
+                for table, column, norm_column, method in NORM_COLUMNS)
+    print(f"  正規化カラムに{count}件を格納しました")
+    for table, _, norm_column, _ in NORM_COLUMNS:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{norm_column} ON {table}({norm_column})")
+
+    # 出願人名から出願を引くための申請人コードのインデックス
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_trademark_applicants_agents_applicant_agent_code
+        ON trademark_applicants_agents(applicant_agent_code)
+    """)
+
+
+# 商標名の部分一致・後方一致用のtrigram FTS（search_use_t_normを3文字単位で索引）
+SEARCH_TRIGRAM_DDL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS trademark_search_trigram
+    USING fts5(
+        search_use_t_norm,
+        content='trademark_search',
+        content_rowid='rowid',
+        tokenize='trigram'
+    )
+"""
+
+# trigramで引けない短い検索語（1〜2文字）用のn-gram表
+SEARCH_NGRAM_DDL = """
+    CREATE TABLE IF NOT EXISTS trademark_search_ngram (
+        gram TEXT NOT NULL,                 -- search_use_t_normの1〜2文字の部分文字列
+        search_rowid INTEGER NOT NULL,      -- trademark_searchのrowid
+        PRIMARY KEY (gram, search_rowid)
+    ) WITHOUT ROWID
+"""
+
+# n-gram表に格納する部分文字列の最大文字数（3文字以上はtrigram FTSで引く）
+SHORT_NGRAM_MAX = 2
+
+
+def short_ngrams(text: str) -> Set[str]:
+    """1〜SHORT_NGRAM_MAX文字の部分文字列（重複なし）"""
+    grams = set()
+    for size in range(1, SHORT_NGRAM_MAX + 1):
+        grams.update(text[i:i + size] for i in range(len(text) - size + 1))
+    return grams
+
+
+def _search_ngram_rows(conn: sqlite3.Connection, app_num_table: str = None) -> Iterator[Tuple[str, int]]:
+    """trademark_searchの(部分文字列, rowid)を順に返す"""
+    where = f"AND app_num IN (SELECT app_num FROM temp.{app_num_table})" if app_num_table else ""
+    cursor = conn.execute(f"""
+        SELECT rowid, search_use_t_norm FROM trademark_search
+        WHERE search_use_t_norm IS NOT NULL {where}
+    """)
+    for rowid, text in cursor:
+        for gram in short_ngrams(text):
+            yield gram, rowid
+
+
+def insert_search_ngrams(conn: sqlite3.Connection, app_num_table: str = None) -> int:
+    """n-gram表に登録する（コミットは呼び出し元で行う）
+
+    Args:
+        conn: データベース接続
+        app_num_table: 対象の出願番号の一時テーブル名（Noneの場合は全件）
+
+    Returns:
+        登録した件数
+    """
+    cursor = conn.executemany("""
+        INSERT OR IGNORE INTO trademark_search_ngram (gram, search_rowid) VALUES (?, ?)
+    """, _search_ngram_rows(conn, app_num_table))
+    return cursor.rowcount
+
+
+def delete_search_ngrams(conn: sqlite3.Connection, app_num_table: str):
+    """n-gram表から対象の出願番号の行を削除する（現在のsearch_use_t_normから削除するキーを求める）"""
+    conn.executemany("""
+        DELETE FROM trademark_search_ngram WHERE gram = ? AND search_rowid = ?
+    """, _search_ngram_rows(conn, app_num_table))
+
+
+def _migrate_v6(conn: sqlite3.Connection):
+    """v6: 商標名の部分一致用インデックス（trigram FTS・n-gram表・正規化カラム）"""
+    # 短い検索語の完全一致・前方一致用
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_trademark_search_search_use_t_norm
+        ON trademark_search(search_use_t_norm)
+    """)
+
+    if not _table_exists(conn, 'trademark_search_trigram'):
+        conn.execute(SEARCH_TRIGRAM_DDL)
+        conn.execute("""
+            INSERT INTO trademark_search_trigram(rowid, search_use_t_norm)
+            SELECT rowid, search_use_t_norm FROM trademark_search WHERE search_use_t_norm IS NOT NULL
+        """)
+        print("  trademark_search_trigramテーブルを作成しました")
+
+    if not _table_exists(conn, 'trademark_search_ngram'):
+        conn.execute(SEARCH_NGRAM_DDL)
+        count = insert_search_ngrams(conn)
+        print(f"  trademark_search_ngramに{count}件を格納しました")
+
+
+# 称呼の部分一致用のtrigram FTS（pronunciation_normを3文字単位で索引）
+PRONUNCIATION_TRIGRAM_DDL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS trademark_pronunciation_trigram
+    USING fts5(
+        pronunciation_norm,
+        content='trademark_pronunciations',
+        content_rowid='rowid',
+        tokenize='trigram'
+    )
+"""
+
+
+def reverse_text(text: str) -> str:
+    """逆順の文字列（後方一致を逆順カラムの前方一致として引くため）"""
+    return text[::-1]
+
+
+def reverse_batch(values: List[str]) -> List[str]:
+    """値のリストをそれぞれ逆順にする"""
+    return [reverse_text(value) for value in values]
+
+
+def fill_pronunciation_rev(conn: sqlite3.Connection) -> int:
+    """称呼の逆順カラム（pronunciation_norm_rev）の未計算の行を埋める（コミットは呼び出し元で行う）"""
+    return fill_derived_column(conn, 'trademark_pronunciations', 'pronunciation_norm',
+                               'pronunciation_norm_rev', reverse_batch)
+
+
+def _migrate_v7(conn: sqlite3.Connection):
+    """v7: 称呼検索用インデックス（正規化カラム・逆順カラム・trigram FTS）"""
+    if not _column_exists(conn, 'trademark_pronunciations', 'pronunciation_norm_rev'):
+        conn.execute("ALTER TABLE trademark_pronunciations ADD COLUMN pronunciation_norm_rev TEXT")
+    count = fill_pronunciation_rev(conn)
+    print(f"  pronunciation_norm_revに{count}件を格納しました")
+
+    # 完全一致・前方一致は正規化カラム、後方一致は逆順カラムの範囲比較で引く
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_trademark_pronunciations_pronunciation_norm
+        ON trademark_pronunciations(pronunciation_norm)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_trademark_pronunciations_pronunciation_norm_rev
+        ON trademark_pronunciations(pronunciation_norm_rev)
+    """)
+
+    if not _table_exists(conn, 'trademark_pronunciation_trigram'):
+        conn.execute(PRONUNCIATION_TRIGRAM_DDL)
+        conn.execute("""
+            INSERT INTO trademark_pronunciation_trigram(rowid, pronunciation_norm)
+            SELECT rowid, pronunciation_norm FROM trademark_pronunciations WHERE pronunciation_norm IS NOT NULL
+        """)
+        print("  trademark_pronunciation_trigramテーブルを作成しました")
+
+
+# 類似群コードの転置インデックス（カンマ区切りのsimilar_group_codesを1コード1行に展開）
+# 主キーがcode・(code, app_num)の検索を兼ねる
+SIMILAR_GROUP_INDEX_DDL = """
+    CREATE TABLE IF NOT EXISTS trademark_similar_group_index (
+        code TEXT NOT NULL,                 -- 類似群コード（5文字、例："11C01"）
+        app_num TEXT NOT NULL,              -- 出願番号
+        class_num TEXT NOT NULL,            -- 類番号（01-45）
+        PRIMARY KEY (code, app_num, class_num)
+    ) WITHOUT ROWID
+"""
+
+
+def build_similar_group_index(conn: sqlite3.Connection, app_num_table: str = None) -> int:
+    """trademark_similar_group_codesから類似群コードの転置インデックスを作る（コミットは呼び出し元で行う）
+
+    Args:
+        conn: データベース接続
+        app_num_table: 対象の出願番号の一時テーブル名（Noneの場合は全件）。
+                       指定した出願番号の既存行は作り直す
+
+    Returns:
+        登録した件数
+    """
+    where = ""
+    if app_num_table:
+        conn.execute(f"""
+            DELETE FROM trademark_similar_group_index
+            WHERE app_num IN (SELECT app_num FROM temp.{app_num_table})
+        """)
+        where = f"AND app_num IN (SELECT app_num FROM temp.{app_num_table})"
+
+    cursor = conn.execute(f"""
+        SELECT app_num, class_num, similar_group_codes FROM trademark_similar_group_codes
+        WHERE app_num IS NOT NULL AND similar_group_codes IS NOT NULL {where}
+    """)
+    rows = (
+        (code, app_num, class_num)
+        for app_num, class_num, codes in cursor
+        for code in codes.split(',') if code
+    )
+    return conn.executemany("""
+        INSERT OR IGNORE INTO trademark_similar_group_index (code, app_num, class_num) VALUES (?, ?, ?)
+    """, rows).rowcount
+
+
+def _migrate_v8(conn: sqlite3.Connection):
+    """v8: 類似群コードの転置インデックス"""
+    if _table_exists(conn, 'trademark_similar_group_index'):
+        return
+    conn.execute(SIMILAR_GROUP_INDEX_DDL)
+    count = build_similar_group_index(conn)
+    # 差分更新で出願番号ごとに作り直すためのインデックス
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_trademark_similar_group_index_app_num
+        ON trademark_similar_group_index(app_num)
+    """)
+    print(f"  trademark_similar_group_indexに{count}件を格納しました")
+
+
+def _migrate_v9(conn: sqlite3.Connection):
+    """v9: 商標名・称呼の_normカラムをTextNormalizerで計算し直す（v8以前は簡易なSQL式で計算していた）"""
+    search_count = refill_derived_column(conn, 'trademark_search', 'search_use_t', 'search_use_t_norm',
+                                         normalizer_batch('normalize_trademark_name'))
+    print(f"  search_use_t_normを{search_count}件更新しました")
+    if search_count:
+        # 外部コンテンツのtrigram FTSとn-gram表は作り直す
+        conn.execute("INSERT INTO trademark_search_trigram(trademark_search_trigram) VALUES('rebuild')")
+        conn.execute("DELETE FROM trademark_search_ngram")
+        insert_search_ngrams(conn)
+
+    pron_count = refill_derived_column(conn, 'trademark_pronunciations', 'pronunciation', 'pronunciation_norm',
+                                       normalizer_batch('transduce_kana_for_pron'))
+    print(f"  pronunciation_normを{pron_count}件更新しました")
+    if pron_count:
+        refill_derived_column(conn, 'trademark_pronunciations', 'pronunciation_norm', 'pronunciation_norm_rev',
+                              reverse_batch)
+        conn.execute("INSERT INTO trademark_pronunciation_trigram(trademark_pronunciation_trigram) VALUES('rebuild')")
+
+
+# (バージョン, 説明, 移行関数) - 新しい移行は末尾に追加する
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, '検索用正規化カラム・FTSテーブル', _migrate_v1),
+    (2, 'ファセット取得用インデックス', _migrate_v2),
+    (3, '商標画像の主画像テーブル', _migrate_v3),
+    (4, 'サムネイルカラム', _migrate_v4),
+    (5, '商品・役務／出願人の正規化カラム', _migrate_v5),
+    (6, '商標名の部分一致インデックス', _migrate_v6),
+    (7, '称呼検索インデックス', _migrate_v7),
+    (8, '類似群コードの転置インデックス', _migrate_v8),
+    (9, '商標名・称呼の正規化カラムの再計算', _migrate_v9),
+]
+
+# 検索側が要求するスキーマバージョン
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """未適用の移行を順に実行する
+
+    各ステップはトランザクション内で実行し、成功したらバージョンを記録する。
+
+    Returns:
+        移行後のスキーマバージョン
+    """
+    current = read_schema_version(conn)
+    for version, description, func in MIGRATIONS:
+        if version <= current:
+            continue
+
+        print(f"[migrate] v{version}: {description}")
+        start_time = time.time()
+        try:
+            func(conn)
+            set_meta(conn, 'schema_version', version)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        current = version
+        print(f"  完了（{time.time() - start_time:.2f}秒）")
+
+    return current
+
+
+def main(argv: List[str] = None):
+    """CLIエントリポイント"""
+    # 循環importを避けるため遅延import
+    from tmcloud_search_integrated import default_db_path
+
+    parser = argparse.ArgumentParser(description='TMCloud スキーマ移行（派生カラム・インデックスの構築）')
+    parser.add_argument('--db', default=None,
+                        help='データベースファイル（省略時は最新のtmcloud_v2_*.db）')
+    args = parser.parse_args(argv)
+
+    db_path = args.db or default_db_path()
+    conn = sqlite3.connect(db_path)
+    try:
+        before = read_schema_version(conn)
+        if before >= SCHEMA_VERSION:
+            print(f"スキーマは最新です: {db_path} (v{before})")
+            return 0
+
+        print(f"スキーマ移行: {db_path} (v{before} → v{SCHEMA_VERSION})")
+        migrate(conn)
+        print("完了！")
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
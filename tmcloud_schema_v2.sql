@@ -663,6 +663,16 @@ CREATE TABLE trademark_images (
     PRIMARY KEY (doc_num, page_num, rec_seq_num, year_issue_code)
 );
 
+-- 商標主画像（出願番号ごとに最初のページをデコード済みJPEGで保持、tmcloud_images.py参照）
+CREATE TABLE trademark_image_primary (
+    app_num TEXT PRIMARY KEY,                        -- 出願番号（10桁）
+    mime TEXT,                                       -- MIMEタイプ（image/jpeg）
+    width INTEGER,                                   -- 画像の幅（ピクセル）
+    height INTEGER,                                  -- 画像の高さ（ピクセル）
+    jpeg BLOB,                                       -- 画像データ
+    thumb BLOB                                       -- サムネイル（最大辺200px）
+);
+
 CREATE TABLE bougo_hyosho_articles (
     processing_type TEXT,                          -- 処理種別（削除・修正等を示すコード）
     law_code TEXT NOT NULL,                        -- 四法コード（law_cd → law_code）
@@ -18,18 +18,75 @@ TMSONAR仕様準拠の統合検索システム
 
 import sqlite3
 import sys
+import base64
+import inspect
+import json
 import os
 import unicodedata
 import re
 import time
+import queue
+import threading
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import List, Tuple, Optional, Set, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 from enum import Enum
 
+from tmcloud_cache import MISS, default_record_cache, default_result_cache, result_cache_key
+
 
 # ========== 正規化ユーティリティ ==========
 
+def _compose_char_replacements(*stages) -> Dict[int, str]:
+    """1文字→文字列の置換の列を、順に適用した結果と同じstr.translateの変換表にまとめる
+
+    置換元がすべて1文字なので、置換元の各文字に全ての置換を順に適用した結果が
+    その文字の変換結果になる（前の置換の結果が後の置換元になる連鎖も含む）。
+
+    Args:
+        stages: (置換元の1文字, 置換先) の列。置換先が空文字列なら削除
+    """
+    replacements = [(old, new) for stage in stages for old, new in stage]
+    table = {}
+    for old, _ in replacements:
+        result = old
+        for step_old, step_new in replacements:
+            result = result.replace(step_old, step_new)
+        table[ord(old)] = result
+    return table
+
+
+# 称呼の変換器で、直前の文脈を変えない規則（長音記号の除去）の印
+PRON_KEEP_CONTEXT = object()
+
+
+def _compile_pron_rules(rules, small_kana, transparent_chars) -> Dict[str, Any]:
+    """称呼正規化の規則を最長一致用のトライにまとめる
+
+    各ノードのキー''に (出力, 直後の長音処理の文脈) を持つ。出力の小書き文字は
+    段階5で大文字化されるので、あらかじめ大文字にしておく。文脈は長音処理で
+    直前の文字として扱う文字で、Noneなら長音処理をしない。
+
+    Args:
+        rules: 段階2〜4の (置換元, 置換先) の列（置換先が空文字列なら削除）
+        small_kana: 段階5の小書き文字→大文字
+        transparent_chars: 削除しても直前の文脈を変えない文字（長音記号）
+    """
+    small_table = str.maketrans(small_kana)
+    entries = [(old, new.translate(small_table), new[-1:] or None) for old, new in rules]
+    entries += [(small, large, None) for small, large in small_kana.items()]
+    entries += [(char, '', PRON_KEEP_CONTEXT) for char in transparent_chars]
+    trie = {}
+    for old, output, context in entries:
+        node = trie
+        for char in old:
+            node = node.setdefault(char, {})
+        node[''] = (output, context)
+    return trie
+
+
 class TextNormalizer:
     """テキスト正規化ユーティリティ（TMSONAR準拠）"""
     
@@ -102,12 +159,67 @@ class TextNormalizer:
         'Å': 'A', 'Ø': 'O', 'Æ': 'AE', 'æ': 'ae', 'ø': 'o', 'å': 'a'
     }
     
+    # 長音・横線・ハイフン類（ハイフン（-）に統一）
+    HYPHEN_CHARS = '－—–―〜～‐ｰ'
+    
+    # 削除する特殊記号
+    SPECIAL_CHARS = '▲▼§￠＼∞'
+    
+    # 削除する句読点・中点・カンマ・クォート類（商標の場合は句点（。）を残す）
+    PUNCTUATION_CHARS = '、。・．，\'\"`'
+    TRADEMARK_PUNCTUATION_CHARS = '、・．，\'\"`'
+    
     # 会社種別（type-102でのみ除去）
     COMPANY_TYPES = [
         '株式会社', '有限会社', '合名会社', '合資会社', '合同会社', '保険相互会社',
         'カブシキガイシャ', 'ユウゲンガイシャ', 'ゴウメイガイシャ', 
         'ゴウシガイシャ', 'ゴウドウガイシャ', 'ホケンソウゴガイシャ'
     ]
+    COMPANY_TYPE_PATTERN = re.compile('|'.join(re.escape(company_type) for company_type in COMPANY_TYPES))
+    
+    # 変換表（normalize_text_jpの各段階の置換を1回のstr.translateにまとめたもの）
+    # NFKC前：ローマ数字→算用数字（商標用）
+    ROMAN_TABLE = str.maketrans(ROMAN_TO_ARABIC)
+    # 大文字化の後：ひらがな→カタカナ、ハイフン統一、ギリシャ文字等→アルファベット、
+    # 記号・句読点・スペース削除、旧字体→新字体（ひらがなは大文字化の影響を受けないので後に回せる）
+    _HIRAGANA_TO_KATAKANA = [(chr(code), chr(code - ord('ぁ') + ord('ァ'))) for code in range(ord('ぁ'), ord('ん') + 1)]
+    _FOLD_STAGES = [(char, '-') for char in HYPHEN_CHARS] + list(GREEK_LATIN_TO_ALPHABET.items()) + \
+        [(char, '') for char in SPECIAL_CHARS]
+    _SPACE_AND_KANJI_STAGES = [(' ', ''), ('　', '')] + list(OLD_TO_NEW_KANJI.items())
+    FOLD_TABLE = _compose_char_replacements(
+        _HIRAGANA_TO_KATAKANA, _FOLD_STAGES,
+        [(char, '') for char in PUNCTUATION_CHARS], _SPACE_AND_KANJI_STAGES)
+    TRADEMARK_FOLD_TABLE = _compose_char_replacements(
+        _HIRAGANA_TO_KATAKANA, _FOLD_STAGES,
+        [(char, '') for char in TRADEMARK_PUNCTUATION_CHARS], _SPACE_AND_KANJI_STAGES)
+    
+    # 称呼の正規化規則（TMSONAR準拠）。最長一致で適用するので、ヴェ→ベはヴ→ブより優先される
+    PRON_RULES = [
+        # 段階2: 発音同一
+        ('ヲ', 'オ'), ('ヂ', 'ジ'), ('ヅ', 'ズ'),
+        ('ヂャ', 'ジャ'), ('ヂュ', 'ジュ'), ('ヂョ', 'ジョ'),
+        # 段階3: 微差音統一
+        ('ヴァ', 'バ'), ('ヴィ', 'ビ'), ('ヴ', 'ブ'), ('ヴェ', 'ベ'), ('ヴォ', 'ボ'),
+        ('ツィ', 'チ'), ('テュ', 'チュ'), ('フュ', 'ヒュ'), ('ヴュ', 'ビュ'),
+        # 段階4: 促音の除去
+        ('ッ', ''),
+    ]
+    # 段階4: 長音記号（除去し、前後の母音は続いているものとして扱う）
+    PRON_LONG_VOWEL_MARKS = 'ー'
+    # 段階4: 母音連続の簡略化（直前の文字, 除去する母音）
+    PRON_LONG_VOWELS = {
+        ('エ', 'イ'), ('オ', 'ウ'),
+        ('ア', 'ア'), ('イ', 'イ'), ('ウ', 'ウ'), ('エ', 'エ'), ('オ', 'オ'),
+    }
+    # 段階5: 拗音大文字化（大文字化した母音は長音処理の対象にしない）
+    PRON_SMALL_KANA = {
+        'ャ': 'ヤ', 'ュ': 'ユ', 'ョ': 'ヨ',
+        'ァ': 'ア', 'ィ': 'イ', 'ゥ': 'ウ', 'ェ': 'エ', 'ォ': 'オ',
+    }
+    PRON_TRIE = _compile_pron_rules(PRON_RULES, PRON_SMALL_KANA, PRON_LONG_VOWEL_MARKS)
+    
+    # 検索語側の称呼正規化のメモの件数
+    PRON_MEMO_SIZE = 65536
     
     @classmethod
     def normalize_text_jp(cls, text: str, for_trademark: bool = False) -> str:
@@ -125,118 +237,112 @@ class TextNormalizer:
         
         # 商標用：ローマ数字→算用数字（NFKC前に実行！）
         if for_trademark:
-            for roman, arabic in cls.ROMAN_TO_ARABIC.items():
-                text = text.replace(roman, arabic)
+            text = text.translate(cls.ROMAN_TABLE)
         
         # NFKC正規化
         text = unicodedata.normalize('NFKC', text)
         
-        # ひらがな→カタカナ変換
-        result = []
-        for char in text:
-            if 'ぁ' <= char <= 'ん':
-                result.append(chr(ord(char) - ord('ぁ') + ord('ァ')))
-            else:
-                result.append(char)
-        text = ''.join(result)
-        
-        # 英小文字→大文字、カナ小文字→大文字
+        # 英小文字→大文字
         text = text.upper()
         
-        # 長音・横線・ハイフン類をハイフン（-）に統一
-        hyphens = '－—–―〜～‐ｰ'
-        for h in hyphens:
-            text = text.replace(h, '-')
-        
-        # ギリシャ文字・ラテン文字異体→アルファベット
-        for old, new in cls.GREEK_LATIN_TO_ALPHABET.items():
-            text = text.replace(old, new)
-        
-        # 特殊記号削除（▲▼§￠＼∞）
-        special_chars = '▲▼§￠＼∞'
-        for char in special_chars:
-            text = text.replace(char, '')
-        
-        # 句読点・中点・カンマ・クォート類削除
-        # ただし商標の場合、句点（。）と括弧類《》【】『』は残す
-        if for_trademark:
-            remove_chars = '、・．，\'\"`'
-        else:
-            remove_chars = '、。・．，\'\"`'
-        
-        for char in remove_chars:
-            text = text.replace(char, '')
+        # ひらがな→カタカナ、ハイフン統一、ギリシャ文字等→アルファベット、
+        # 特殊記号・句読点（商標の場合は句点（。）と括弧類《》【】『』を残す）・スペース削除、
+        # 旧字体→新字体を1回の変換表で行う
+        return text.translate(cls.TRADEMARK_FOLD_TABLE if for_trademark else cls.FOLD_TABLE)
+    
+    @classmethod
+    def normalize_trademark_name(cls, text: str) -> str:
+        """商標名の正規化（search_use_t_norm・商標名の検索語用）"""
+        return cls.normalize_text_jp(text, for_trademark=True)
+    
+    @classmethod
+    def normalize_many(cls, texts: List[str], normalizer: Callable[[str], str] = None) -> List[str]:
+        """複数テキストの一括正規化（インポート・移行用）
         
-        # スペース削除
-        text = text.replace(' ', '').replace('　', '')
+        同じ値は一度だけ正規化する（商品・役務名や出願人名は同じ値が多い）。
         
-        # 旧字体→新字体変換
-        for old, new in cls.OLD_TO_NEW_KANJI.items():
-            text = text.replace(old, new)
+        Args:
+            texts: 入力テキストのリスト
+            normalizer: 正規化関数（既定はnormalize_text_jp）
         
-        return text
+        Returns:
+            入力と同じ順の正規化されたテキスト
+        """
+        normalizer = normalizer or cls.normalize_text_jp
+        normalized = {text: normalizer(text) for text in set(texts)}
+        return [normalized[text] for text in texts]
     
-    @classmethod
-    def normalize_kana_for_pron(cls, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=PRON_MEMO_SIZE)
+    def normalize_kana_for_pron(text: str) -> str:
         """称呼用カナ正規化（TMSONAR準拠5段階処理）
         
+        検索語側で同じ称呼を繰り返し正規化するので結果をメモ化する。
+        インポート・移行ではnormalize_pron_manyを使う。
+        
         Args:
             text: 入力テキスト（カナ）
         
         Returns:
             正規化された称呼
         """
+        return TextNormalizer.transduce_kana_for_pron(text)
+    
+    @classmethod
+    def normalize_pron_many(cls, texts: List[str]) -> List[str]:
+        """複数の称呼の一括正規化（インポート・移行用。メモを使わない）"""
+        return cls.normalize_many(texts, cls.transduce_kana_for_pron)
+    
+    @classmethod
+    def transduce_kana_for_pron(cls, text: str) -> str:
+        """称呼用カナ正規化の本体
+        
+        段階1（カタカナ化・大文字化）の後、段階2〜5の規則をトライの最長一致で
+        左から1回の走査で適用する。長音処理は出力した直前の文字を見て行う。
+        """
         if not text:
             return text
         
-        # 基本正規化（カタカナ化・大文字化）
+        # 段階1: 基本正規化（カタカナ化・大文字化）
         text = cls.normalize_text_jp(text)
         
-        # 段階2: 発音同一
-        text = text.replace('ヲ', 'オ')
-        text = text.replace('ヂ', 'ジ')
-        text = text.replace('ヅ', 'ズ')
-        text = text.replace('ヂャ', 'ジャ')
-        text = text.replace('ヂュ', 'ジュ')
-        text = text.replace('ヂョ', 'ジョ')
-        
-        # 段階3: 微差音統一
-        text = text.replace('ヴァ', 'バ')
-        text = text.replace('ヴィ', 'ビ')
-        text = text.replace('ヴ', 'ブ')
-        text = text.replace('ヴェ', 'ベ')
-        text = text.replace('ヴォ', 'ボ')
-        text = text.replace('ツィ', 'チ')
-        text = text.replace('テュ', 'チュ')
-        text = text.replace('フュ', 'ヒュ')
-        text = text.replace('ヴュ', 'ビュ')
-        
-        # 段階4: 長音処理
-        # 長音記号除去
-        text = text.replace('ー', '')
-        
-        # エイ→エー→エ、オウ→オー→オなどの処理
-        # 母音連続の簡略化
-        text = text.replace('エイ', 'エ')
-        text = text.replace('オウ', 'オ')
-        text = text.replace('アア', 'ア')
-        text = text.replace('イイ', 'イ')
-        text = text.replace('ウウ', 'ウ')
-        text = text.replace('エエ', 'エ')
-        text = text.replace('オオ', 'オ')
-        
-        # 促音の除去
-        text = text.replace('ッ', '')
-        
-        # 段階5: 拗音大文字化（最後に実行）
-        replacements = [
-            ('ャ', 'ヤ'), ('ュ', 'ユ'), ('ョ', 'ヨ'),
-            ('ァ', 'ア'), ('ィ', 'イ'), ('ゥ', 'ウ'), ('ェ', 'エ'), ('ォ', 'オ'),
-        ]
-        for small, large in replacements:
-            text = text.replace(small, large)
+        trie = cls.PRON_TRIE
+        long_vowels = cls.PRON_LONG_VOWELS
+        output = []
+        previous = None
+        position = 0
+        length = len(text)
+        while position < length:
+            # 最長一致する規則を探す
+            node = trie
+            match = None
+            end = position
+            while end < length:
+                node = node.get(text[end])
+                if node is None:
+                    break
+                end += 1
+                if '' in node:
+                    match = (end, node[''])
+            
+            if match is None:
+                char = text[position]
+                position += 1
+                if (previous, char) in long_vowels:
+                    continue
+                output.append(char)
+                previous = char
+                continue
+            
+            position, (replacement, context) = match
+            if context is PRON_KEEP_CONTEXT:
+                continue
+            if context is not None and (previous, replacement) in long_vowels:
+                continue
+            output.append(replacement)
+            previous = context
         
-        return text
+        return ''.join(output)
     
     @classmethod
     def normalize_company_name(cls, text: str) -> str:
@@ -244,10 +350,7 @@ class TextNormalizer:
         text = cls.normalize_text_jp(text)
         
         # 会社種別除去
-        for company_type in cls.COMPANY_TYPES:
-            text = text.replace(company_type, '')
-        
-        return text
+        return cls.COMPANY_TYPE_PATTERN.sub('', text)
     
     @classmethod
     def normalize_address(cls, text: str) -> str:
@@ -277,6 +380,10 @@ class TextNormalizer:
 
 # ========== パースユーティリティ ==========
 
+# 前方一致を範囲比較（>= p AND < p + PREFIX_RANGE_END）にするときの上限文字
+PREFIX_RANGE_END = '\U0010FFFF'
+
+
 class QueryParser:
     """クエリパースユーティリティ"""
     
@@ -323,6 +430,62 @@ class QueryParser:
         
         return pattern
     
+    @staticmethod
+    def normalize_wildcard_term(term: str, normalize=None) -> Tuple[bool, str, bool]:
+        """前後の？を除いて検索語を正規化する
+        
+        Args:
+            term: 検索語（ワイルドカード付き）
+            normalize: 正規化関数（Noneの場合は除いた文字列のまま）
+        
+        Returns:
+            (先頭の？の有無, 正規化した文字列, 末尾の？の有無)
+        """
+        has_prefix_wildcard = term.startswith(('？', '?'))
+        has_suffix_wildcard = len(term) > 1 and term.endswith(('？', '?'))
+        
+        clean_term = term
+        if has_prefix_wildcard:
+            clean_term = clean_term[1:]
+        if has_suffix_wildcard:
+            clean_term = clean_term[:-1]
+        normalized = (normalize(clean_term) if normalize else clean_term) or ''
+        return has_prefix_wildcard, normalized, has_suffix_wildcard
+    
+    @staticmethod
+    def norm_match(column: str, term: str, normalize=None) -> Tuple[str, List[str]]:
+        """正規化カラム（_norm）との比較条件
+
+        前後の？で前方一致・後方一致・部分一致を指定する。検索語をカラムと同じ
+        関数で正規化し、格納済みの値とそのまま比較する（行ごとの関数評価なし）。
+        完全一致は =、前方一致は範囲比較にしてインデックスを使う。
+
+        Args:
+            column: 正規化カラム（例: 'tgs.goods_services_name_norm'）
+            term: 検索語（ワイルドカード付き）
+            normalize: 正規化関数（TextNormalizerのメソッド、Noneの場合は正規化済みの検索語）
+
+        Returns:
+            (WHERE句の条件, パラメータ)
+        """
+        has_prefix_wildcard, normalized, has_suffix_wildcard = QueryParser.normalize_wildcard_term(term, normalize)
+
+        # 後方・部分一致、途中に？を含む場合はLIKE
+        if has_prefix_wildcard or '?' in normalized:
+            pattern = QueryParser.wildcard_like(normalized)
+            if has_prefix_wildcard:
+                pattern = '%' + pattern
+            if has_suffix_wildcard:
+                pattern += '%'
+            return f"{column} LIKE ? ESCAPE '\\'", [pattern]
+
+        # xxx？ → 前方一致（xxx以上、xxxの直後未満）
+        if has_suffix_wildcard:
+            return f"({column} >= ? AND {column} < ?)", [normalized, normalized + PREFIX_RANGE_END]
+
+        # xxx → 完全一致
+        return f"{column} = ?", [normalized]
+
     @staticmethod
     def wildcard_fts(term: str) -> str:
         """FTS用ワイルドカード変換"""
@@ -477,6 +640,125 @@ class SearchType(Enum):
     INFO_PROVISION_COUNT = "info_provision_count"      # ID135: 情報提供数検索
     BROWSING_REQUEST_COUNT = "browsing_request_count"  # ID136: 閲覧請求数検索
 
+
+# ========== 複合検索のビットマップ ==========
+# 複合検索では各条件に一致する出願をtrademark_case_infoのrowidをビット位置とする
+# ビットマップ（Pythonの整数）で表し、AND/ORを整数のビット演算で行う
+
+# 複合検索の結果がこの件数以下なら出願番号を直接引き、超える場合は出願日順に走査して絞り込む
+COMPLEX_DIRECT_FETCH_LIMIT = 20000
+
+# AND条件の途中結果がこの件数以下なら、残りの条件はその出願番号に限って引く（準結合）
+COMPLEX_SEMI_JOIN_LIMIT = 20000
+
+
+def bitmap_from_rowids(rowids, max_rowid: int) -> int:
+    """rowidの列からビットマップを作る（max_rowidを超えるrowidは無視）"""
+    bits = bytearray((max_rowid >> 3) + 1)
+    for rowid in rowids:
+        if rowid <= max_rowid:
+            bits[rowid >> 3] |= 1 << (rowid & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def bitmap_count(bitmap: int) -> int:
+    """ビットマップの件数"""
+    return bin(bitmap).count('1')
+
+
+def bitmap_rowids(bitmap: int) -> List[int]:
+    """ビットマップのrowid（昇順）"""
+    rowids = []
+    for index, byte in enumerate(bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little')):
+        if byte:
+            base = index << 3
+            rowids.extend(base + bit for bit in range(8) if byte >> bit & 1)
+    return rowids
+
+
+# 稼働中のDBを指すマニフェスト（`tmcloud activate` で原子的に差し替える）
+CURRENT_MANIFEST = 'tmcloud_current.json'
+
+
+def read_current_manifest(base_dir='.') -> Optional[Dict[str, Any]]:
+    """マニフェストの読み込み（無い場合はNone）
+
+    Returns:
+        {'db': DBファイルの絶対パス, 'build_id': ..., 'activated_at': ...}
+    """
+    manifest_path = Path(base_dir) / CURRENT_MANIFEST
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    # DBのパスはマニフェストからの相対パスでもよい
+    manifest['db'] = str((manifest_path.parent / manifest['db']).resolve())
+    return manifest
+
+
+def default_db_path(base_dir='.') -> str:
+    """稼働中のDBを返す（マニフェストが無い場合はbase_dirの最新のtmcloud_v2_*.db）"""
+    manifest = read_current_manifest(base_dir)
+    if manifest is not None:
+        return manifest['db']
+    db_files = sorted(Path(base_dir).glob('tmcloud_v2_*.db'))
+    if not db_files:
+        raise FileNotFoundError("データベースファイルが見つかりません")
+    return str(db_files[-1])
+
+
+def cached_search(func=None, *, normalize_term=None):
+    """検索メソッドの結果を検索結果キャッシュ（tmcloud_cache）に保持するデコレータ
+
+    キーはメソッド名と、既定値を補って引数名で並べた引数。DBのビルドIDが
+    変わると（週次更新・再インポート）以前の結果は使われない。
+
+    normalize_termを指定した場合、keywordsはQueryParser.split_termsで分割し、
+    各検索語をメソッドと同じ正規化をした値でキーにする（表記ゆれの違う同じ検索で
+    結果を共有する）。キャッシュから返す結果のsearch_termは呼び出し時のkeywordsに置き換える。
+
+    使用例:
+        @cached_search(normalize_term=TextNormalizer.normalize_trademark_name)
+        def search_trademark_name(self, keywords, ...):
+    """
+    if func is None:
+        return lambda func: cached_search(func, normalize_term=normalize_term)
+    
+    signature = inspect.signature(func)
+    
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = self.result_cache
+        if cache is None:
+            return func(self, *args, **kwargs)
+        
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        del arguments['self']
+        keywords = arguments.get('keywords')
+        if normalize_term is not None and isinstance(keywords, str):
+            terms = QueryParser.split_terms(keywords)
+            # 全指定（?・？）は文字列のまま、検索語が?に正規化される場合と区別する
+            arguments['keywords'] = '?' if terms == ['?'] else [normalize_term(term) for term in terms]
+        key = result_cache_key(func.__name__, arguments)
+        build_id = self._current_build_id()
+        
+        results = cache.get(build_id, key)
+        if results is MISS:
+            results = func(self, *args, **kwargs)
+            cache.put(build_id, key, results)
+        elif normalize_term is not None and isinstance(results, list):
+            for result in results:
+                specific = result.get('search_specific') if isinstance(result, dict) else None
+                if specific and 'search_term' in specific:
+                    specific['search_term'] = keywords
+        return results
+    
+    return wrapper
+
+
 class TMCloudIntegratedSearch:
     """統合検索クラス"""
     
@@ -4064,17 +4346,32 @@ class TMCloudIntegratedSearch:
     
     # 中間記録コードマップは上記で定義済み（497行目～）
     
-    def __init__(self, db_path: str = None):
-        """初期化"""
+    def __init__(self, db_path: str = None, check_same_thread: bool = True, read_only: bool = False,
+                 use_result_cache: bool = True, use_record_cache: bool = True):
+        """初期化
+
+        Args:
+            db_path: データベースファイルのパス（省略時は最新のtmcloud_v2_*.db）
+            check_same_thread: Falseの場合、作成スレッド以外からの利用を許可する
+                               （TMCloudSearchPoolでのチェックアウト利用向け）
+            read_only: Trueの場合、mode=roで接続する。いずれの場合もDDLは実行せず
+                       スキーマバージョンの確認のみを行うため、事前に
+                       `tmcloud migrate` で移行済みのDBが必要
+            use_result_cache: Falseの場合、検索結果キャッシュを使わない
+                              （Trueの場合はプロセス全体で共有するキャッシュを使う）
+            use_record_cache: Falseの場合、統一フォーマットのレコードキャッシュを使わない
+        """
         if db_path is None:
-            # デフォルトのデータベースパスを探す
-            db_files = sorted(Path('.').glob('tmcloud_v2_*.db'))
-            if db_files:
-                db_path = str(db_files[-1])
-            else:
-                raise FileNotFoundError("データベースファイルが見つかりません")
+            db_path = default_db_path()
         
         self.db_path = db_path
+        self.check_same_thread = check_same_thread
+        self.read_only = read_only
+        self.result_cache = default_result_cache() if use_result_cache else None
+        self.record_cache = default_record_cache() if use_record_cache else None
+        # ビルドIDと、それを読んだときのPRAGMA data_version（他の接続の書き込みで変わる）
+        self._build_id = None
+        self._data_version = None
         self.conn = None
         self.connect()
         
@@ -4084,93 +4381,74 @@ class TMCloudIntegratedSearch:
     def connect(self):
         """データベース接続"""
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            if self.read_only:
+                # 存在しないファイルを新規作成しないようURI指定で開く
+                uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+                self.conn = sqlite3.connect(uri, uri=True, check_same_thread=self.check_same_thread)
+            else:
+                self.conn = sqlite3.connect(self.db_path, check_same_thread=self.check_same_thread)
             self.conn.row_factory = sqlite3.Row  # 結果を辞書形式で取得
             
-            # パフォーマンス設定
-            self.conn.execute("PRAGMA journal_mode=WAL")
-            self.conn.execute("PRAGMA synchronous=NORMAL")
+            # パフォーマンス設定（journal_mode/synchronousは書き込み接続のみ）
+            if not self.read_only:
+                self.conn.execute("PRAGMA journal_mode=WAL")
+                self.conn.execute("PRAGMA synchronous=NORMAL")
             self.conn.execute("PRAGMA temp_store=MEMORY")
             self.conn.execute("PRAGMA cache_size=-1048576")  # 1GB cache
             
-            # 必要なカラムとFTSテーブルの存在確認・作成
+            # スキーマバージョンの確認（移行はtmcloud_migrateで行う）
             self._ensure_required_columns_and_tables()
             
             print(f"データベース接続成功: {self.db_path}")
         except Exception as e:
             print(f"データベース接続エラー: {e}")
+            if self.read_only:
+                # プール等の呼び出し元で扱えるよう例外のまま返す
+                if self.conn is not None:
+                    self.conn.close()
+                    self.conn = None
+                raise
             sys.exit(1)
     
     def _ensure_required_columns_and_tables(self):
-        """必要なカラムとFTSテーブルの存在確認・作成"""
-        cursor = self.conn.cursor()
-        
-        # trademark_searchの_normカラム確認・追加
-        cursor.execute("PRAGMA table_info(trademark_search)")
-        cols = {row[1] for row in cursor.fetchall()}
-        if 'search_use_t_norm' not in cols:
-            try:
-                cursor.execute("ALTER TABLE trademark_search ADD COLUMN search_use_t_norm TEXT")
-                # 既存データの正規化（簡易版）
-                cursor.execute("""
-                    UPDATE trademark_search 
-                    SET search_use_t_norm = UPPER(REPLACE(REPLACE(search_use_t, ' ', ''), '　', ''))
-                    WHERE search_use_t_norm IS NULL
-                """)
-                self.conn.commit()
-                print("search_use_t_normカラムを追加しました")
-            except sqlite3.OperationalError:
-                pass  # 既に存在する場合
-        
-        # trademark_pronunciationsの_normカラム確認・追加
-        cursor.execute("PRAGMA table_info(trademark_pronunciations)")
-        cols = {row[1] for row in cursor.fetchall()}
-        if 'pronunciation_norm' not in cols:
-            try:
-                cursor.execute("ALTER TABLE trademark_pronunciations ADD COLUMN pronunciation_norm TEXT")
-                # 既存データの正規化（簡易版）
-                cursor.execute("""
-                    UPDATE trademark_pronunciations 
-                    SET pronunciation_norm = pronunciation
-                    WHERE pronunciation_norm IS NULL
-                """)
-                self.conn.commit()
-                print("pronunciation_normカラムを追加しました")
-            except sqlite3.OperationalError:
-                pass  # 既に存在する場合
-        
-        # FTSテーブルの確認・作成
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='trademark_search_fts'")
-        if not cursor.fetchone():
-            try:
-                cursor.execute("""
-                    CREATE VIRTUAL TABLE trademark_search_fts
-                    USING fts5(
-                        search_use_t,
-                        content='trademark_search',
-                        content_rowid='rowid',
-                        tokenize='unicode61'
-                    )
-                """)
-                # 初回データ同期
-                cursor.execute("""
-                    INSERT INTO trademark_search_fts(rowid, search_use_t)
-                    SELECT rowid, search_use_t FROM trademark_search WHERE search_use_t IS NOT NULL
-                """)
-                self.conn.commit()
-                print("trademark_search_ftsテーブルを作成しました")
-            except sqlite3.OperationalError as e:
-                print(f"FTSテーブル作成エラー: {e}")
+        """スキーマバージョンの確認
+
+        派生カラム・FTSテーブル・インデックスの構築はtmcloud_migrateに分離した。
+        書き込み接続でもバージョンの照合のみを行い、古い場合は例外とする
+        （移行は全件の再計算を含むため、検索の初回に書き込みロックを取らない）。
+        """
+        # 循環importを避けるため遅延import
+        import tmcloud_migrate
+        
+        version = tmcloud_migrate.read_schema_version(self.conn)
+        if version < tmcloud_migrate.SCHEMA_VERSION:
+            raise RuntimeError(
+                f"スキーマバージョンが古いです（v{version} < v{tmcloud_migrate.SCHEMA_VERSION}）。"
+                f"先に `./tmcloud migrate --db {self.db_path}` を実行してください"
+            )
         
         # trademark_draft_recordsテーブルの確認
+        cursor = self.conn.cursor()
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='trademark_draft_records'")
         if not cursor.fetchone():
             # テーブルが存在しない場合は警告を出す
             print("警告: trademark_draft_recordsテーブルが存在しません。拒絶条文・中間記録検索は利用できません。")
     
+    def _current_build_id(self) -> Optional[str]:
+        """DBのビルドID（週次更新で同じDBが書き換えられた場合は読み直す）"""
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            # 循環importを避けるため遅延import
+            from tmcloud_migrate import get_meta
+            
+            self._build_id = get_meta(self.conn, 'build_id')
+            self._data_version = data_version
+        return self._build_id
+    
     # ========== 商標名検索（FTS5） ==========
     
-    def search_trademark_name(self, keywords: str, limit: int = 100, unified_format: bool = True) -> List[Dict[str, Any]]:
+    @cached_search(normalize_term=TextNormalizer.normalize_trademark_name)
+    def search_trademark_name(self, keywords: str, limit: int = 100, unified_format: bool = True, fields='full') -> List[Dict[str, Any]]:
         """商標名検索（TMSONAR準拠）
         
         Args:
@@ -4190,18 +4468,15 @@ class TMCloudIntegratedSearch:
         
         results = []
         for term in terms:
-            # 正規化
-            normalized = TextNormalizer.normalize_text_jp(term, for_trademark=True)
+            # 正規化（search_use_t_normと同じ関数）
+            normalized = TextNormalizer.normalize_trademark_name(term)
             
-            if len(normalized) < 2:
-                # 2文字未満はLIKE検索
-                results.extend(self._search_trademark_like(normalized, limit))
-            elif len(normalized) < 3:
-                # 2文字はLIKE検索（trigramでは効果が薄い）
-                results.extend(self._search_trademark_like(normalized, limit))
+            if normalized.startswith('?') or '?' in normalized[1:-1]:
+                # 後方一致・部分一致はtrigram FTS／n-gram表で候補を絞る
+                results.extend(self._search_trademark_substring(normalized, limit))
             else:
-                # 3文字以上はFTS検索
-                results.extend(self._search_trademark_fts(normalized, limit))
+                # 完全一致・前方一致は正規化カラムのインデックス
+                results.extend(self._search_trademark_like(normalized, limit))
         
         # 重複除去
         seen = set()
@@ -4221,47 +4496,17 @@ class TMCloudIntegratedSearch:
                     'search_term': keywords
                 } for r in unique_results[:limit]
             }
-            return self._format_unified_result(app_nums, search_specific)
+            return self._format_unified_result(app_nums, search_specific, fields=fields)
         
         return unique_results[:limit]
         
     
-    def _create_like_pattern(self, term: str) -> str:
-        """ワイルドカードの位置に基づいてLIKEパターンを生成"""
-        # ワイルドカード文字の判定
-        has_prefix_wildcard = term.startswith('？') or term.startswith('?')
-        has_suffix_wildcard = term.endswith('？') or term.endswith('?')
-        
-        # ワイルドカードを除去して実際の検索語を取得
-        clean_term = term
-        if has_prefix_wildcard:
-            clean_term = clean_term[1:]
-        if has_suffix_wildcard:
-            clean_term = clean_term[:-1]
-        
-        # エスケープ処理
-        escaped_term = QueryParser.wildcard_like(clean_term)
-        
-        # パターン生成
-        if has_prefix_wildcard and has_suffix_wildcard:
-            # ？xxx？ → 部分一致
-            return f"%{escaped_term}%"
-        elif has_suffix_wildcard:
-            # xxx？ → 前方一致
-            return f"{escaped_term}%"
-        elif has_prefix_wildcard:
-            # ？xxx → 後方一致
-            return f"%{escaped_term}"
-        else:
-            # xxx → 完全一致
-            return escaped_term
-    
     def _search_trademark_like(self, term: str, limit: int) -> List[Dict[str, Any]]:
-        """商標名LIKE検索"""
-        pattern = self._create_like_pattern(term)
+        """商標名の正規化カラム検索（完全一致・前方一致はインデックスを使用）"""
+        condition, params = QueryParser.norm_match('ts.search_use_t_norm', term)
         cursor = self.conn.cursor()
         
-        query = """
+        query = f"""
             SELECT 
                 ts.app_num,
                 tci.reg_article_reg_num as reg_num,
@@ -4280,49 +4525,27 @@ class TMCloudIntegratedSearch:
             INNER JOIN trademark_case_info tci ON ts.app_num = tci.app_num
             LEFT JOIN trademark_display td ON tci.app_num = td.app_num
             LEFT JOIN trademark_standard_char tsc ON tci.app_num = tsc.app_num
-            WHERE ts.search_use_t_norm LIKE ? ESCAPE '\\'
+            WHERE {condition}
             ORDER BY tci.app_date DESC
             LIMIT ?
         """
         
-        cursor.execute(query, (pattern, limit))
+        cursor.execute(query, params + [limit])
         return [dict(row) for row in cursor.fetchall()]
     
-    def _create_fts_pattern(self, term: str) -> str:
-        """ワイルドカードの位置に基づいてFTSパターンを生成"""
-        # ワイルドカード文字の判定
-        has_prefix_wildcard = term.startswith('？') or term.startswith('?')
-        has_suffix_wildcard = term.endswith('？') or term.endswith('?')
-        
-        # ワイルドカードを除去して実際の検索語を取得
-        clean_term = term
-        if has_prefix_wildcard:
-            clean_term = clean_term[1:]
-        if has_suffix_wildcard:
-            clean_term = clean_term[:-1]
+    def _search_trademark_substring(self, term: str, limit: int) -> List[Dict[str, Any]]:
+        """商標名の後方一致・部分一致検索（正規化済みの検索語、？はワイルドカード）
+
+        ？で区切った文字列のうち3文字以上のものはtrigram FTSで、すべて2文字以下の
+        場合は最長のものをn-gram表で引いて候補を絞り、正規化カラムのLIKEで
+        ワイルドカードの位置を確認する。
+        """
+        if not any(term.split('?')):
+            return self._get_all_trademarks(limit)
+        source, condition, params = self._trademark_substring_match(term)
         
-        # FTSパターン生成
-        if has_prefix_wildcard and has_suffix_wildcard:
-            # ？xxx？ → 部分一致（*xxx*）
-            return f"*{clean_term}*"
-        elif has_suffix_wildcard:
-            # xxx？ → 前方一致（xxx*）
-            return f"{clean_term}*"
-        elif has_prefix_wildcard:
-            # ？xxx → 後方一致（*xxx）
-            return f"*{clean_term}"
-        else:
-            # xxx → 完全一致（ダブルクォートで囲む）
-            return f'"{clean_term}"'
-    
-    def _search_trademark_fts(self, term: str, limit: int) -> List[Dict[str, Any]]:
-        """商標名FTS検索"""
         cursor = self.conn.cursor()
-        
-        # FTS用にワイルドカードパターンを生成
-        fts_pattern = self._create_fts_pattern(term)
-        
-        query = """
+        query = f"""
             SELECT 
                 ts.app_num,
                 tci.reg_article_reg_num as reg_num,
@@ -4337,22 +4560,37 @@ class TMCloudIntegratedSearch:
                 tci.final_disposition_type,
                 tci.law_code,
                 tci.class_count
-            FROM trademark_search_fts fts
-            JOIN trademark_search ts ON fts.rowid = ts.rowid
+            FROM {source}
             INNER JOIN trademark_case_info tci ON ts.app_num = tci.app_num
             LEFT JOIN trademark_display td ON tci.app_num = td.app_num
             LEFT JOIN trademark_standard_char tsc ON tci.app_num = tsc.app_num
-            WHERE fts MATCH ?
+            WHERE {condition}
             ORDER BY tci.app_date DESC
             LIMIT ?
         """
         
-        try:
-            cursor.execute(query, (fts_pattern, limit))
-            return [dict(row) for row in cursor.fetchall()]
-        except sqlite3.OperationalError:
-            # FTSテーブルが存在しない場合はLIKE検索にフォールバック
-            return self._search_trademark_like(term, limit)
+        cursor.execute(query, params + [limit])
+        return [dict(row) for row in cursor.fetchall()]
+    
+    def _trademark_substring_match(self, term: str) -> Tuple[str, str, List[str]]:
+        """商標名の後方一致・部分一致の候補の引き方を決める（？以外の文字を含む正規化済みの検索語）
+        
+        Returns:
+            (FROM句, WHERE句の条件, パラメータ)
+        """
+        segments = [segment for segment in term.split('?') if segment]
+        long_segments = [segment for segment in segments if len(segment) >= 3]
+        if long_segments:
+            source = "trademark_search_trigram tri JOIN trademark_search ts ON ts.rowid = tri.rowid"
+            candidate = "tri.trademark_search_trigram MATCH ?"
+            # 各文字列をフレーズとして指定（trigramでは部分文字列の一致になる）
+            candidate_param = ' AND '.join('"' + segment.replace('"', '""') + '"' for segment in long_segments)
+        else:
+            source = "trademark_search_ngram ng JOIN trademark_search ts ON ts.rowid = ng.search_rowid"
+            candidate = "ng.gram = ?"
+            candidate_param = max(segments, key=len)
+        condition = f"{candidate} AND ts.search_use_t_norm LIKE ? ESCAPE '\\'"
+        return source, condition, [candidate_param, QueryParser.wildcard_like(term)]
     
     def _get_all_trademarks(self, limit: int) -> List[Dict[str, Any]]:
         """全商標取得"""
@@ -4385,13 +4623,16 @@ class TMCloudIntegratedSearch:
     
     # ========== 称呼検索（TMSONAR準拠） ==========
     
-    def search_phonetic(self, keywords: str, limit: int = 100, unified_format: bool = True) -> List[Dict[str, Any]]:
+    @cached_search(normalize_term=lambda term: QueryParser.normalize_wildcard_term(
+        term, TextNormalizer.normalize_kana_for_pron))
+    def search_phonetic(self, keywords: str, limit: int = 100, unified_format: bool = True, fields='full') -> List[Dict[str, Any]]:
         """称呼検索（TMSONAR準拠）
         
         Args:
             keywords: 検索キーワード（複数可）
             limit: 最大取得件数
             unified_format: 統一フォーマットで返すか
+            fields: 統一フォーマットで取得する項目（'summary'/'full'、_format_unified_result参照）
         
         Returns:
             検索結果リスト
@@ -4411,43 +4652,18 @@ class TMCloudIntegratedSearch:
                         'search_term': keywords
                     } for r in results if r.get('app_num')
                 }
-                return self._format_unified_result(app_nums[:limit], search_specific)
+                return self._format_unified_result(app_nums[:limit], search_specific, fields=fields)
             else:
                 return self._get_all_phonetics(limit)
         
         results = []
         for term in terms:
-            # 正規化（ワイルドカード判定前に元の形を保持）
-            has_prefix_wildcard = term.startswith('？') or term.startswith('?')
-            has_suffix_wildcard = term.endswith('？') or term.endswith('?')
-            
-            # ワイルドカードを除去してから正規化
-            clean_term = term
-            if has_prefix_wildcard:
-                clean_term = clean_term[1:]
-            if has_suffix_wildcard:
-                clean_term = clean_term[:-1]
-            
-            normalized = TextNormalizer.normalize_kana_for_pron(clean_term)
-            escaped = QueryParser.wildcard_like(normalized)
-            
-            # パターン生成
-            if has_prefix_wildcard and has_suffix_wildcard:
-                # ？xxx？ → 部分一致
-                pattern = f"%{escaped}%"
-            elif has_suffix_wildcard:
-                # xxx？ → 前方一致
-                pattern = f"{escaped}%"
-            elif has_prefix_wildcard:
-                # ？xxx → 後方一致
-                pattern = f"%{escaped}"
-            else:
-                # xxx → 完全一致
-                pattern = escaped
+            # 検索語に応じたインデックス（範囲比較・逆順カラム・trigram FTS）で候補を引く
+            source, condition, params = self._phonetic_match(term)
             
             cursor = self.conn.cursor()
             # シンプルなクエリ：出願番号でGROUP BYして重複を除去
-            query = """
+            query = f"""
                 SELECT 
                     tp.app_num,
                     GROUP_CONCAT(DISTINCT tp.pronunciation) as pronunciation,
@@ -4461,18 +4677,18 @@ class TMCloudIntegratedSearch:
                     tci.final_disposition_type,
                     tci.law_code,
                     tci.class_count
-                FROM trademark_pronunciations tp
+                FROM {source}
                 INNER JOIN trademark_case_info tci ON tp.app_num = tci.app_num
                 LEFT JOIN trademark_search ts ON tp.app_num = ts.app_num
                 LEFT JOIN trademark_display td ON tp.app_num = td.app_num
                 LEFT JOIN trademark_standard_char tsc ON tp.app_num = tsc.app_num
-                WHERE tp.pronunciation_norm LIKE ? ESCAPE '\\'
+                WHERE {condition}
                 GROUP BY tp.app_num
                 ORDER BY tci.app_date DESC
                 LIMIT ?
             """
             
-            cursor.execute(query, (pattern, limit))
+            cursor.execute(query, params + [limit])
             results.extend([dict(row) for row in cursor.fetchall()])
         
         # 重複除去（出願番号単位）
@@ -4492,10 +4708,65 @@ class TMCloudIntegratedSearch:
                     'search_term': keywords
                 } for r in unique_results[:limit]
             }
-            return self._format_unified_result(app_nums, search_specific)
+            return self._format_unified_result(app_nums, search_specific, fields=fields)
         else:
             return unique_results[:limit]
     
+    def _phonetic_match(self, term: str) -> Tuple[str, str, List[str]]:
+        """称呼の検索語（？はワイルドカード）から候補の引き方を決める
+        
+        ？で区切った文字列のうち、先頭に固定されたものはpronunciation_normの
+        範囲比較、末尾に固定されたものは逆順カラム（pronunciation_norm_rev）の
+        範囲比較、3文字以上のものはtrigram FTSで引ける。最も絞り込める方法で
+        候補を引き、残りのワイルドカードはLIKEで確認する。
+        
+        Returns:
+            (FROM句, WHERE句の条件, パラメータ)
+        """
+        # ワイルドカードを除去してから正規化
+        has_prefix_wildcard, normalized, has_suffix_wildcard = QueryParser.normalize_wildcard_term(
+            term, TextNormalizer.normalize_kana_for_pron)
+        pattern = ('?' if has_prefix_wildcard else '') + normalized + ('?' if has_suffix_wildcard else '')
+        
+        source = "trademark_pronunciations tp"
+        if '?' not in pattern:
+            # xxx → 完全一致
+            return source, "tp.pronunciation_norm = ?", [pattern]
+        
+        segments = pattern.split('?')
+        head, tail = segments[0], segments[-1]
+        longest = max(segments, key=len)
+        like_condition = "tp.pronunciation_norm LIKE ? ESCAPE '\\'"
+        like_params = [QueryParser.wildcard_like(pattern)]
+        
+        use_head = len(head) >= len(tail)
+        anchored = head if use_head else tail
+        if anchored and (len(anchored) >= 3 or len(anchored) >= len(longest)):
+            if use_head:
+                # xxx？ → 前方一致（範囲比較）
+                condition = "(tp.pronunciation_norm >= ? AND tp.pronunciation_norm < ?)"
+                params = [head, head + PREFIX_RANGE_END]
+            else:
+                # ？xxx → 後方一致（逆順カラムの前方一致）
+                reversed_tail = tail[::-1]
+                condition = "(tp.pronunciation_norm_rev >= ? AND tp.pronunciation_norm_rev < ?)"
+                params = [reversed_tail, reversed_tail + PREFIX_RANGE_END]
+            # ワイルドカードが反対側の端の1つだけならLIKEでの確認は不要
+            if len(segments) == 2 and not (tail if use_head else head):
+                return source, condition, params
+            return source, f"{condition} AND {like_condition}", params + like_params
+        
+        if len(longest) >= 3:
+            # ？xxx？ → 部分一致（3文字以上の文字列をtrigram FTSで引く）
+            long_segments = [segment for segment in segments if len(segment) >= 3]
+            source = ("trademark_pronunciation_trigram tpt "
+                      "JOIN trademark_pronunciations tp ON tp.rowid = tpt.rowid")
+            match = ' AND '.join('"' + segment.replace('"', '""') + '"' for segment in long_segments)
+            return source, f"tpt.trademark_pronunciation_trigram MATCH ? AND {like_condition}", [match] + like_params
+        
+        # 2文字以下の部分一致はLIKEのみ
+        return source, like_condition, like_params
+    
     def _get_all_phonetics(self, limit: int) -> List[Dict[str, Any]]:
         """全称呼取得"""
         cursor = self.conn.cursor()
@@ -4528,7 +4799,8 @@ class TMCloudIntegratedSearch:
     
     # ========== 番号検索 ==========
     
-    def search_by_app_num(self, app_num: str, unified_format: bool = True) -> Optional[Dict[str, Any]]:
+    @cached_search
+    def search_by_app_num(self, app_num: str, unified_format: bool = True, fields='full') -> Optional[Dict[str, Any]]:
         """出願番号による検索"""
         if not app_num:
             return None
@@ -4568,17 +4840,20 @@ class TMCloudIntegratedSearch:
                         'search_term': app_num
                     }
                 }
-                return self._format_unified_result([app_num], search_specific)[0] if self._format_unified_result([app_num], search_specific) else None
+                results = self._format_unified_result([app_num], search_specific, fields=fields)
+                return results[0] if results else None
             else:
                 return dict(row)
         return None
     
-    def search_by_reg_num(self, reg_num: str, unified_format: bool = True) -> Optional[Dict[str, Any]]:
+    @cached_search
+    def search_by_reg_num(self, reg_num: str, unified_format: bool = True, fields='full') -> Optional[Dict[str, Any]]:
         """登録番号による検索
         
         Args:
             reg_num: 登録番号
             unified_format: 統一フォーマットで返すか
+            fields: 統一フォーマットで取得する項目（'summary'/'full'、_format_unified_result参照）
         
         Returns:
             検索結果（単一）
@@ -4622,7 +4897,7 @@ class TMCloudIntegratedSearch:
                         'search_term': reg_num
                     }
                 }
-                results = self._format_unified_result([app_num], search_specific)
+                results = self._format_unified_result([app_num], search_specific, fields=fields)
                 return results[0] if results else None
             else:
                 return dict(row)
@@ -4630,6 +4905,7 @@ class TMCloudIntegratedSearch:
     
     # ========== 日付範囲検索 ==========
     
+    @cached_search
     def search_by_date_range(
         self, 
         date_type: str, 
@@ -4730,6 +5006,7 @@ class TMCloudIntegratedSearch:
     
     # ========== 最終処分検索（TMSONAR ID:130） ==========
     
+    @cached_search
     def search_by_final_disposition(self, codes: str, limit: int = 100) -> List[Dict[str, Any]]:
         """最終処分による検索（TMSONAR ID:130）
         
@@ -4750,48 +5027,25 @@ class TMCloudIntegratedSearch:
         results = []
         
         for term in terms:
-            if term.endswith('?'):
-                # 前方一致検索
-                prefix = term[:-1]
-                query = """
-                    SELECT DISTINCT
-                        tci.app_num,
-                        tci.final_disposition_type,
-                        tci.final_disposition_date,
-                        ts.search_use_t as trademark_name,
-                        tci.app_date,
-                        tci.reg_date,
-                        tci.reg_article_reg_num as reg_num,
-                        tci.law_code,
-                        tci.class_count
-                    FROM trademark_case_info tci
-                    LEFT JOIN trademark_search ts ON tci.app_num = ts.app_num
-                    WHERE tci.final_disposition_type LIKE ? ESCAPE '\\'
-                    ORDER BY tci.app_date DESC
-                    LIMIT ?
-                """
-                pattern = prefix.replace('_', '\\_').replace('%', '\\%') + '%'
-                cursor.execute(query, (pattern, limit))
-            else:
-                # 完全一致検索
-                query = """
-                    SELECT DISTINCT
-                        tci.app_num,
-                        tci.final_disposition_type,
-                        tci.final_disposition_date,
-                        ts.search_use_t as trademark_name,
-                        tci.app_date,
-                        tci.reg_date,
-                        tci.reg_article_reg_num as reg_num,
-                        tci.law_code,
-                        tci.class_count
-                    FROM trademark_case_info tci
-                    LEFT JOIN trademark_search ts ON tci.app_num = ts.app_num
-                    WHERE tci.final_disposition_type = ?
-                    ORDER BY tci.app_date DESC
-                    LIMIT ?
-                """
-                cursor.execute(query, (term, limit))
+            condition, params = self._final_disposition_match(term)
+            query = f"""
+                SELECT DISTINCT
+                    tci.app_num,
+                    tci.final_disposition_type,
+                    tci.final_disposition_date,
+                    ts.search_use_t as trademark_name,
+                    tci.app_date,
+                    tci.reg_date,
+                    tci.reg_article_reg_num as reg_num,
+                    tci.law_code,
+                    tci.class_count
+                FROM trademark_case_info tci
+                LEFT JOIN trademark_search ts ON tci.app_num = ts.app_num
+                WHERE {condition}
+                ORDER BY tci.app_date DESC
+                LIMIT ?
+            """
+            cursor.execute(query, params + [limit])
             
             results.extend([dict(row) for row in cursor.fetchall()])
         
@@ -4805,6 +5059,20 @@ class TMCloudIntegratedSearch:
         
         return unique_results[:limit]
     
+    def _final_disposition_match(self, term: str) -> Tuple[str, List[str]]:
+        """最終処分コードの検索語をtrademark_case_info（tci）の条件にする
+        
+        Returns:
+            (WHERE句の条件, パラメータ)
+        """
+        if term.endswith('?'):
+            # 前方一致検索
+            prefix = term[:-1]
+            pattern = prefix.replace('_', '\\_').replace('%', '\\%') + '%'
+            return "tci.final_disposition_type LIKE ? ESCAPE '\\'", [pattern]
+        # 完全一致検索
+        return "tci.final_disposition_type = ?", [term]
+    
     def _get_all_final_dispositions(self, limit: int) -> List[Dict[str, Any]]:
         """全最終処分取得"""
         cursor = self.conn.cursor()
@@ -4830,6 +5098,7 @@ class TMCloudIntegratedSearch:
     
     # ========== ステータス検索（旧インターフェース、互換性維持） ==========
     
+    @cached_search
     def search_by_status(
         self, 
         final_disposition_type: str = None, 
@@ -4901,6 +5170,7 @@ class TMCloudIntegratedSearch:
     
     # ========== 国際分類（類展開）検索（TMSONAR ID:104） ==========
     
+    @cached_search
     def search_by_international_class(self, class_nums: str, limit: int = 100) -> List[Dict[str, Any]]:
         """国際分類（類似群コード展開）検索（TMSONAR ID:104）
         
@@ -4984,13 +5254,15 @@ class TMCloudIntegratedSearch:
     
     # ========== 類似群コード検索 ==========
     
-    def search_by_similar_group(self, codes: str, limit: int = 100, unified_format: bool = True) -> List[Dict[str, Any]]:
+    @cached_search
+    def search_by_similar_group(self, codes: str, limit: int = 100, unified_format: bool = True, fields='full') -> List[Dict[str, Any]]:
         """類似群コード検索（TMSONAR準拠）
         
         Args:
             codes: 類似群コード（複数可、末尾?で前方一致）
             limit: 最大取得件数
             unified_format: 統一フォーマットで返すか
+            fields: 統一フォーマットで取得する項目（'summary'/'full'、_format_unified_result参照）
         
         Returns:
             検索結果リスト
@@ -5010,7 +5282,7 @@ class TMCloudIntegratedSearch:
                         'search_term': codes
                     } for r in results
                 }
-                return self._format_unified_result(app_nums, search_specific)
+                return self._format_unified_result(app_nums, search_specific, fields=fields)
             else:
                 return results
         
@@ -5018,27 +5290,7 @@ class TMCloudIntegratedSearch:
         for term in terms:
             cursor = self.conn.cursor()
             
-            if term.endswith('?') or term.endswith('？'):
-                # 前方一致
-                prefix = term[:-1]
-                # カンマ区切りを考慮：先頭、中間、末尾のいずれかでマッチ
-                pattern = f"%{prefix}%"
-                where_clause = """(
-                    tsgc.similar_group_codes LIKE ? OR
-                    tsgc.similar_group_codes LIKE ? OR
-                    tsgc.similar_group_codes LIKE ?
-                )"""
-                params = (f"{prefix}%", f"%,{prefix}%", f"%,{prefix}")
-            else:
-                # 完全一致
-                # カンマ区切りを考慮：先頭、中間、末尾のいずれかで完全一致
-                where_clause = """(
-                    tsgc.similar_group_codes = ? OR
-                    tsgc.similar_group_codes LIKE ? OR
-                    tsgc.similar_group_codes LIKE ? OR
-                    tsgc.similar_group_codes LIKE ?
-                )"""
-                params = (term, f"{term},%", f"%,{term},%", f"%,{term}")
+            where_clause, params = self._similar_group_match(term)
             
             query = f"""
                 SELECT DISTINCT
@@ -5054,7 +5306,9 @@ class TMCloudIntegratedSearch:
                     tci.final_disposition_type,
                     tci.law_code,
                     tci.class_count
-                FROM trademark_similar_group_codes tsgc
+                FROM trademark_similar_group_index sgi
+                INNER JOIN trademark_similar_group_codes tsgc
+                    ON tsgc.app_num = sgi.app_num AND tsgc.class_num = sgi.class_num
                 INNER JOIN trademark_case_info tci ON tsgc.app_num = tci.app_num
                 LEFT JOIN trademark_search ts ON tsgc.app_num = ts.app_num
                 LEFT JOIN trademark_display td ON tsgc.app_num = td.app_num
@@ -5064,7 +5318,7 @@ class TMCloudIntegratedSearch:
                 LIMIT ?
             """
             
-            cursor.execute(query, params + (limit,))
+            cursor.execute(query, params + [limit])
             results.extend([dict(row) for row in cursor.fetchall()])
         
         # 重複除去
@@ -5084,10 +5338,23 @@ class TMCloudIntegratedSearch:
                     'search_term': codes
                 } for r in unique_results[:limit]
             }
-            return self._format_unified_result(app_nums, search_specific)
+            return self._format_unified_result(app_nums, search_specific, fields=fields)
         else:
             return unique_results[:limit]
     
+    def _similar_group_match(self, term: str) -> Tuple[str, List[str]]:
+        """類似群コードの転置インデックス（1コード1行、別名sgi）をcodeの範囲・一致で引く条件
+        
+        Returns:
+            (WHERE句の条件, パラメータ)
+        """
+        if term.endswith('?') or term.endswith('？'):
+            # 前方一致
+            prefix = term[:-1].upper()
+            return "sgi.code >= ? AND sgi.code < ?", [prefix, prefix + PREFIX_RANGE_END]
+        # 完全一致
+        return "sgi.code = ?", [term.upper()]
+    
     def _get_all_similar_groups(self, limit: int) -> List[Dict[str, Any]]:
         """全類似群コード取得"""
         cursor = self.conn.cursor()
@@ -5118,18 +5385,20 @@ class TMCloudIntegratedSearch:
     
     # ========== 商品・役務検索 ==========
     
-    def search_goods_services(self, keywords: str, limit: int = 100, item_and: bool = True, unified_format: bool = True) -> List[Dict[str, Any]]:
+    @cached_search(normalize_term=lambda term: QueryParser.normalize_wildcard_term(
+        term, TextNormalizer.normalize_text_jp))
+    def search_goods_services(self, keywords: str, limit: int = 100, item_and: bool = True, unified_format: bool = True, fields='full') -> List[Dict[str, Any]]:
         """指定商品/役務検索（TMSONAR準拠）
         
-        注意: trademark_goods_servicesテーブルには正規化カラム（goods_services_name_norm）が
-              存在しないため、オリジナルテキストに対してLIKE検索を行う。
-              将来的にDB改修で正規化カラムを追加すれば、より高精度な検索が可能。
+        商品・役務名は正規化カラム（goods_services_name_norm、tmcloud_migrate v5）と
+        同じ正規化をした検索語で比較する。
         
         Args:
             keywords: 検索キーワード（複数可）
             limit: 最大取得件数
             item_and: True=項目内AND, False=項目間AND
             unified_format: 統一フォーマットで返すか
+            fields: 統一フォーマットで取得する項目（'summary'/'full'、_format_unified_result参照）
         
         Returns:
             検索結果リスト
@@ -5138,49 +5407,17 @@ class TMCloudIntegratedSearch:
         if not terms or terms == ['?']:
             return self._get_all_goods_services(limit)
         
-        # 各キーワードを正規化
-        # ※DBに正規化カラムがないため、検索パターンを正規化してLIKE検索
-        normalized_terms = []
-        for term in terms:
-            # ワイルドカード判定
-            has_prefix_wildcard = term.startswith('？') or term.startswith('?')
-            has_suffix_wildcard = term.endswith('？') or term.endswith('?')
-            
-            # ワイルドカードを除去して正規化
-            clean_term = term
-            if has_prefix_wildcard:
-                clean_term = clean_term[1:]
-            if has_suffix_wildcard:
-                clean_term = clean_term[:-1]
-            
-            normalized = TextNormalizer.normalize_text_jp(clean_term)
-            escaped = QueryParser.wildcard_like(normalized)
-            
-            # パターン生成
-            if has_prefix_wildcard and has_suffix_wildcard:
-                # ？xxx？ → 部分一致
-                pattern = f"%{escaped}%"
-            elif has_suffix_wildcard:
-                # xxx？ → 前方一致
-                pattern = f"{escaped}%"
-            elif has_prefix_wildcard:
-                # ？xxx → 後方一致
-                pattern = f"%{escaped}"
-            else:
-                # xxx → 完全一致
-                pattern = escaped
-            
-            normalized_terms.append(pattern)
+        # 各キーワードの比較条件（完全一致・前方一致はインデックスを使用）
+        matches = [
+            QueryParser.norm_match('tgs.goods_services_name_norm', term, TextNormalizer.normalize_text_jp)
+            for term in terms
+        ]
         
         cursor = self.conn.cursor()
         
         if item_and:
             # 項目内AND（同一goods_seq_num内で全キーワードがマッチ）
-            conditions = []
-            for pattern in normalized_terms:
-                conditions.append(f"goods_services_name LIKE ? ESCAPE '\\'") 
-            
-            where_clause = " AND ".join(conditions)
+            where_clause = " AND ".join(condition for condition, _ in matches)
             
             query = f"""
                 SELECT DISTINCT
@@ -5207,12 +5444,12 @@ class TMCloudIntegratedSearch:
                 LIMIT ?
             """
             
-            params = normalized_terms + [limit]
+            params = [param for _, match_params in matches for param in match_params] + [limit]
             cursor.execute(query, params)
             results = [dict(row) for row in cursor.fetchall()]
         else:
             # 項目間AND（異なるgoods_seq_numでもOK）- 簡略化した実装
-            results = self._search_goods_services_between_items(normalized_terms, limit, unified_format)
+            results = self._search_goods_services_between_items(matches, limit, unified_format)
         
         if unified_format:
             app_nums = [r['app_num'] for r in results]
@@ -5222,23 +5459,23 @@ class TMCloudIntegratedSearch:
                     'search_term': keywords
                 } for r in results
             }
-            return self._format_unified_result(app_nums, search_specific)
+            return self._format_unified_result(app_nums, search_specific, fields=fields)
         else:
             return results
     
-    def _search_goods_services_between_items(self, patterns: List[str], limit: int, unified_format: bool = True) -> List[Dict[str, Any]]:
-        """項目間AND検索"""
-        # 各パターンでマッチする出願番号を取得
+    def _search_goods_services_between_items(self, matches: List[Tuple[str, List[str]]], limit: int, unified_format: bool = True) -> List[Dict[str, Any]]:
+        """項目間AND検索（matchesはQueryParser.norm_matchの条件）"""
+        # 各条件でマッチする出願番号を取得
         cursor = self.conn.cursor()
         app_num_sets = []
         
-        for pattern in patterns:
-            query = """
-                SELECT DISTINCT app_num
-                FROM trademark_goods_services
-                WHERE goods_services_name LIKE ? ESCAPE '\\'
+        for condition, params in matches:
+            query = f"""
+                SELECT DISTINCT tgs.app_num
+                FROM trademark_goods_services tgs
+                WHERE {condition}
             """
-            cursor.execute(query, (pattern,))
+            cursor.execute(query, params)
             app_nums = {row[0] for row in cursor.fetchall()}
             app_num_sets.append(app_nums)
         
@@ -5314,7 +5551,8 @@ class TMCloudIntegratedSearch:
     
     # ========== 出願人/権利者検索 ==========
     
-    def search_applicant(self, keywords: str, limit: int = 100, use_or: bool = False, unified_format: bool = True) -> List[Dict[str, Any]]:
+    @cached_search
+    def search_applicant(self, keywords: str, limit: int = 100, use_or: bool = False, unified_format: bool = True, fields='full') -> List[Dict[str, Any]]:
         """出願人/権利者検索（type-102）
         
         Args:
@@ -5322,6 +5560,7 @@ class TMCloudIntegratedSearch:
             limit: 最大取得件数
             use_or: True=OR検索、False=AND検索（スペース区切り時）
             unified_format: 統一フォーマットで返すか
+            fields: 統一フォーマットで取得する項目（'summary'/'full'、_format_unified_result参照）
         
         Returns:
             検索結果リスト
@@ -5337,97 +5576,10 @@ class TMCloudIntegratedSearch:
         if not terms or terms == ['?']:
             return self._get_all_applicants(limit)
         
-        # 各キーワードを正規化（会社種別除去）と半角・全角両パターン生成
-        normalized_terms = []
-        for term in terms:
-            # ワイルドカード判定
-            has_prefix_wildcard = term.startswith('？') or term.startswith('?')
-            has_suffix_wildcard = term.endswith('？') or term.endswith('?')
-            
-            # ワイルドカードを除去
-            clean_term = term
-            if has_prefix_wildcard:
-                clean_term = clean_term[1:]
-            if has_suffix_wildcard:
-                clean_term = clean_term[:-1]
-            
-            # 正規化（NFKC変換で全角→半角に統一、会社種別除去）
-            normalized = TextNormalizer.normalize_company_name(clean_term)
-            escaped = QueryParser.wildcard_like(normalized)
-            
-            # パターン生成
-            if has_prefix_wildcard and has_suffix_wildcard:
-                # ？xxx？ → 部分一致
-                pattern_base = f"%{escaped}%"
-            elif has_suffix_wildcard:
-                # xxx？ → 前方一致
-                pattern_base = f"{escaped}%"
-            elif has_prefix_wildcard:
-                # ？xxx → 後方一致
-                pattern_base = f"%{escaped}"
-            else:
-                # xxx → 完全一致
-                pattern_base = escaped
-            
-            # 半角パターン
-            normalized_terms.append(pattern_base)
-            
-            # 全角パターンも生成（半角英数字を全角に変換）
-            zenkaku = ''
-            for c in escaped:  # エスケープ済みの文字列を使用
-                if 'A' <= c <= 'Z':
-                    zenkaku += chr(ord(c) - ord('A') + ord('Ａ'))
-                elif 'a' <= c <= 'z':
-                    zenkaku += chr(ord(c) - ord('a') + ord('ａ'))
-                elif '0' <= c <= '9':
-                    zenkaku += chr(ord(c) - ord('0') + ord('０'))
-                else:
-                    zenkaku += c
-            
-            # 全角パターンも同じワイルドカード位置を適用
-            if has_prefix_wildcard and has_suffix_wildcard:
-                pattern_zenkaku = f"%{zenkaku}%"
-            elif has_suffix_wildcard:
-                pattern_zenkaku = f"{zenkaku}%"
-            elif has_prefix_wildcard:
-                pattern_zenkaku = f"%{zenkaku}"
-            else:
-                pattern_zenkaku = zenkaku
-            
-            normalized_terms.append(pattern_zenkaku)
-        
-        cursor = self.conn.cursor()
-        
-        # WHERE句構築（申請人マスタの名前は正規化後にマッチング）
-        conditions = []
-        for i in range(0, len(normalized_terms), 2):  # 半角と全角のペアで処理
-            # 申請人名を正規化してマッチング（会社種別除去）＋ 半角・全角両方でマッチ
-            conditions.append("""(
-                REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(
-                    COALESCE(ari.applicant_name, ''),
-                    '株式会社', ''), '有限会社', ''), '合同会社', ''),
-                    '合資会社', ''), '合名会社', ''), '一般社団法人', '')
-                LIKE ? OR 
-                REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(
-                    COALESCE(ari.applicant_name, ''),
-                    '株式会社', ''), '有限会社', ''), '合同会社', ''),
-                    '合資会社', ''), '合名会社', ''), '一般社団法人', '')
-                LIKE ? OR
-                taa.applicant_agent_code LIKE ? OR
-                taa.applicant_agent_code LIKE ?
-            )""")
-        
-        if use_or:
-            where_clause = " OR ".join(conditions)
-        else:
-            where_clause = " AND ".join(conditions)
-        
-        # パラメータ構築（半角・全角の各パターンを2回使用）
-        params = []
-        for i in range(0, len(normalized_terms), 2):
-            params.extend([normalized_terms[i], normalized_terms[i+1], normalized_terms[i], normalized_terms[i+1]])
+        where_clause, params = self._applicant_match(terms, use_or)
         params.append(limit)
         
+        cursor = self.conn.cursor()
         query = f"""
             SELECT DISTINCT
                 taa.app_num,
@@ -5471,10 +5623,33 @@ class TMCloudIntegratedSearch:
                     'search_term': keywords
                 } for r in results if r.get('app_num')
             }
-            return self._format_unified_result(app_nums[:limit], search_specific)
+            return self._format_unified_result(app_nums[:limit], search_specific, fields=fields)
         else:
             return results
     
+    def _applicant_match(self, terms: List[str], use_or: bool) -> Tuple[str, List[str]]:
+        """出願人/権利者の検索語をtrademark_applicants_agents（taa）と
+        applicant_registration_info（ari）の条件にする
+        
+        申請人名は会社種別を除去した正規化カラム、申請人コードはそのまま比較する。
+        
+        Returns:
+            (WHERE句の条件, パラメータ)
+        """
+        conditions = []
+        params = []
+        for term in terms:
+            name_condition, name_params = QueryParser.norm_match(
+                'ari.applicant_name_norm', term, TextNormalizer.normalize_company_name)
+            code_condition, code_params = QueryParser.norm_match(
+                'taa.applicant_agent_code', term, TextNormalizer.normalize_text_jp)
+            conditions.append(f"({name_condition} OR {code_condition})")
+            params.extend(name_params + code_params)
+        
+        if use_or:
+            return " OR ".join(conditions), params
+        return " AND ".join(conditions), params
+    
     def _get_all_applicants(self, limit: int) -> List[Dict[str, Any]]:
         """全出願人取得"""
         cursor = self.conn.cursor()
@@ -5502,6 +5677,7 @@ class TMCloudIntegratedSearch:
     
     # ========== 法区分＋類検索 ==========
     
+    @cached_search
     def search_by_law_class(self, expr: str, limit: int = 100) -> List[Dict[str, Any]]:
         """法区分＋類検索（TMSONAR ID:105）
         
@@ -5591,7 +5767,8 @@ class TMCloudIntegratedSearch:
     
     # ========== ウィーンコード検索 ==========
     
-    def search_by_vienna_code(self, codes: str, limit: int = 100, unified_format: bool = True) -> List[Dict[str, Any]]:
+    @cached_search
+    def search_by_vienna_code(self, codes: str, limit: int = 100, unified_format: bool = True, fields='full') -> List[Dict[str, Any]]:
         """ウィーンコード検索（TMSONAR ID:112）
         
         Args:
@@ -5599,6 +5776,7 @@ class TMCloudIntegratedSearch:
                   階層的前方一致対応（例: '1.3.20' → '1.3.20.01'等を含む）
             limit: 最大取得件数
             unified_format: 統一フォーマットで返すか
+            fields: 統一フォーマットで取得する項目（'summary'/'full'、_format_unified_result参照）
         
         Returns:
             検索結果リスト
@@ -5614,7 +5792,7 @@ class TMCloudIntegratedSearch:
                         'search_term': codes
                     } for r in results
                 }
-                return self._format_unified_result(app_nums, search_specific)
+                return self._format_unified_result(app_nums, search_specific, fields=fields)
             else:
                 return results
         
@@ -5622,48 +5800,9 @@ class TMCloudIntegratedSearch:
         for term in terms:
             cursor = self.conn.cursor()
             
-            # ウィーンコードの階層分解（大分類.中分類.小分類.細分類）
-            parts = term.split('.')
-            conditions = []
-            params = []
-            
-            if len(parts) >= 1 and parts[0]:
-                # 大分類の処理（?で前方一致対応）
-                if '?' in parts[0]:
-                    # 前方一致検索
-                    prefix = parts[0].replace('?', '')
-                    if prefix:
-                        conditions.append("large_class LIKE ?")
-                        params.append(prefix.zfill(2) + '%')
-                    # ?のみの場合は条件を追加しない（全件取得）
-                else:
-                    # 完全一致
-                    large_class = parts[0].zfill(2)
-                    conditions.append("large_class = ?")
-                    params.append(large_class)
-            
-            if len(parts) >= 2 and parts[1]:
-                # 中分類も2桁でゼロパディング
-                mid_class = parts[1].zfill(2)
-                conditions.append("mid_class = ?")
-                params.append(mid_class)
-            
-            if len(parts) >= 3 and parts[2]:
-                # 小分類も2桁でゼロパディング
-                small_class = parts[2].zfill(2)
-                conditions.append("small_class = ?")
-                params.append(small_class)
-            
-            if len(parts) >= 4 and parts[3]:
-                # 細分類も2桁でゼロパディング
-                complement = parts[3].zfill(2)
-                conditions.append("complement_sub_class = ?")
-                params.append(complement)
-            
-            if not conditions:
+            where_clause, params = self._vienna_match(term)
+            if not where_clause:
                 continue
-            
-            where_clause = " AND ".join(conditions)
             params.append(limit)
             
             query = f"""
@@ -5723,10 +5862,56 @@ class TMCloudIntegratedSearch:
                     'search_term': codes
                 } for r in unique_results[:limit]
             }
-            return self._format_unified_result(app_nums, search_specific)
+            return self._format_unified_result(app_nums, search_specific, fields=fields)
         else:
             return unique_results[:limit]
     
+    def _vienna_match(self, term: str) -> Tuple[str, List[str]]:
+        """ウィーンコードの検索語（階層的前方一致）をtrademark_vienna_codesの条件にする
+        
+        Returns:
+            (WHERE句の条件, パラメータ)。条件が無い（大分類が？のみ）場合は空文字列
+        """
+        # ウィーンコードの階層分解（大分類.中分類.小分類.細分類）
+        parts = term.split('.')
+        conditions = []
+        params = []
+        
+        if len(parts) >= 1 and parts[0]:
+            # 大分類の処理（?で前方一致対応）
+            if '?' in parts[0]:
+                # 前方一致検索
+                prefix = parts[0].replace('?', '')
+                if prefix:
+                    conditions.append("large_class LIKE ?")
+                    params.append(prefix.zfill(2) + '%')
+                # ?のみの場合は条件を追加しない（全件取得）
+            else:
+                # 完全一致
+                large_class = parts[0].zfill(2)
+                conditions.append("large_class = ?")
+                params.append(large_class)
+        
+        if len(parts) >= 2 and parts[1]:
+            # 中分類も2桁でゼロパディング
+            mid_class = parts[1].zfill(2)
+            conditions.append("mid_class = ?")
+            params.append(mid_class)
+        
+        if len(parts) >= 3 and parts[2]:
+            # 小分類も2桁でゼロパディング
+            small_class = parts[2].zfill(2)
+            conditions.append("small_class = ?")
+            params.append(small_class)
+        
+        if len(parts) >= 4 and parts[3]:
+            # 細分類も2桁でゼロパディング
+            complement = parts[3].zfill(2)
+            conditions.append("complement_sub_class = ?")
+            params.append(complement)
+        
+        return " AND ".join(conditions), params
+    
     def _get_all_vienna_codes(self, limit: int) -> List[Dict[str, Any]]:
         """全ウィーンコード取得"""
         cursor = self.conn.cursor()
@@ -5770,6 +5955,7 @@ class TMCloudIntegratedSearch:
     
     # ========== 商標の詳細な説明検索 ==========
     
+    @cached_search
     def search_detailed_description(self, keywords: str, limit: int = 100) -> List[Dict[str, Any]]:
         """商標の詳細な説明検索（TMSONAR ID:126）
         
@@ -5786,36 +5972,12 @@ class TMCloudIntegratedSearch:
         
         results = []
         for term in terms:
-            # ワイルドカード判定
-            has_prefix_wildcard = term.startswith('？') or term.startswith('?')
-            has_suffix_wildcard = term.endswith('？') or term.endswith('?')
-            
-            # ワイルドカードを除去して正規化
-            clean_term = term
-            if has_prefix_wildcard:
-                clean_term = clean_term[1:]
-            if has_suffix_wildcard:
-                clean_term = clean_term[:-1]
-            
-            normalized = TextNormalizer.normalize_text_jp(clean_term)
-            escaped = QueryParser.wildcard_like(normalized)
-            
-            # パターン生成
-            if has_prefix_wildcard and has_suffix_wildcard:
-                # ？xxx？ → 部分一致
-                pattern = f"%{escaped}%"
-            elif has_suffix_wildcard:
-                # xxx？ → 前方一致
-                pattern = f"{escaped}%"
-            elif has_prefix_wildcard:
-                # ？xxx → 後方一致
-                pattern = f"%{escaped}"
-            else:
-                # xxx → 完全一致
-                pattern = escaped
+            # 正規化カラム（detailed_description_norm）との比較条件
+            condition, params = QueryParser.norm_match(
+                'tdd.detailed_description_norm', term, TextNormalizer.normalize_text_jp)
             
             cursor = self.conn.cursor()
-            query = """
+            query = f"""
                 SELECT DISTINCT
                     tdd.app_num,
                     tdd.detailed_description,
@@ -5829,12 +5991,12 @@ class TMCloudIntegratedSearch:
                 FROM trademark_detailed_descriptions tdd
                 LEFT JOIN trademark_search ts ON tdd.app_num = ts.app_num
                 LEFT JOIN trademark_case_info tci ON tdd.app_num = tci.app_num
-                WHERE tdd.detailed_description LIKE ? ESCAPE '\\'
+                WHERE {condition}
                 ORDER BY tci.app_date DESC
                 LIMIT ?
             """
             
-            cursor.execute(query, (pattern, limit))
+            cursor.execute(query, params + [limit])
             results.extend([dict(row) for row in cursor.fetchall()])
         
         # 重複除去
@@ -5872,6 +6034,7 @@ class TMCloudIntegratedSearch:
     
     # ========== 出願種別検索 ==========
     
+    @cached_search
     def search_by_app_type(self, types: str, limit: int = 100) -> List[Dict[str, Any]]:
         """出願種別検索（TMSONAR ID:127）
         
@@ -5959,6 +6122,7 @@ class TMCloudIntegratedSearch:
     
     # ========== 商標タイプ検索（簡易版） ==========
     
+    @cached_search
     def search_by_trademark_type(self, type_expr: str, limit: int = 100, unified_format: bool = True) -> List[Dict[str, Any]]:
         """商標タイプ検索（TMSONAR ID:125 - 完全版）
         
@@ -6073,6 +6237,24 @@ class TMCloudIntegratedSearch:
             results.append(row_dict)
         return results
     
+    def _trademark_type_match(self, type_expr: str) -> Optional[Tuple[str, List[str]]]:
+        """商標タイプをtrademark_case_info（tci）の条件にする（search_by_trademark_typeと同じ判定）
+        
+        Returns:
+            (WHERE句の条件, パラメータ)。不明な商標タイプはNone
+        """
+        if type_expr == '標準文字':
+            return "tci.standard_char_exist = '1'", []
+        if type_expr == '通常':
+            # 標準文字でも特殊商標でもない
+            return ("(tci.standard_char_exist IS NULL OR tci.standard_char_exist != '1') "
+                    "AND (tci.special_mark_exist IS NULL OR tci.special_mark_exist = '0')"), []
+        # SPECIAL_MARK_TYPE_MAPの逆引き
+        for code, name in self.SPECIAL_MARK_TYPE_MAP.items():
+            if name == type_expr:
+                return "tci.special_mark_exist = ?", [code]
+        return None
+    
     def _get_all_trademark_types(self, limit: int) -> List[Dict[str, Any]]:
         """全商標タイプ取得"""
         cursor = self.conn.cursor()
@@ -6117,25 +6299,27 @@ class TMCloudIntegratedSearch:
             search_type: 検索タイプ（SearchType enum）
             keyword: 検索キーワード
             **kwargs: 検索タイプごとの追加パラメータ
+                      （fields: 統一フォーマットで取得する項目 'summary'/'full'）
         
         Returns:
             検索結果のリスト
         """
         start_time = time.time()
+        fields = kwargs.get('fields', 'full')
         
         try:
             if search_type == SearchType.TRADEMARK:
-                results = self.search_trademark_name(keyword, kwargs.get('limit', 100))
+                results = self.search_trademark_name(keyword, kwargs.get('limit', 100), fields=fields)
             
             elif search_type == SearchType.PHONETIC:
-                results = self.search_phonetic(keyword, kwargs.get('limit', 100))
+                results = self.search_phonetic(keyword, kwargs.get('limit', 100), fields=fields)
             
             elif search_type == SearchType.APP_NUM:
-                result = self.search_by_app_num(keyword)
+                result = self.search_by_app_num(keyword, fields=fields)
                 results = [result] if result else []
             
             elif search_type == SearchType.REG_NUM:
-                result = self.search_by_reg_num(keyword)
+                result = self.search_by_reg_num(keyword, fields=fields)
                 results = [result] if result else []
             
             elif search_type == SearchType.DATE_RANGE:
@@ -6156,27 +6340,29 @@ class TMCloudIntegratedSearch:
                 )
             
             elif search_type == SearchType.SIMILAR_GROUP:
-                results = self.search_by_similar_group(keyword, kwargs.get('limit', 100))
+                results = self.search_by_similar_group(keyword, kwargs.get('limit', 100), fields=fields)
             
             elif search_type == SearchType.GOODS_SERVICES:
                 results = self.search_goods_services(
                     keyword, 
                     kwargs.get('limit', 100),
-                    kwargs.get('item_and', True)
+                    kwargs.get('item_and', True),
+                    fields=fields
                 )
             
             elif search_type == SearchType.APPLICANT:
                 results = self.search_applicant(
                     keyword,
                     kwargs.get('limit', 100),
-                    kwargs.get('use_or', False)
+                    kwargs.get('use_or', False),
+                    fields=fields
                 )
             
             elif search_type == SearchType.LAW_CLASS:
                 results = self.search_by_law_class(keyword, kwargs.get('limit', 100))
             
             elif search_type == SearchType.VIENNA_CODE:
-                results = self.search_by_vienna_code(keyword, kwargs.get('limit', 100))
+                results = self.search_by_vienna_code(keyword, kwargs.get('limit', 100), fields=fields)
             
             elif search_type == SearchType.DETAILED_DESC:
                 results = self.search_detailed_description(keyword, kwargs.get('limit', 100))
@@ -6188,7 +6374,7 @@ class TMCloudIntegratedSearch:
                 results = self.search_by_app_type(keyword, kwargs.get('limit', 100))
             
             elif search_type == SearchType.REJECTION_CODE:
-                results = self.search_by_rejection_code(keyword, kwargs.get('limit', 100))
+                results = self.search_by_rejection_code(keyword, kwargs.get('limit', 100), fields=fields)
             
             elif search_type == SearchType.INTERMEDIATE_CODE:
                 results = self.search_by_intermediate_code(keyword, kwargs.get('limit', 100))
@@ -6247,7 +6433,8 @@ class TMCloudIntegratedSearch:
     
     # ========== 追加検索機能（TMSONAR仕様完全準拠） ==========
     
-    def search_by_rejection_code(self, codes: str, limit: int = 100, unified_format: bool = True) -> List[Dict[str, Any]]:
+    @cached_search
+    def search_by_rejection_code(self, codes: str, limit: int = 100, unified_format: bool = True, fields='full') -> List[Dict[str, Any]]:
         """拒絶条文コード検索（TMSONAR ID:108）
         
         Args:
@@ -6255,6 +6442,7 @@ class TMCloudIntegratedSearch:
                    例: 41:3条1項各号, 31:4条1項11号, 30:4条1項10号
             limit: 最大取得件数
             unified_format: 統一フォーマットで返すか
+            fields: 統一フォーマットで取得する項目（'summary'/'full'、_format_unified_result参照）
         
         Returns:
             検索結果リスト
@@ -6267,49 +6455,25 @@ class TMCloudIntegratedSearch:
         results = []
         
         for term in terms:
-            term = term.strip()  # 前後の空白を削除
-            if term.endswith('?'):
-                # 前方一致検索
-                prefix = term[:-1]
-                query = """
-                    SELECT DISTINCT
-                        tdr.app_num,
-                        tdr.rejection_reason_code,
-                        tdr.intermediate_doc_code,
-                        tdr.draft_date,
-                        tdr.dispatch_date,
-                        ts.search_use_t as trademark_name,
-                        tci.app_date,
-                        tci.reg_date
-                    FROM trademark_draft_records tdr
-                    LEFT JOIN trademark_search ts ON tdr.app_num = ts.app_num
-                    LEFT JOIN trademark_case_info tci ON tdr.app_num = tci.app_num
-                    WHERE TRIM(tdr.rejection_reason_code) LIKE ? ESCAPE '\\'
-                    ORDER BY tdr.draft_date DESC
-                    LIMIT ?
-                """
-                pattern = prefix.replace('_', '\\_').replace('%', '\\%') + '%'
-                cursor.execute(query, (pattern, limit))
-            else:
-                # 完全一致検索
-                query = """
-                    SELECT DISTINCT
-                        tdr.app_num,
-                        tdr.rejection_reason_code,
-                        tdr.intermediate_doc_code,
-                        tdr.draft_date,
-                        tdr.dispatch_date,
-                        ts.search_use_t as trademark_name,
-                        tci.app_date,
-                        tci.reg_date
-                    FROM trademark_draft_records tdr
-                    LEFT JOIN trademark_search ts ON tdr.app_num = ts.app_num
-                    LEFT JOIN trademark_case_info tci ON tdr.app_num = tci.app_num
-                    WHERE TRIM(tdr.rejection_reason_code) = ?
-                    ORDER BY tdr.draft_date DESC
-                    LIMIT ?
-                """
-                cursor.execute(query, (term, limit))
+            condition, params = self._rejection_code_match(term)
+            query = f"""
+                SELECT DISTINCT
+                    tdr.app_num,
+                    tdr.rejection_reason_code,
+                    tdr.intermediate_doc_code,
+                    tdr.draft_date,
+                    tdr.dispatch_date,
+                    ts.search_use_t as trademark_name,
+                    tci.app_date,
+                    tci.reg_date
+                FROM trademark_draft_records tdr
+                LEFT JOIN trademark_search ts ON tdr.app_num = ts.app_num
+                LEFT JOIN trademark_case_info tci ON tdr.app_num = tci.app_num
+                WHERE {condition}
+                ORDER BY tdr.draft_date DESC
+                LIMIT ?
+            """
+            cursor.execute(query, params + [limit])
             
             results.extend([dict(row) for row in cursor.fetchall()])
         
@@ -6336,13 +6500,28 @@ class TMCloudIntegratedSearch:
                     'draft_date': rejection_info.get('draft_date'),
                     'dispatch_date': rejection_info.get('dispatch_date')
                 }
-            return self._format_unified_result(app_nums, search_specific)
+            return self._format_unified_result(app_nums, search_specific, fields=fields)
         else:
             return unique_results[:limit]
     
-    def search_rejection_reason(self, codes: str, limit: int = 100, unified_format: bool = True) -> List[Dict[str, Any]]:
+    def _rejection_code_match(self, term: str) -> Tuple[str, List[str]]:
+        """拒絶条文コードの検索語をtrademark_draft_records（tdr）の条件にする
+        
+        Returns:
+            (WHERE句の条件, パラメータ)
+        """
+        term = term.strip()  # 前後の空白を削除
+        if term.endswith('?'):
+            # 前方一致検索
+            prefix = term[:-1]
+            pattern = prefix.replace('_', '\\_').replace('%', '\\%') + '%'
+            return "TRIM(tdr.rejection_reason_code) LIKE ? ESCAPE '\\'", [pattern]
+        # 完全一致検索
+        return "TRIM(tdr.rejection_reason_code) = ?", [term]
+    
+    def search_rejection_reason(self, codes: str, limit: int = 100, unified_format: bool = True, fields='full') -> List[Dict[str, Any]]:
         """拒絶条文コード検索のエイリアス（WEB用）"""
-        return self.search_by_rejection_code(codes, limit, unified_format)
+        return self.search_by_rejection_code(codes, limit, unified_format, fields=fields)
     
     def _get_all_rejection_codes(self, limit: int) -> List[Dict[str, Any]]:
         """全拒絶条文取得"""
@@ -6367,6 +6546,7 @@ class TMCloudIntegratedSearch:
         cursor.execute(query, (limit,))
         return [dict(row) for row in cursor.fetchall()]
     
+    @cached_search
     def search_by_intermediate_code(self, codes: str, limit: int = 100) -> List[Dict[str, Any]]:
         """中間記録コード検索（TMSONAR ID:131）
         
@@ -6465,6 +6645,7 @@ class TMCloudIntegratedSearch:
         cursor.execute(query, (limit,))
         return [dict(row) for row in cursor.fetchall()]
     
+    @cached_search
     def search_by_applicant_address(self, address: str, limit: int = 100) -> List[Dict[str, Any]]:
         """出願人/権利者住所検索（TMSONAR ID:134）
         
@@ -6499,9 +6680,9 @@ class TMCloudIntegratedSearch:
             cursor.execute(query, (limit,))
             return [dict(row) for row in cursor.fetchall()]
         
-        # 住所正規化と部分一致検索
+        # 住所正規化と部分一致検索（正規化カラムと比較）
         normalized = TextNormalizer.normalize_address(address)
-        pattern = '%' + normalized.replace('_', '\\_').replace('%', '\\%') + '%'
+        pattern = '%' + QueryParser.wildcard_like(normalized) + '%'
         
         cursor = self.conn.cursor()
         query = """
@@ -6517,8 +6698,8 @@ class TMCloudIntegratedSearch:
                 ON taa.applicant_agent_code = ari.applicant_code
             LEFT JOIN trademark_search ts ON taa.app_num = ts.app_num
             LEFT JOIN trademark_case_info tci ON taa.app_num = tci.app_num
-            WHERE (ari.applicant_address LIKE ? ESCAPE '\\' 
-                   OR taa.applicant_agent_address LIKE ? ESCAPE '\\')
+            WHERE (ari.applicant_address_norm LIKE ? ESCAPE '\\'
+                   OR taa.applicant_agent_address_norm LIKE ? ESCAPE '\\')
                 AND ((ari.applicant_address IS NOT NULL AND ari.applicant_address != '（省略）')
                      OR (taa.applicant_agent_address IS NOT NULL AND taa.applicant_agent_address != '（省略）'))
             ORDER BY tci.app_date DESC
@@ -6527,6 +6708,7 @@ class TMCloudIntegratedSearch:
         cursor.execute(query, (pattern, pattern, limit))
         return [dict(row) for row in cursor.fetchall()]
     
+    @cached_search
     def search_by_trademark_length(self, length_range: str, limit: int = 100) -> List[Dict[str, Any]]:
         """商標文字数検索（TMSONAR ID:132）
         
@@ -6563,6 +6745,7 @@ class TMCloudIntegratedSearch:
         cursor.execute(query, (min_len, max_len, limit))
         return [dict(row) for row in cursor.fetchall()]
     
+    @cached_search
     def search_by_phonetic_length(self, length_range: str, limit: int = 100) -> List[Dict[str, Any]]:
         """称呼音数検索（TMSONAR ID:133）
         
@@ -6603,6 +6786,7 @@ class TMCloudIntegratedSearch:
         cursor.execute(query, (min_len, max_len, limit))
         return [dict(row) for row in cursor.fetchall()]
     
+    @cached_search
     def search_by_class_count(self, count_range: str, limit: int = 100) -> List[Dict[str, Any]]:
         """区分数検索（TMSONAR ID:137）
         
@@ -6660,6 +6844,7 @@ class TMCloudIntegratedSearch:
         cursor.execute(query, (min_count, max_count, limit))
         return [dict(row) for row in cursor.fetchall()]
     
+    @cached_search
     def search_by_applicant_count(self, count_range: str, limit: int = 100) -> List[Dict[str, Any]]:
         """出願人/権利者数検索（TMSONAR ID:138）
         
@@ -6718,6 +6903,7 @@ class TMCloudIntegratedSearch:
         cursor.execute(query, (min_count, max_count, limit))
         return [dict(row) for row in cursor.fetchall()]
     
+    @cached_search
     def search_by_phonetic_count(self, count_range: str, limit: int = 100) -> List[Dict[str, Any]]:
         """称呼数検索（TMSONAR ID:139）
         
@@ -6771,6 +6957,7 @@ class TMCloudIntegratedSearch:
         cursor.execute(query, (min_count, max_count, limit))
         return [dict(row) for row in cursor.fetchall()]
     
+    @cached_search
     def search_by_additional_info(self, info_codes: str, limit: int = 100) -> List[Dict[str, Any]]:
         """付加情報検索（TMSONAR ID:128）
         
@@ -6828,6 +7015,7 @@ class TMCloudIntegratedSearch:
         cursor.execute(query, params)
         return [dict(row) for row in cursor.fetchall()]
     
+    @cached_search
     def search_by_country_code(self, country_codes: str, limit: int = 100) -> List[Dict[str, Any]]:
         """国県コード検索（TMSONAR ID:129）
         
@@ -6944,6 +7132,7 @@ class TMCloudIntegratedSearch:
         cursor.execute(query, (start_date, end_date, limit))
         return [dict(row) for row in cursor.fetchall()]
     
+    @cached_search
     def search_by_expiry_date(self, date_range: str, limit: int = 100) -> List[Dict[str, Any]]:
         """存続期間満了日検索（TMSONAR ID:114）
         
@@ -6956,6 +7145,7 @@ class TMCloudIntegratedSearch:
         """
         return self._search_by_date_field('conti_prd_expire_date', date_range, 'trademark_management_info', limit)
     
+    @cached_search
     def search_by_payment_date(self, date_range: str, limit: int = 100) -> List[Dict[str, Any]]:
         """分納満了日検索（TMSONAR ID:121）
         
@@ -6968,6 +7158,7 @@ class TMCloudIntegratedSearch:
         """
         return self._search_by_date_field('next_pen_payment_limit_date', date_range, 'trademark_management_info', limit)
     
+    @cached_search
     def search_by_decision_date(self, date_range: str, limit: int = 100) -> List[Dict[str, Any]]:
         """最終処分日検索（TMSONAR ID:116）
         
@@ -6980,6 +7171,7 @@ class TMCloudIntegratedSearch:
         """
         return self._search_by_date_field('final_decision_date', date_range, 'trademark_management_info', limit)
     
+    @cached_search
     def search_by_appeal_num(self, appeal_nums: str, limit: int = 100) -> List[Dict[str, Any]]:
         """審判番号検索（TMSONAR ID:120）
         
@@ -7034,6 +7226,7 @@ class TMCloudIntegratedSearch:
         
         return [dict(row) for row in cursor.fetchall()]
     
+    @cached_search
     def search_by_decision_class(self, class_expr: str, limit: int = 100) -> List[Dict[str, Any]]:
         """審決分類検索（TMSONAR ID:109）
         
@@ -7087,6 +7280,7 @@ class TMCloudIntegratedSearch:
         cursor.execute(query, params)
         return [dict(row) for row in cursor.fetchall()]
     
+    @cached_search
     def search_by_info_provision_count(self, count_range: str, limit: int = 100) -> List[Dict[str, Any]]:
         """情報提供数検索（刊行物等提出書の提出数）（TMSONAR ID:135）
         
@@ -7142,6 +7336,7 @@ class TMCloudIntegratedSearch:
         cursor.execute(query, (min_count, max_count, limit))
         return [dict(row) for row in cursor.fetchall()]
     
+    @cached_search
     def search_by_browsing_request_count(self, count_range: str, limit: int = 100) -> List[Dict[str, Any]]:
         """閲覧請求数検索（ファイル記録事項の閲覧請求書の提出数）（TMSONAR ID:136）
         
@@ -7197,418 +7392,525 @@ class TMCloudIntegratedSearch:
         cursor.execute(query, (min_count, max_count, limit))
         return [dict(row) for row in cursor.fetchall()]
     
-    def _format_unified_result(self, app_nums: List[str], search_specific_data: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    # ========== 商標画像 ==========
+    
+    def get_trademark_image(self, app_num: str, size: str = 'full') -> Optional[bytes]:
+        """商標画像（最初のページ）をJPEGのバイト列で取得
+        
+        trademark_image_primary（インポート時にデコード済み）を主キーで参照する。
+        
+        Args:
+            app_num: 出願番号
+            size: 'full'（原寸）または'thumb'（サムネイル。未生成の場合は原寸）
+        
+        Returns:
+            JPEGデータ（画像が無い場合はNone）
+        """
+        if size not in ('full', 'thumb'):
+            raise ValueError(f"不明な画像サイズです: {size}")
+        
+        app_num = app_num.replace('-', '').replace('－', '')
+        column = 'COALESCE(thumb, jpeg)' if size == 'thumb' else 'jpeg'
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT {column} FROM trademark_image_primary WHERE app_num = ?", (app_num,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+    
+    # ========== 統一フォーマット（ハイドレーション） ==========
+    
+    # 統一フォーマット用の付随情報（ファセット）取得クエリ
+    # 各クエリは一時テーブル temp.hydrate_app_nums の出願番号に対して1回ずつ実行し、
+    # 結果はPython側で出願番号ごとに組み立てる（区分×類似群の直積を作らない）
+    HYDRATION_FACET_QUERIES = {
+        'basic': """
+            SELECT DISTINCT
+                tci.app_num,
+                tci.app_date,
+                tci.reg_article_reg_num as reg_num,
+                tci.reg_date,
+                td.indct_use_t,
+                tsc.standard_char_t,
+                ts.search_use_t,
+                tci.final_disposition_type,
+                tci.final_disposition_date,
+                tci.law_code,
+                tci.reg_article_gazette_date,
+                tci.pub_article_gazette_date,
+                tmi.conti_prd_expire_date,
+                tmi.next_pen_payment_limit_date,
+                tbi.conti_prd_expire_date as basic_expiry_date,
+                -- 分納関連フィールド
+                tbi.installments_id,
+                tbi.instllmnt_expr_date_aft_des_date,
+                -- 追加項目
+                tci.app_type1,
+                tci.app_type2,
+                tci.app_type3,
+                tci.app_type4,
+                tci.app_type5,
+                tci.orig_app_type,
+                tci.article3_2_flag,
+                tci.article5_4_flag,
+                tci.exam_type,
+                tci.decision_type,
+                tci.applicable_law_class,
+                -- 商標タイプ判定用フラグ
+                tci.standard_char_exist,
+                tci.special_mark_exist,
+                tci.color_exist,
+                -- 補助情報
+                tci.defensive_num,
+                tbi.prior_app_right_occr_date,
+                tci.renewal_reg_num,
+                tci.renewal_defensive_num
+            FROM temp.hydrate_app_nums h
+            -- CROSS JOINで一時テーブルを外側に固定（統計が無くても全件走査しない）
+            CROSS JOIN trademark_case_info tci ON tci.app_num = h.app_num
+            LEFT JOIN trademark_display td ON tci.app_num = td.app_num
+            LEFT JOIN trademark_standard_char tsc ON tci.app_num = tsc.app_num
+            LEFT JOIN trademark_search ts ON tci.app_num = ts.app_num
+            LEFT JOIN trademark_management_info tmi ON tci.app_num = tmi.app_num
+            LEFT JOIN trademark_basic_items tbi ON tci.app_num = tbi.app_num
+        """,
+        'image': """
+            SELECT app_num, jpeg
+            FROM trademark_image_primary
+            WHERE app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+        """,
+        'image_flag': """
+            -- 画像の有無のみ（画像本体は読まない）
+            SELECT app_num
+            FROM trademark_image_primary
+            WHERE app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+        """,
+        'phonetics': """
+            SELECT 
+                app_num,
+                GROUP_CONCAT(DISTINCT pronunciation) as phonetics
+            FROM trademark_pronunciations
+            WHERE app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+            GROUP BY app_num
+        """,
+        'applicants': """
+            SELECT 
+                taa.app_num,
+                GROUP_CONCAT(DISTINCT 
+                    CASE 
+                        WHEN taa.applicant_agent_type = '1' THEN 
+                            COALESCE(ari.applicant_name, taa.applicant_agent_name)
+                        ELSE NULL 
+                    END
+                ) as applicants,
+                GROUP_CONCAT(DISTINCT 
+                    CASE 
+                        WHEN taa.applicant_agent_type = '1' THEN 
+                            taa.applicant_agent_address
+                        ELSE NULL 
+                    END
+                ) as applicant_addresses,
+                GROUP_CONCAT(DISTINCT 
+                    CASE 
+                        WHEN taa.applicant_agent_type = '1' THEN 
+                            taa.country_prefecture_code
+                        ELSE NULL 
+                    END
+                ) as applicant_country_codes,
+                GROUP_CONCAT(DISTINCT 
+                    CASE 
+                        WHEN taa.applicant_agent_type = '2' THEN 
+                            taa.applicant_agent_name
+                        ELSE NULL 
+                    END
+                ) as agents
+            FROM trademark_applicants_agents taa
+            LEFT JOIN applicant_registration_info ari 
+                ON taa.applicant_agent_code = ari.applicant_code
+            WHERE taa.app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+            GROUP BY taa.app_num
+        """,
+        'right_holders': """
+            SELECT 
+                app_num,
+                GROUP_CONCAT(DISTINCT right_person_name) as right_holders
+            FROM trademark_right_holders
+            WHERE app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+            GROUP BY app_num
+        """,
+        'classes': """
+            SELECT 
+                app_num,
+                GROUP_CONCAT(DISTINCT class_num) as classes
+            FROM trademark_goods_services
+            WHERE app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+            GROUP BY app_num
+        """,
+        'goods_services': """
+            SELECT 
+                app_num,
+                class_num,
+                GROUP_CONCAT(goods_services_name, '、') as goods_services_name
+            FROM (
+                SELECT DISTINCT app_num, class_num, goods_services_name
+                FROM trademark_goods_services
+                WHERE app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+            )
+            GROUP BY app_num, class_num
+        """,
+        'similar_groups': """
+            SELECT 
+                app_num,
+                class_num,
+                similar_group_codes
+            FROM trademark_similar_group_codes
+            WHERE app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+        """,
+        'vienna': """
+            SELECT 
+                app_num,
+                GROUP_CONCAT(DISTINCT 
+                    CASE 
+                        WHEN complement_sub_class = '00' AND small_class = '00' AND mid_class = '00' THEN large_class
+                        WHEN complement_sub_class = '00' AND small_class = '00' THEN large_class || '.' || mid_class
+                        WHEN complement_sub_class = '00' THEN large_class || '.' || mid_class || '.' || small_class
+                        ELSE large_class || '.' || mid_class || '.' || small_class || '.' || complement_sub_class
+                    END
+                ) as vienna_codes
+            FROM trademark_vienna_codes
+            WHERE app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+            GROUP BY app_num
+        """,
+        'rejections': """
+            SELECT 
+                app_num,
+                GROUP_CONCAT(DISTINCT rejection_reason_code) as rejection_codes,
+                MAX(dispatch_date) as latest_rejection_date
+            FROM trademark_draft_records
+            WHERE app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+            AND rejection_reason_code IS NOT NULL
+            AND rejection_reason_code != ''
+            GROUP BY app_num
+        """,
+        'detailed_description': """
+            SELECT 
+                app_num,
+                GROUP_CONCAT(detailed_description, ' ') as detailed_description
+            FROM trademark_detailed_descriptions
+            WHERE app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+            GROUP BY app_num
+        """,
+        'appeals': """
+            SELECT 
+                app_num,
+                GROUP_CONCAT(DISTINCT appeal_num) as appeal_nums,
+                GROUP_CONCAT(DISTINCT appeal_type) as appeal_types
+            FROM trademark_appeal_cases
+            WHERE app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+            GROUP BY app_num
+        """,
+        'progress': """
+            SELECT 
+                app_num,
+                GROUP_CONCAT(
+                    intermediate_doc_code || ':' || record_date, '|'
+                ) as progress_records
+            FROM (
+                -- 審査中間記録（従来通り）
+                SELECT app_num, intermediate_doc_code, creation_date as record_date
+                FROM trademark_draft_records
+                WHERE app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+                AND intermediate_doc_code IS NOT NULL
+                UNION ALL
+                SELECT app_num, intermediate_doc_code, receipt_date as record_date
+                FROM trademark_application_records
+                WHERE app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+                AND intermediate_doc_code IS NOT NULL
+                
+                -- 審判中間記録を追加
+                -- trial_received_docsから取得（C60も含む）
+                UNION ALL
+                SELECT tc.app_num, trd.doc_type as intermediate_doc_code, trd.received_date as record_date
+                FROM trial_cases tc
+                INNER JOIN trial_received_docs trd ON tc.appeal_num = trd.appeal_num
+                WHERE tc.app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+                AND trd.doc_type IS NOT NULL
+                AND trd.doc_type != ''
+                
+                UNION ALL
+                SELECT tc.app_num, tdd.doc_type as intermediate_doc_code, tdd.dispatch_date as record_date
+                FROM trial_cases tc
+                INNER JOIN trial_dispatched_docs tdd ON tc.appeal_num = tdd.appeal_num
+                WHERE tc.app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+                AND tdd.doc_type IS NOT NULL
+                AND tdd.doc_type != ''
+                
+                -- 登録中間記録を追加
+                UNION ALL
+                SELECT progress_app_num as app_num, reg_intermediate_code as intermediate_doc_code, process_date as record_date
+                FROM trademark_progress_info
+                WHERE progress_app_num IN (SELECT app_num FROM temp.hydrate_app_nums)
+                AND reg_intermediate_code IS NOT NULL
+                AND reg_intermediate_code != ''
+                AND progress_app_num != '0000000000'
+                
+                ORDER BY app_num, record_date ASC
+            )
+            GROUP BY app_num
+        """,
+    }
+    
+    # 取得するファセットのプロファイル
+    # summary: 一覧表示用（商品役務・中間記録などを取得しない）
+    # full: 詳細表示用（全ファセット）
+    # 画像本体はどちらも取得せず has_image のみ返す（get_trademark_imageで別途取得）。
+    # インラインのbase64が必要な場合は 'image' ファセットを明示的に指定する
+    FIELD_PROFILES = {
+        'summary': ('basic', 'image_flag', 'phonetics', 'applicants', 'right_holders', 'classes'),
+        'full': ('basic', 'image_flag', 'phonetics', 'applicants', 'right_holders', 'classes',
+                 'goods_services', 'similar_groups', 'vienna', 'rejections',
+                 'detailed_description', 'appeals', 'progress'),
+    }
+    
+    def _resolve_fields(self, fields) -> Tuple[str, ...]:
+        """fields指定（プロファイル名またはファセット名のリスト）を取得ファセットに変換"""
+        if fields is None:
+            fields = 'full'
+        if isinstance(fields, str):
+            if fields not in self.FIELD_PROFILES:
+                raise ValueError(f"不明なフィールドプロファイルです: {fields}")
+            return self.FIELD_PROFILES[fields]
+        
+        facets = list(dict.fromkeys(fields))
+        unknown = [facet for facet in facets if facet not in self.HYDRATION_FACET_QUERIES]
+        if unknown:
+            raise ValueError(f"不明なファセットです: {', '.join(unknown)}")
+        # 基本情報は常に取得
+        if 'basic' not in facets:
+            facets.insert(0, 'basic')
+        return tuple(facets)
+    
+    def _load_hydration_app_nums(self, app_nums: List[str]):
+        """ハイドレーション対象の出願番号を一時テーブルに格納する
+        
+        一時テーブルは接続ごとに作られるため、プール利用時も他の検索と干渉しない。
+        読み取り専用（mode=ro）接続でもTEMPテーブルは作成できる。
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("CREATE TEMP TABLE IF NOT EXISTS hydrate_app_nums (app_num TEXT PRIMARY KEY)")
+        cursor.execute("DELETE FROM temp.hydrate_app_nums")
+        cursor.executemany(
+            "INSERT OR IGNORE INTO temp.hydrate_app_nums (app_num) VALUES (?)",
+            ((app_num,) for app_num in app_nums)
+        )
+    
+    def _fetch_facet(self, facet: str) -> Dict[str, Any]:
+        """ファセットを1クエリで取得し、出願番号をキーとした辞書で返す
+        
+        区分ごとのファセット（goods_services/similar_groups）は行のリストを値とする。
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(self.HYDRATION_FACET_QUERIES[facet])
+        
+        facet_data = {}
+        if facet in ('goods_services', 'similar_groups'):
+            for row in cursor.fetchall():
+                facet_data.setdefault(row['app_num'], []).append(row)
+        else:
+            for row in cursor.fetchall():
+                # 同一出願番号の重複行は最初の行を採用
+                facet_data.setdefault(row['app_num'], row)
+        return facet_data
+    
+    def _format_unified_result(self, app_nums: List[str], search_specific_data: Dict[str, Any] = None,
+                               fields='full') -> List[Dict[str, Any]]:
         """統一フォーマットで検索結果を整形
         
+        出願番号を一時テーブルに格納し、ファセット（称呼・出願人・区分・商品役務・
+        類似群・ウィーン・拒絶・審判・中間記録など）ごとに1回ずつクエリを実行して
+        Python側で組み立てる。組み立てたレコードは出願番号ごとにキャッシュ
+        （tmcloud_cache.RecordCache）し、キャッシュに無い出願番号だけを取得する。
+        
         Args:
             app_nums: 出願番号リスト
             search_specific_data: 検索種別固有のデータ（出願番号をキーとした辞書）
+            fields: 取得する項目。'summary'（一覧用）/'full'（詳細用）のプロファイル名、
+                    またはファセット名のリスト。取得しなかったファセットの項目は結果に含めない
         
         Returns:
-            統一フォーマットの検索結果リスト
+            統一フォーマットの検索結果リスト（出願日の降順）
         """
         if not app_nums:
             return []
         
-        cursor = self.conn.cursor()
-        results = []
+        selected = self._resolve_fields(fields)
+        unique_app_nums = list(dict.fromkeys(app_nums))
+        
+        # 整形済みのレコードはキャッシュから取り、残りだけをDBから取得する
+        # （画像本体を含むレコードは大きいのでキャッシュしない）
+        cache = self.record_cache if 'image' not in selected else None
+        build_id = self._current_build_id() if cache is not None else None
+        records = cache.get_many(build_id, selected, unique_app_nums) if cache is not None else {}
+        missing = [app_num for app_num in unique_app_nums if app_num not in records]
+        if missing:
+            hydrated = self._hydrate_records(missing, selected)
+            if cache is not None:
+                cache.put_many(build_id, selected, hydrated)
+            records.update(hydrated)
+        
+        # 出願日の降順（NULLは末尾、同日は入力順）
+        basic_infos = [records[app_num] for app_num in unique_app_nums if app_num in records]
+        basic_infos.sort(key=lambda data: (data['app_date'] is not None, data['app_date'] or ''), reverse=True)
+        
+        return [
+            {
+                'basic_info': data,
+                'search_specific': search_specific_data.get(data['app_num'], {}) if search_specific_data else {}
+            }
+            for data in basic_infos
+        ]
+    
+    def _hydrate_records(self, app_nums: List[str], selected: Tuple[str, ...]) -> Dict[str, Dict[str, Any]]:
+        """出願番号の統一フォーマットのレコード（basic_info）をDBから組み立てる
+        
+        Returns:
+            出願番号をキーとしたレコードの辞書（DBに無い出願番号は含めない）
+        """
+        self._load_hydration_app_nums(app_nums)
+        try:
+            facets = {facet: self._fetch_facet(facet) for facet in selected}
+        finally:
+            # 一時テーブルへの書き込みで開始した読み取りトランザクションを閉じる
+            self.conn.execute("DELETE FROM temp.hydrate_app_nums")
+            self.conn.commit()
+        
+        def split_list(row, column):
+            return row[column].split(',') if row is not None and row[column] else []
+        
+        def column(row, name):
+            return row[name] if row is not None else None
         
-        # IN句の制限を考慮してバッチ処理
-        for batch_start in range(0, len(app_nums), self.IN_CLAUSE_LIMIT):
-            batch_app_nums = app_nums[batch_start:batch_start + self.IN_CLAUSE_LIMIT]
-            placeholders = ','.join(['?' for _ in batch_app_nums])
+        records = {}
+        for row in facets['basic'].values():
+            app_num = row['app_num']
             
-            # 基本情報の取得クエリ
-            query = f"""
-                WITH image_data AS (
-                    SELECT 
-                        app_num,
-                        GROUP_CONCAT(image_data, '') as image_data  -- 複数行の画像データを結合
-                    FROM (
-                        -- 最初のページのみ取得（複数ページの場合は最小page_num）
-                        SELECT ti.app_num, ti.rec_seq_num, ti.image_data
-                        FROM trademark_images ti
-                        WHERE ti.app_num IN ({placeholders})
-                        AND ti.image_data IS NOT NULL
-                        AND LENGTH(ti.image_data) > 0
-                        AND ti.compression_format = 'JP'
-                        AND (
-                            -- page_numがNULLの場合、または最小のpage_numのレコード
-                            ti.page_num IS NULL 
-                            OR ti.page_num = (
-                                SELECT MIN(page_num)
-                                FROM trademark_images
-                                WHERE app_num = ti.app_num
-                                AND page_num IS NOT NULL
-                            )
-                        )
-                        AND ti.ROWID IN (
-                            SELECT MIN(ROWID)
-                            FROM trademark_images
-                            WHERE app_num = ti.app_num
-                            AND rec_seq_num = ti.rec_seq_num
-                            AND (page_num = ti.page_num OR (page_num IS NULL AND ti.page_num IS NULL))
-                            AND image_data IS NOT NULL
-                            GROUP BY app_num, rec_seq_num, page_num
-                        )
-                        ORDER BY ti.app_num, ti.rec_seq_num
-                    )
-                    GROUP BY app_num
-                ),
-                basic_data AS (
-                    SELECT DISTINCT
-                        tci.app_num,
-                        tci.app_date,
-                        tci.reg_article_reg_num as reg_num,
-                        tci.reg_date,
-                        -- 商標名の優先順位: 画像→商標見本→標準文字→表示用商標
-                        CASE 
-                            WHEN ti.image_data IS NOT NULL THEN '[商標画像]'
-                            ELSE COALESCE(
-                                td.indct_use_t,
-                                tsc.standard_char_t,
-                                ts.search_use_t
-                            )
-                        END as trademark_name,
-                        ti.image_data as trademark_image_data,
-                        tci.final_disposition_type,
-                        tci.final_disposition_date,
-                        tci.law_code,
-                        tci.reg_article_gazette_date,
-                        tci.pub_article_gazette_date,
-                        tmi.conti_prd_expire_date,
-                        tmi.next_pen_payment_limit_date,
-                        tbi.conti_prd_expire_date as basic_expiry_date,
-                        -- 分納関連フィールド
-                        tbi.installments_id,
-                        tbi.instllmnt_expr_date_aft_des_date,
-                        -- 追加項目
-                        tci.app_type1,
-                        tci.app_type2,
-                        tci.app_type3,
-                        tci.app_type4,
-                        tci.app_type5,
-                        tci.orig_app_type,
-                        tci.article3_2_flag,
-                        tci.article5_4_flag,
-                        tci.exam_type,
-                        tci.decision_type,
-                        tci.applicable_law_class,
-                        -- 商標タイプ判定用フラグ
-                        tci.standard_char_exist,
-                        tci.special_mark_exist,
-                        tci.color_exist,
-                        -- 補助情報
-                        tci.defensive_num,
-                        tbi.prior_app_right_occr_date,
-                        tci.renewal_reg_num,
-                        tci.renewal_defensive_num
-                    FROM trademark_case_info tci
-                    LEFT JOIN image_data ti ON tci.app_num = ti.app_num
-                    LEFT JOIN trademark_display td ON tci.app_num = td.app_num
-                    LEFT JOIN trademark_standard_char tsc ON tci.app_num = tsc.app_num
-                    LEFT JOIN trademark_search ts ON tci.app_num = ts.app_num
-                    LEFT JOIN trademark_management_info tmi ON tci.app_num = tmi.app_num
-                    LEFT JOIN trademark_basic_items tbi ON tci.app_num = tbi.app_num
-                    WHERE tci.app_num IN ({placeholders})
-                ),
-                phonetics_data AS (
-                    SELECT 
-                        app_num,
-                        GROUP_CONCAT(DISTINCT pronunciation) as phonetics
-                    FROM trademark_pronunciations
-                    WHERE app_num IN ({placeholders})
-                    GROUP BY app_num
-                ),
-                applicants_data AS (
-                    SELECT 
-                        taa.app_num,
-                        GROUP_CONCAT(DISTINCT 
-                            CASE 
-                                WHEN taa.applicant_agent_type = '1' THEN 
-                                    COALESCE(ari.applicant_name, taa.applicant_agent_name)
-                                ELSE NULL 
-                            END
-                        ) as applicants,
-                        GROUP_CONCAT(DISTINCT 
-                            CASE 
-                                WHEN taa.applicant_agent_type = '1' THEN 
-                                    taa.applicant_agent_address
-                                ELSE NULL 
-                            END
-                        ) as applicant_addresses,
-                        GROUP_CONCAT(DISTINCT 
-                            CASE 
-                                WHEN taa.applicant_agent_type = '1' THEN 
-                                    taa.country_prefecture_code
-                                ELSE NULL 
-                            END
-                        ) as applicant_country_codes,
-                        GROUP_CONCAT(DISTINCT 
-                            CASE 
-                                WHEN taa.applicant_agent_type = '2' THEN 
-                                    taa.applicant_agent_name
-                                ELSE NULL 
-                            END
-                        ) as agents
-                    FROM trademark_applicants_agents taa
-                    LEFT JOIN applicant_registration_info ari 
-                        ON taa.applicant_agent_code = ari.applicant_code
-                    WHERE taa.app_num IN ({placeholders})
-                    GROUP BY taa.app_num
-                ),
-                right_holders_data AS (
-                    SELECT 
-                        app_num,
-                        GROUP_CONCAT(DISTINCT right_person_name) as right_holders
-                    FROM trademark_right_holders
-                    WHERE app_num IN ({placeholders})
-                    GROUP BY app_num
-                ),
-                classes_data AS (
-                    SELECT 
-                        app_num,
-                        GROUP_CONCAT(DISTINCT class_num) as classes
-                    FROM trademark_goods_services
-                    WHERE app_num IN ({placeholders})
-                    GROUP BY app_num
-                ),
-                goods_services_data AS (
-                    SELECT 
-                        app_num,
-                        class_num,
-                        GROUP_CONCAT(goods_services_name, '、') as goods_services_name
-                    FROM (
-                        SELECT DISTINCT app_num, class_num, goods_services_name
-                        FROM trademark_goods_services
-                        WHERE app_num IN ({placeholders})
-                    )
-                    GROUP BY app_num, class_num
-                ),
-                similar_groups_data AS (
-                    SELECT 
-                        app_num,
-                        class_num,
-                        similar_group_codes
-                    FROM trademark_similar_group_codes
-                    WHERE app_num IN ({placeholders})
-                ),
-                vienna_data AS (
-                    SELECT 
-                        app_num,
-                        GROUP_CONCAT(DISTINCT 
-                            CASE 
-                                WHEN complement_sub_class = '00' AND small_class = '00' AND mid_class = '00' THEN large_class
-                                WHEN complement_sub_class = '00' AND small_class = '00' THEN large_class || '.' || mid_class
-                                WHEN complement_sub_class = '00' THEN large_class || '.' || mid_class || '.' || small_class
-                                ELSE large_class || '.' || mid_class || '.' || small_class || '.' || complement_sub_class
-                            END
-                        ) as vienna_codes
-                    FROM trademark_vienna_codes
-                    WHERE app_num IN ({placeholders})
-                    GROUP BY app_num
-                ),
-                rejection_data AS (
-                    SELECT 
-                        app_num,
-                        GROUP_CONCAT(DISTINCT rejection_reason_code) as rejection_codes,
-                        MAX(dispatch_date) as latest_rejection_date
-                    FROM trademark_draft_records
-                    WHERE app_num IN ({placeholders})
-                    AND rejection_reason_code IS NOT NULL
-                    AND rejection_reason_code != ''
-                    GROUP BY app_num
-                ),
-                detail_desc_data AS (
-                    SELECT 
-                        app_num,
-                        GROUP_CONCAT(detailed_description, ' ') as detailed_description
-                    FROM trademark_detailed_descriptions
-                    WHERE app_num IN ({placeholders})
-                    GROUP BY app_num
-                ),
-                appeal_data AS (
-                    SELECT 
-                        app_num,
-                        GROUP_CONCAT(DISTINCT appeal_num) as appeal_nums,
-                        GROUP_CONCAT(DISTINCT appeal_type) as appeal_types
-                    FROM trademark_appeal_cases
-                    WHERE app_num IN ({placeholders})
-                    GROUP BY app_num
-                ),
-                progress_data AS (
-                    SELECT 
-                        app_num,
-                        GROUP_CONCAT(
-                            intermediate_doc_code || ':' || record_date, '|'
-                        ) as progress_records
-                    FROM (
-                        -- 審査中間記録（従来通り）
-                        SELECT app_num, intermediate_doc_code, creation_date as record_date
-                        FROM trademark_draft_records
-                        WHERE app_num IN ({placeholders})
-                        AND intermediate_doc_code IS NOT NULL
-                        UNION ALL
-                        SELECT app_num, intermediate_doc_code, receipt_date as record_date
-                        FROM trademark_application_records
-                        WHERE app_num IN ({placeholders})
-                        AND intermediate_doc_code IS NOT NULL
-                        
-                        -- 審判中間記録を追加
-                        -- trial_received_docsから取得（C60も含む）
-                        UNION ALL
-                        SELECT tc.app_num, trd.doc_type as intermediate_doc_code, trd.received_date as record_date
-                        FROM trial_cases tc
-                        INNER JOIN trial_received_docs trd ON tc.appeal_num = trd.appeal_num
-                        WHERE tc.app_num IN ({placeholders})
-                        AND trd.doc_type IS NOT NULL
-                        AND trd.doc_type != ''
-                        
-                        UNION ALL
-                        SELECT tc.app_num, tdd.doc_type as intermediate_doc_code, tdd.dispatch_date as record_date
-                        FROM trial_cases tc
-                        INNER JOIN trial_dispatched_docs tdd ON tc.appeal_num = tdd.appeal_num
-                        WHERE tc.app_num IN ({placeholders})
-                        AND tdd.doc_type IS NOT NULL
-                        AND tdd.doc_type != ''
-                        
-                        -- 登録中間記録を追加
-                        UNION ALL
-                        SELECT progress_app_num as app_num, reg_intermediate_code as intermediate_doc_code, process_date as record_date
-                        FROM trademark_progress_info
-                        WHERE progress_app_num IN ({placeholders})
-                        AND reg_intermediate_code IS NOT NULL
-                        AND reg_intermediate_code != ''
-                        AND progress_app_num != '0000000000'
-                        
-                        ORDER BY app_num, record_date ASC
-                    )
-                    GROUP BY app_num
+            if 'image' in facets:
+                image_data = column(facets['image'].get(app_num), 'jpeg')
+                has_image = image_data is not None
+            else:
+                image_data = None
+                has_image = app_num in facets.get('image_flag', {})
+            
+            # 商標名の優先順位: 画像→商標見本→標準文字→表示用商標
+            if has_image:
+                trademark_name = '[商標画像]'
+            else:
+                trademark_name = next(
+                    (name for name in (row['indct_use_t'], row['standard_char_t'], row['search_use_t']) if name is not None),
+                    None
                 )
-                SELECT 
-                    bd.*,
-                    pd.phonetics,
-                    ad.applicants,
-                    ad.applicant_addresses,
-                    ad.applicant_country_codes,
-                    ad.agents,
-                    rhd.right_holders,
-                    cd.classes,
-                    gsd.class_num as gs_class_num,
-                    gsd.goods_services_name,
-                    sgd.class_num as sg_class_num,
-                    sgd.similar_group_codes,
-                    vd.vienna_codes,
-                    rd.rejection_codes,
-                    rd.latest_rejection_date,
-                    ddd.detailed_description,
-                    apd.appeal_nums,
-                    apd.appeal_types,
-                    prd.progress_records
-                FROM basic_data bd
-                LEFT JOIN phonetics_data pd ON bd.app_num = pd.app_num
-                LEFT JOIN applicants_data ad ON bd.app_num = ad.app_num
-                LEFT JOIN right_holders_data rhd ON bd.app_num = rhd.app_num
-                LEFT JOIN classes_data cd ON bd.app_num = cd.app_num
-                LEFT JOIN goods_services_data gsd ON bd.app_num = gsd.app_num
-                LEFT JOIN similar_groups_data sgd ON bd.app_num = sgd.app_num
-                LEFT JOIN vienna_data vd ON bd.app_num = vd.app_num
-                LEFT JOIN rejection_data rd ON bd.app_num = rd.app_num
-                LEFT JOIN detail_desc_data ddd ON bd.app_num = ddd.app_num
-                LEFT JOIN appeal_data apd ON bd.app_num = apd.app_num
-                LEFT JOIN progress_data prd ON bd.app_num = prd.app_num
-                ORDER BY bd.app_date DESC
-            """
             
-            # パラメータを17回繰り返す（各サブクエリで使用）
-            params = batch_app_nums * 17
-            cursor.execute(query, params)
+            data = {
+                'app_num': app_num,
+                'app_date': row['app_date'],
+                'reg_num': row['reg_num'],
+                'reg_date': row['reg_date'],
+                'trademark_name': trademark_name,
+                'has_image': has_image,
+                # ステータス情報を追加（コードを日本語に変換）
+                'final_disposition_type': self._convert_code_to_name(row['final_disposition_type'], 'final_disposition'),
+                'final_disposition_date': row['final_disposition_date'],
+                # 最終処分記事（日本語変換）
+                'final_disposition_article': self._format_final_disposition(row['final_disposition_type']),
+                # 公報情報を追加
+                'reg_article_gazette_date': row['reg_article_gazette_date'],
+                'pub_article_gazette_date': row['pub_article_gazette_date'],
+                # 存続期間・分納情報を追加
+                'conti_prd_expire_date': row['conti_prd_expire_date'] or row['basic_expiry_date'],  # management_infoまたはbasic_itemsから
+                # 分納期限日: installments_id='1'の場合は instllmnt_expr_date_aft_des_date を使用
+                'next_pen_payment_limit_date': (
+                    row['instllmnt_expr_date_aft_des_date'] 
+                    if row['installments_id'] == '1' and row['instllmnt_expr_date_aft_des_date']
+                    else row['next_pen_payment_limit_date']
+                ),
+                # 出願種別・付加情報（コードを日本語に変換）
+                'app_type1': self._convert_code_to_name(row['app_type1'], 'app_type'),
+                'app_type2': self._convert_code_to_name(row['app_type2'], 'app_type'),
+                'app_type3': self._convert_code_to_name(row['app_type3'], 'app_type'),
+                'app_type4': self._convert_code_to_name(row['app_type4'], 'app_type'),
+                'app_type5': self._convert_code_to_name(row['app_type5'], 'app_type'),
+                'orig_app_type': self._convert_code_to_name(row['orig_app_type'], 'app_type'),
+                'article3_2_flag': row['article3_2_flag'],
+                'article5_4_flag': row['article5_4_flag'],
+                'exam_type': self._convert_code_to_name(row['exam_type'], 'exam_type'),
+                'decision_type': self._convert_code_to_name(row['decision_type'], 'decision_type'),
+                'applicable_law_class': self._convert_code_to_name(row['applicable_law_class'], 'international_class_version'),
+                # 商標タイプ
+                'trademark_type': self._determine_trademark_type(row),
+                # 補助情報
+                'defensive_num': row['defensive_num'],
+                'prior_app_right_occr_dt': row['prior_app_right_occr_date'],
+                'renewal_reg_num': row['renewal_reg_num'],
+                'renewal_defensive_num': row['renewal_defensive_num'],
+            }
             
-            # 結果を出願番号ごとにグループ化
-            app_num_data = {}
-            for row in cursor.fetchall():
-                app_num = row['app_num']
-                if app_num not in app_num_data:
-                    app_num_data[app_num] = {
-                        'app_num': app_num,
-                        'app_date': row['app_date'],
-                        'reg_num': row['reg_num'],
-                        'reg_date': row['reg_date'],
-                        'trademark_name': row['trademark_name'],
-                        'trademark_image_data': row['trademark_image_data'] if 'trademark_image_data' in dict(row) else None,  # 画像データを追加
-                        'phonetics': row['phonetics'].split(',') if row['phonetics'] else [],
-                        'applicants': row['applicants'].split(',') if row['applicants'] else [],
-                        'applicant_addresses': row['applicant_addresses'].split(',') if row['applicant_addresses'] else [],
-                        'applicant_country_codes': row['applicant_country_codes'].split(',') if row['applicant_country_codes'] else [],
-                        'agents': row['agents'].split(',') if row['agents'] else [],
-                        'right_holders': row['right_holders'].split(',') if row['right_holders'] else [],
-                        'classes': row['classes'].split(',') if row['classes'] else [],
-                        'goods_services': {},
-                        'similar_groups': {},
-                        'vienna_codes': row['vienna_codes'].split(',') if row['vienna_codes'] else [],
-                        # 拒絶理由情報を追加
-                        'rejection_codes': self._format_rejection_codes(row['rejection_codes']),
-                        'latest_rejection_date': row['latest_rejection_date'],
-                        # ステータス情報を追加（コードを日本語に変換）
-                        'final_disposition_type': self._convert_code_to_name(row['final_disposition_type'], 'final_disposition'),
-                        'final_disposition_date': row['final_disposition_date'],
-                        # 最終処分記事（日本語変換）
-                        'final_disposition_article': self._format_final_disposition(row['final_disposition_type']),
-                        # 公報情報を追加
-                        'reg_article_gazette_date': row['reg_article_gazette_date'],
-                        'pub_article_gazette_date': row['pub_article_gazette_date'],
-                        # 存続期間・分納情報を追加
-                        'conti_prd_expire_date': row['conti_prd_expire_date'] or row['basic_expiry_date'],  # management_infoまたはbasic_itemsから
-                        # 分納期限日: installments_id='1'の場合は instllmnt_expr_date_aft_des_date を使用
-                        'next_pen_payment_limit_date': (
-                            row['instllmnt_expr_date_aft_des_date'] 
-                            if row['installments_id'] == '1' and row['instllmnt_expr_date_aft_des_date']
-                            else row['next_pen_payment_limit_date']
-                        ),
-                        # 出願種別・付加情報（コードを日本語に変換）
-                        'app_type1': self._convert_code_to_name(row['app_type1'], 'app_type'),
-                        'app_type2': self._convert_code_to_name(row['app_type2'], 'app_type'),
-                        'app_type3': self._convert_code_to_name(row['app_type3'], 'app_type'),
-                        'app_type4': self._convert_code_to_name(row['app_type4'], 'app_type'),
-                        'app_type5': self._convert_code_to_name(row['app_type5'], 'app_type'),
-                        'orig_app_type': self._convert_code_to_name(row['orig_app_type'], 'app_type'),
-                        'article3_2_flag': row['article3_2_flag'],
-                        'article5_4_flag': row['article5_4_flag'],
-                        'exam_type': self._convert_code_to_name(row['exam_type'], 'exam_type'),
-                        'decision_type': self._convert_code_to_name(row['decision_type'], 'decision_type'),
-                        'applicable_law_class': self._convert_code_to_name(row['applicable_law_class'], 'international_class_version'),
-                        # 商標タイプ
-                        'trademark_type': self._determine_trademark_type(row),
-                        # 補助情報
-                        'defensive_num': row['defensive_num'],
-                        'prior_app_right_occr_dt': row['prior_app_right_occr_date'],
-                        'renewal_reg_num': row['renewal_reg_num'],
-                        'renewal_defensive_num': row['renewal_defensive_num'],
-                        'detailed_description': row['detailed_description'],
-                        # 審判情報
-                        'appeal_nums': row['appeal_nums'].split(',') if row['appeal_nums'] else [],
-                        'appeal_types': self._format_appeal_types(row['appeal_types']),
-                        # 中間記録（コードをマッピングして表示）
-                        'progress_records': self._format_progress_records(row['progress_records'])
-                    }
-                
-                # 指定商品・役務を追加
-                if row['gs_class_num'] and row['goods_services_name']:
-                    app_num_data[app_num]['goods_services'][row['gs_class_num']] = row['goods_services_name']
-                
-                # 類似群コードを追加
-                if row['sg_class_num'] and row['similar_group_codes']:
-                    app_num_data[app_num]['similar_groups'][row['sg_class_num']] = row['similar_group_codes'].split(',')
+            if 'image' in facets:
+                # 画像データ（互換性のためbase64文字列で返す）
+                data['trademark_image_data'] = base64.b64encode(image_data).decode('ascii') if image_data else None
             
-            # 検索種別固有データを追加
-            for app_num, data in app_num_data.items():
-                result = {
-                    'basic_info': data,
-                    'search_specific': search_specific_data.get(app_num, {}) if search_specific_data else {}
-                }
-                results.append(result)
+            if 'phonetics' in facets:
+                data['phonetics'] = split_list(facets['phonetics'].get(app_num), 'phonetics')
+            
+            if 'applicants' in facets:
+                applicants = facets['applicants'].get(app_num)
+                data['applicants'] = split_list(applicants, 'applicants')
+                data['applicant_addresses'] = split_list(applicants, 'applicant_addresses')
+                data['applicant_country_codes'] = split_list(applicants, 'applicant_country_codes')
+                data['agents'] = split_list(applicants, 'agents')
+            
+            if 'right_holders' in facets:
+                data['right_holders'] = split_list(facets['right_holders'].get(app_num), 'right_holders')
+            
+            if 'classes' in facets:
+                data['classes'] = split_list(facets['classes'].get(app_num), 'classes')
+            
+            # 指定商品・役務を追加（区分ごと）
+            if 'goods_services' in facets:
+                data['goods_services'] = {}
+                for gs_row in facets['goods_services'].get(app_num, []):
+                    if gs_row['class_num'] and gs_row['goods_services_name']:
+                        data['goods_services'][gs_row['class_num']] = gs_row['goods_services_name']
+            
+            # 類似群コードを追加（区分ごと）
+            if 'similar_groups' in facets:
+                data['similar_groups'] = {}
+                for sg_row in facets['similar_groups'].get(app_num, []):
+                    if sg_row['class_num'] and sg_row['similar_group_codes']:
+                        data['similar_groups'][sg_row['class_num']] = sg_row['similar_group_codes'].split(',')
+            
+            if 'vienna' in facets:
+                data['vienna_codes'] = split_list(facets['vienna'].get(app_num), 'vienna_codes')
+            
+            # 拒絶理由情報を追加
+            if 'rejections' in facets:
+                rejections = facets['rejections'].get(app_num)
+                data['rejection_codes'] = self._format_rejection_codes(column(rejections, 'rejection_codes'))
+                data['latest_rejection_date'] = column(rejections, 'latest_rejection_date')
+            
+            if 'detailed_description' in facets:
+                data['detailed_description'] = column(facets['detailed_description'].get(app_num), 'detailed_description')
+            
+            # 審判情報
+            if 'appeals' in facets:
+                appeals = facets['appeals'].get(app_num)
+                data['appeal_nums'] = split_list(appeals, 'appeal_nums')
+                data['appeal_types'] = self._format_appeal_types(column(appeals, 'appeal_types'))
+            
+            # 中間記録（コードをマッピングして表示）
+            if 'progress' in facets:
+                data['progress_records'] = self._format_progress_records(column(facets['progress'].get(app_num), 'progress_records'))
+            
+            records[app_num] = data
         
-        return results
+        return records
     
     def _format_rejection_codes(self, codes_str: str) -> List[str]:
         """拒絶理由コードを条文記事に変換"""
@@ -7831,41 +8133,392 @@ class TMCloudIntegratedSearch:
     
     # ========== 複合条件検索 ==========
     
-    def _search_by_class_for_complex(self, class_num: str, limit: int = 10000) -> List[Dict[str, Any]]:
-        """複合検索用の区分検索（内部メソッド）
-        trademark_goods_servicesテーブルから直接検索する
+    def _complex_condition_branches(self, search_type: str, keyword: str) -> Optional[List[Tuple[str, str, str, List[str]]]]:
+        """複合検索の1条件を出願番号を引く問い合わせにする（件数の上限なし）
+        
+        各検索メソッドと同じ条件（同じインデックス）で出願番号だけを引く。
+        複数の検索語は問い合わせのOR（UNION ALL）になる。
+        
+        Returns:
+            [(FROM句, 出願番号の列, WHERE句の条件, パラメータ)]。条件が空文字列の場合は全件。
+            未対応の検索タイプはNone
+        """
+        if search_type == 'trademark':
+            terms = QueryParser.split_terms(keyword)
+            if terms == ['?']:
+                return [("trademark_search ts", "ts.app_num", "", [])]
+            branches = []
+            for term in terms:
+                normalized = TextNormalizer.normalize_trademark_name(term)
+                if normalized.startswith('?') or '?' in normalized[1:-1]:
+                    # 後方一致・部分一致はtrigram FTS／n-gram表
+                    if not any(normalized.split('?')):
+                        branches.append(("trademark_search ts", "ts.app_num", "", []))
+                        continue
+                    source, condition, params = self._trademark_substring_match(normalized)
+                    branches.append((source, "ts.app_num", condition, params))
+                else:
+                    condition, params = QueryParser.norm_match('ts.search_use_t_norm', normalized)
+                    branches.append(("trademark_search ts", "ts.app_num", condition, params))
+            return branches
+        
+        if search_type in ('phonetic', 'phonetic_exact'):
+            terms = QueryParser.split_terms(keyword)
+            if terms == ['?']:
+                return [("trademark_pronunciations tp", "tp.app_num", "", [])]
+            branches = []
+            for term in terms:
+                source, condition, params = self._phonetic_match(term)
+                branches.append((source, "tp.app_num", condition, params))
+            return branches
+        
+        if search_type == 'class':
+            return [("trademark_goods_services tgs", "tgs.app_num", "tgs.class_num = ?", [keyword.strip().zfill(2)])]
+        
+        if search_type == 'applicant':
+            # カンマ区切りはOR、スペース区切りはAND（search_applicantと同じ）
+            if ',' in keyword or '，' in keyword:
+                terms = QueryParser.split_terms(keyword)
+                use_or = True
+            else:
+                terms = keyword.split()
+                use_or = False
+            source = ("trademark_applicants_agents taa "
+                      "INNER JOIN applicant_registration_info ari ON taa.applicant_agent_code = ari.applicant_code")
+            condition = "ari.applicant_name IS NOT NULL AND taa.applicant_agent_type = '1'"
+            if not terms or terms == ['?']:
+                return [(source, "taa.app_num", condition, [])]
+            where_clause, params = self._applicant_match(terms, use_or)
+            return [(source, "taa.app_num", f"({where_clause}) AND {condition}", params)]
+        
+        if search_type == 'goods_services':
+            # 項目内AND（同一の商品・役務で全キーワードがマッチ）
+            terms = QueryParser.split_terms(keyword)
+            if not terms or terms == ['?']:
+                return [("trademark_goods_services tgs", "tgs.app_num", "", [])]
+            matches = [
+                QueryParser.norm_match('tgs.goods_services_name_norm', term, TextNormalizer.normalize_text_jp)
+                for term in terms
+            ]
+            condition = " AND ".join(condition for condition, _ in matches)
+            params = [param for _, match_params in matches for param in match_params]
+            return [("trademark_goods_services tgs", "tgs.app_num", condition, params)]
+        
+        if search_type == 'app_num':
+            app_num = keyword.replace('-', '').replace('－', '')
+            return [("trademark_case_info tci", "tci.app_num", "tci.app_num = ?", [app_num])]
+        
+        if search_type == 'reg_num':
+            reg_num = keyword.replace('-', '').replace('－', '')
+            return [("trademark_case_info tci", "tci.app_num", "tci.reg_article_reg_num = ?", [reg_num])]
+        
+        if search_type == 'similar_group':
+            terms = QueryParser.split_terms(keyword)
+            if terms == ['?']:
+                return [("trademark_similar_group_index sgi", "sgi.app_num", "", [])]
+            branches = []
+            for term in terms:
+                condition, params = self._similar_group_match(term)
+                branches.append(("trademark_similar_group_index sgi", "sgi.app_num", condition, params))
+            return branches
+        
+        if search_type == 'rejection_reason':
+            # 拒絶条文コード（例: "3?" 前方一致、"30" 完全一致、カンマ区切り複数可）
+            terms = QueryParser.split_terms(keyword.strip())
+            if not terms or terms == ['?']:
+                condition = "tdr.rejection_reason_code IS NOT NULL AND tdr.rejection_reason_code != ''"
+                return [("trademark_draft_records tdr", "tdr.app_num", condition, [])]
+            branches = []
+            for term in terms:
+                condition, params = self._rejection_code_match(term)
+                branches.append(("trademark_draft_records tdr", "tdr.app_num", condition, params))
+            return branches
+        
+        if search_type == 'vienna_code':
+            # ウィーンコード（例: "1.3.20" 階層的前方一致、複数指定可）
+            terms = QueryParser.split_terms(keyword.strip())
+            if not terms or terms == ['?']:
+                return [("trademark_vienna_codes", "app_num", "", [])]
+            branches = []
+            for term in terms:
+                condition, params = self._vienna_match(term)
+                if condition:
+                    branches.append(("trademark_vienna_codes", "app_num", condition, params))
+            return branches
+        
+        if search_type == 'final_disposition':
+            # 最終処分コード（例: "A02" 拒絶査定、"A0?" 前方一致、複数指定可）
+            terms = QueryParser.split_terms(keyword.strip())
+            if not terms or terms == ['?']:
+                condition = "tci.final_disposition_type IS NOT NULL AND tci.final_disposition_type != ''"
+                return [("trademark_case_info tci", "tci.app_num", condition, [])]
+            branches = []
+            for term in terms:
+                condition, params = self._final_disposition_match(term)
+                branches.append(("trademark_case_info tci", "tci.app_num", condition, params))
+            return branches
+        
+        if search_type == 'trademark_type':
+            type_expr = keyword.strip()
+            if type_expr in ['？', '?']:
+                return [("trademark_case_info tci", "tci.app_num", "", [])]
+            match = self._trademark_type_match(type_expr)
+            if match is None:
+                return []
+            condition, params = match
+            return [("trademark_case_info tci", "tci.app_num", condition, params)]
+        
+        return None
+    
+    def _complex_condition_bitmap(self, branches: List[Tuple[str, str, str, List[str]]], max_rowid: int,
+                                  candidates: Optional[List[str]] = None) -> int:
+        """条件に一致する出願のビットマップ（trademark_case_infoのrowidの位置のビットが1）
+        
+        Args:
+            branches: _complex_condition_branchesの問い合わせ
+            max_rowid: trademark_case_infoの最大rowid
+            candidates: 指定した場合はこの出願番号の中だけを引く（準結合）
         """
+        if not branches:
+            return 0
+        
+        queries = []
+        params = []
+        for source, column, condition, branch_params in branches:
+            conditions = [condition] if condition else []
+            if candidates is not None:
+                conditions.append(f"{column} IN (SELECT value FROM json_each(?))")
+            queries.append(f"SELECT {column} FROM {source}" + (f" WHERE {' AND '.join(conditions)}" if conditions else ""))
+            params.extend(branch_params)
+            if candidates is not None:
+                params.append(json.dumps(candidates))
+        
         cursor = self.conn.cursor()
-        query = """
-            SELECT DISTINCT
-                tgs.app_num,
-                tgs.class_num,
-                ts.search_use_t as trademark_name,
-                tci.app_date,
-                tci.reg_date,
-                tci.reg_article_reg_num as reg_num,
-                tci.final_disposition_type,
-                tci.law_code,
-                tci.class_count
-            FROM trademark_goods_services tgs
-            LEFT JOIN trademark_search ts ON tgs.app_num = ts.app_num
-            LEFT JOIN trademark_case_info tci ON tgs.app_num = tci.app_num
-            WHERE tgs.class_num = ?
-            LIMIT ?
+        cursor.execute(f"""
+            SELECT tci.rowid FROM trademark_case_info tci
+            WHERE tci.app_num IN ({' UNION ALL '.join(queries)})
+        """, params)
+        return bitmap_from_rowids((row[0] for row in cursor), max_rowid)
+    
+    def _estimate_condition_rows(self, branches: List[Tuple[str, str, str, List[str]]], cap: int) -> int:
+        """条件に一致する行数の見積もり（cap件で打ち切るので広い条件でも数えきらない）"""
+        total = 0
+        cursor = self.conn.cursor()
+        for source, column, condition, params in branches:
+            where = f" WHERE {condition}" if condition else ""
+            cursor.execute(f"SELECT COUNT(*) FROM (SELECT 1 FROM {source}{where} LIMIT ?)", params + [cap - total])
+            total += cursor.fetchone()[0]
+            if total >= cap:
+                break
+        return total
+    
+    def _compile_complex(self, conditions: List[Dict[str, Any]], operator: str, rejection_keywords: List[str],
+                         negated: bool = False) -> Optional[Tuple[str, bool, Any]]:
+        """複合検索の条件（入れ子のグループ・否定を含む）を評価用の木にする
+        
+        条件は{'type': ..., 'keyword': ...}、グループは{'operator': 'AND'/'OR', 'conditions': [...]}で、
+        どちらも'not': Trueで否定できる。否定されていない拒絶条文コードの条件はrejection_keywordsに追加する。
+        
+        Returns:
+            (種類, 否定, 内容)。種類が'leaf'なら内容は_complex_condition_branchesの問い合わせ、
+            'AND'/'OR'なら子の木のリスト。有効な条件が無い場合はNone
         """
-        cursor.execute(query, (class_num.zfill(2), limit))
-        return [dict(row) for row in cursor.fetchall()]
+        children = []
+        for cond in conditions:
+            negate = bool(cond.get('not'))
+            if 'conditions' in cond:
+                # グループ
+                child = self._compile_complex(cond.get('conditions') or [], cond.get('operator', 'AND'),
+                                              rejection_keywords, negated != negate)
+                if child is None:
+                    continue
+            else:
+                search_type = cond.get('type')
+                keyword = cond.get('keyword')
+                if not keyword:
+                    continue
+                branches = self._complex_condition_branches(search_type, keyword)
+                if branches is None:
+                    continue
+                # 拒絶条文コード検索の場合、結果に詳細情報を付ける
+                if search_type == 'rejection_reason' and negated == negate:
+                    rejection_keywords.append(keyword)
+                child = ('leaf', False, branches)
+            
+            if negate:
+                child = (child[0], not child[1], child[2])
+            children.append(child)
+        
+        if not children:
+            return None
+        if len(children) == 1:
+            return children[0]
+        return ('OR' if str(operator).upper() == 'OR' else 'AND', False, children)
+    
+    def _estimate_complex_rows(self, node: Tuple[str, bool, Any], cap: int) -> int:
+        """評価用の木の一致件数の見積もり（cap件で打ち切り、否定は広い条件とみなす）"""
+        kind, negate, payload = node
+        if negate:
+            return cap
+        if kind == 'leaf':
+            return self._estimate_condition_rows(payload, cap)
+        estimates = [self._estimate_complex_rows(child, cap) for child in payload]
+        if kind == 'AND':
+            return min(estimates)
+        return min(sum(estimates), cap)
     
-    def search_complex(self, conditions: List[Dict[str, Any]], operator: str = 'AND', limit: int = 100, unified_format: bool = True) -> List[Dict[str, Any]]:
+    def _evaluate_complex(self, node: Tuple[str, bool, Any], max_rowid: int,
+                          candidate_bitmap: Optional[int] = None, candidates: Optional[List[str]] = None) -> int:
+        """評価用の木のビットマップ
+        
+        ANDでは一致件数の見積もりが少ない子から順に評価し、途中の結果がCOMPLEX_SEMI_JOIN_LIMIT件
+        以下になったら残りの子はその出願番号に限って引く。絞り込みの強い条件が1つあれば
+        全体のコストはその件数で抑えられ、途中で0件になれば残りの子は評価しない。
+        否定の子は肯定の子で絞り込んだ後に評価する。
+        
+        Args:
+            node: _compile_complexの木
+            max_rowid: trademark_case_infoの最大rowid
+            candidate_bitmap: 指定した場合はこのビットマップの中だけが正しければよい
+            candidates: candidate_bitmapの出願番号（準結合に使う）
+        """
+        kind, negate, payload = node
+        
+        if kind == 'leaf':
+            bitmap = self._complex_condition_bitmap(payload, max_rowid, candidates)
+        elif kind == 'OR':
+            bitmap = 0
+            for child in payload:
+                bitmap |= self._evaluate_complex(child, max_rowid, candidate_bitmap, candidates)
+        else:
+            estimates = [
+                (child[1], self._estimate_complex_rows(child, COMPLEX_SEMI_JOIN_LIMIT + 1), index)
+                for index, child in enumerate(payload)
+            ]
+            bitmap = candidate_bitmap
+            for _, _, index in sorted(estimates):
+                child_bitmap, child_candidates = None, None
+                if bitmap is not None:
+                    if not bitmap:
+                        break
+                    if bitmap_count(bitmap) <= COMPLEX_SEMI_JOIN_LIMIT:
+                        child_bitmap = bitmap
+                        child_candidates = candidates if bitmap is candidate_bitmap else self._bitmap_app_num_set(bitmap)
+                result = self._evaluate_complex(payload[index], max_rowid, child_bitmap, child_candidates)
+                bitmap = result if bitmap is None else bitmap & result
+            bitmap = bitmap or 0
+        
+        if negate:
+            # 候補（無ければ全出願）のうち一致しないもの
+            universe = candidate_bitmap if candidate_bitmap is not None else (1 << (max_rowid + 1)) - 1
+            bitmap = universe & ~bitmap
+        return bitmap
+    
+    def _bitmap_app_num_set(self, bitmap: int) -> List[str]:
+        """ビットマップの出願番号（順不同）"""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT app_num FROM trademark_case_info
+            WHERE rowid IN (SELECT value FROM json_each(?))
+        """, (json.dumps(bitmap_rowids(bitmap)),))
+        return [row[0] for row in cursor.fetchall()]
+    
+    def _bitmap_app_nums(self, bitmap: int, limit: int) -> List[str]:
+        """ビットマップの出願番号を出願日の新しい順にlimit件取得"""
+        count = bitmap_count(bitmap)
+        if count == 0:
+            return []
+        
+        cursor = self.conn.cursor()
+        if count <= COMPLEX_DIRECT_FETCH_LIMIT:
+            # 件数が少なければrowidで直接引いて並べ替える
+            cursor.execute("""
+                SELECT app_num FROM trademark_case_info
+                WHERE rowid IN (SELECT value FROM json_each(?))
+                ORDER BY app_date DESC
+                LIMIT ?
+            """, (json.dumps(bitmap_rowids(bitmap)), limit))
+            return [row[0] for row in cursor.fetchall()]
+        
+        # 件数が多ければ出願日のインデックスを新しい順に走査し、ビットマップに含まれるものを拾う
+        bits = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little')
+        cursor.execute("SELECT rowid, app_num FROM trademark_case_info ORDER BY app_date DESC")
+        app_nums = []
+        for rowid, app_num in cursor:
+            index = rowid >> 3
+            if index < len(bits) and bits[index] >> (rowid & 7) & 1:
+                app_nums.append(app_num)
+                if len(app_nums) >= limit:
+                    break
+        return app_nums
+    
+    def _complex_rejection_info(self, keywords: List[str], app_nums: List[str]) -> Dict[str, Dict[str, Any]]:
+        """複合検索の拒絶条文コード条件に一致した中間記録の詳細（出願番号ごと）"""
+        conditions = []
+        params = []
+        for keyword in keywords:
+            for _, _, condition, branch_params in self._complex_condition_branches('rejection_reason', keyword):
+                conditions.append(f"({condition})")
+                params.extend(branch_params)
+        if not conditions or not app_nums:
+            return {}
+        
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT
+                tdr.app_num,
+                tdr.rejection_reason_code,
+                tdr.intermediate_doc_code,
+                tdr.draft_date,
+                tdr.dispatch_date
+            FROM trademark_draft_records tdr
+            WHERE ({' OR '.join(conditions)})
+            AND tdr.app_num IN (SELECT value FROM json_each(?))
+            ORDER BY tdr.draft_date DESC
+        """, params + [json.dumps(app_nums)])
+        
+        rejection_info_map = {}
+        for row in cursor.fetchall():
+            rejection_info_map[row['app_num']] = {
+                'rejection_reason_code': row['rejection_reason_code'],
+                'intermediate_doc_code': row['intermediate_doc_code'],
+                'draft_date': row['draft_date'],
+                'dispatch_date': row['dispatch_date']
+            }
+        return rejection_info_map
+    
+    def _describe_complex_condition(self, cond: Dict[str, Any]) -> str:
+        """複合検索の条件の表示用文字列（例: "class:09"、"NOT (class:09 OR class:42)"）"""
+        if 'conditions' in cond:
+            operator = ' OR ' if str(cond.get('operator', 'AND')).upper() == 'OR' else ' AND '
+            text = '(' + operator.join(self._describe_complex_condition(c) for c in cond.get('conditions') or []) + ')'
+        else:
+            text = (cond.get('type') or '') + ':' + (cond.get('keyword') or '')
+        return 'NOT ' + text if cond.get('not') else text
+    
+    @cached_search
+    def search_complex(self, conditions: List[Dict[str, Any]], operator: str = 'AND', limit: int = 100, unified_format: bool = True, fields='full') -> List[Dict[str, Any]]:
         """複合条件検索
         
+        各条件に一致する出願を件数の上限なしにビットマップで求め、AND/OR/NOTをビット演算で
+        行ってから、結果を出願日の新しい順にlimit件取得する。ANDでは絞り込みの強い条件から
+        評価し、残りの条件はその結果の出願番号に限って引く（_evaluate_complex参照）。
+        
         Args:
             conditions: 検索条件のリスト。各条件は以下の形式:
                        [{'type': 'trademark', 'keyword': 'プル'},
                         {'type': 'class', 'keyword': '09'}]
-            operator: 条件の結合方法 ('AND' or 'OR')
+                       {'operator': 'AND'/'OR', 'conditions': [...]}で入れ子のグループ、
+                       'not': Trueで条件・グループの否定を指定できる。例:
+                       (09類 OR 42類) AND 称呼 AND NOT 拒絶査定 →
+                       [{'operator': 'OR', 'conditions': [{'type': 'class', 'keyword': '09'},
+                                                          {'type': 'class', 'keyword': '42'}]},
+                        {'type': 'phonetic', 'keyword': 'プル'},
+                        {'type': 'final_disposition', 'keyword': 'A02', 'not': True}]
+            operator: 最上位の条件の結合方法 ('AND' or 'OR')
             limit: 最大取得件数
             unified_format: 統一フォーマットで返すか
+            fields: 統一フォーマットで取得する項目（'summary'/'full'、_format_unified_result参照）
         
         Returns:
             検索結果リスト
@@ -7873,95 +8526,37 @@ class TMCloudIntegratedSearch:
         if not conditions:
             return []
         
-        # 各条件で検索を実行
-        all_results = []
-        for cond in conditions:
-            search_type = cond.get('type')
-            keyword = cond.get('keyword')
-            
-            if not keyword:
-                continue
-            
-            # 各検索タイプに応じて検索実行
-            if search_type == 'trademark':
-                results = self.search_trademark_name(keyword, limit=10000, unified_format=False)
-            elif search_type == 'phonetic':
-                results = self.search_phonetic(keyword, limit=10000, unified_format=False)
-            elif search_type == 'phonetic_exact':
-                results = self.search_phonetic(keyword, limit=10000, unified_format=False)
-            elif search_type == 'class':
-                # 複合検索用の区分検索メソッドを使用
-                results = self._search_by_class_for_complex(keyword, limit=10000)
-            elif search_type == 'applicant':
-                results = self.search_applicant(keyword, limit=10000, unified_format=False)
-            elif search_type == 'goods_services':
-                results = self.search_goods_services(keyword, limit=10000, unified_format=False)
-            elif search_type == 'app_num':
-                # 出願番号検索（単一結果をリストに変換）
-                result = self.search_by_app_num(keyword, unified_format=False)
-                results = [result] if result else []
-            elif search_type == 'reg_num':
-                # 登録番号検索（単一結果をリストに変換）
-                result = self.search_by_reg_num(keyword, unified_format=False)
-                results = [result] if result else []
-            elif search_type == 'similar_group':
-                # 類似群コード検索
-                results = self.search_by_similar_group(keyword, limit=10000, unified_format=False)
-            elif search_type == 'rejection_reason':
-                # 拒絶条文コード検索（例: "3?" 前方一致、"30" 完全一致、カンマ区切り複数可）
-                results = self.search_by_rejection_code(keyword.strip(), limit=10000, unified_format=False)
-            elif search_type == 'vienna_code':
-                # ウィーンコード検索（例: "1.3.20" 階層的前方一致、複数指定可）
-                results = self.search_by_vienna_code(keyword.strip(), limit=10000, unified_format=False)
-            elif search_type == 'trademark_type':
-                # 商標タイプ検索
-                results = self.search_by_trademark_type(keyword.strip(), limit=10000, unified_format=False)
-            else:
-                continue
-            
-            # 拒絶条文コード検索の場合、詳細情報を保持
-            if search_type == 'rejection_reason' and results:
-                if not hasattr(self, '_temp_rejection_info'):
-                    self._temp_rejection_info = {}
-                for r in results:
-                    if r.get('app_num'):
-                        self._temp_rejection_info[r['app_num']] = {
-                            'rejection_reason_code': r.get('rejection_reason_code'),
-                            'intermediate_doc_code': r.get('intermediate_doc_code'),
-                            'draft_date': r.get('draft_date'),
-                            'dispatch_date': r.get('dispatch_date')
-                        }
-            
-            all_results.append(set(r.get('app_num') for r in results if r.get('app_num')))
+        max_rowid = self.conn.execute("SELECT MAX(rowid) FROM trademark_case_info").fetchone()[0]
+        if max_rowid is None:
+            return []
         
-        if not all_results:
+        # 評価用の木（拒絶条文コード検索の詳細情報はローカルに保持。インスタンスに残すとプール利用時に次の検索へ漏れる）
+        rejection_keywords = []
+        tree = self._compile_complex(conditions, operator, rejection_keywords)
+        if tree is None:
             return []
         
-        # AND/OR演算
-        if operator == 'AND':
-            # 全ての条件を満たす出願番号
-            common_app_nums = set.intersection(*all_results) if all_results else set()
-        else:  # OR
-            # いずれかの条件を満たす出願番号
-            common_app_nums = set.union(*all_results) if all_results else set()
+        result_bitmap = self._evaluate_complex(tree, max_rowid)
         
-        if not common_app_nums:
+        app_nums_list = self._bitmap_app_nums(result_bitmap, limit)
+        if not app_nums_list:
             return []
         
         # 統一フォーマットで結果を取得
         if unified_format:
-            app_nums_list = list(common_app_nums)[:limit]
+            rejection_info_map = self._complex_rejection_info(rejection_keywords, app_nums_list)
+            matched_conditions = [self._describe_complex_condition(c) for c in conditions]
             search_specific = {}
             
             for app_num in app_nums_list:
                 specific_data = {
-                    'matched_conditions': [c.get('type') + ':' + c.get('keyword', '') for c in conditions],
+                    'matched_conditions': matched_conditions,
                     'operator': operator
                 }
                 
                 # 拒絶条文コード情報があれば追加
-                if hasattr(self, '_temp_rejection_info') and app_num in self._temp_rejection_info:
-                    rejection_info = self._temp_rejection_info[app_num]
+                if app_num in rejection_info_map:
+                    rejection_info = rejection_info_map[app_num]
                     # 拒絶条文コードを日本語に変換
                     if rejection_info.get('rejection_reason_code'):
                         code = rejection_info['rejection_reason_code']
@@ -7970,18 +8565,11 @@ class TMCloudIntegratedSearch:
                 
                 search_specific[app_num] = specific_data
             
-            # 一時データをクリア
-            if hasattr(self, '_temp_rejection_info'):
-                delattr(self, '_temp_rejection_info')
-            
-            return self._format_unified_result(app_nums_list, search_specific)
+            return self._format_unified_result(app_nums_list, search_specific, fields=fields)
         else:
             # 基本情報を取得して返す
             cursor = self.conn.cursor()
-            # limitとIN句の制限を考慮
-            app_nums_list = list(common_app_nums)[:min(limit, self.IN_CLAUSE_LIMIT)]
-            placeholders = ','.join(['?'] * len(app_nums_list))
-            query = f"""
+            query = """
                 SELECT DISTINCT
                     tci.app_num,
                     tci.reg_article_reg_num as reg_num,
@@ -7993,13 +8581,123 @@ class TMCloudIntegratedSearch:
                     tci.class_count
                 FROM trademark_case_info tci
                 LEFT JOIN trademark_search ts ON tci.app_num = ts.app_num
-                WHERE tci.app_num IN ({placeholders})
+                WHERE tci.app_num IN (SELECT value FROM json_each(?))
                 ORDER BY tci.app_date DESC
             """
-            cursor.execute(query, app_nums_list)
+            cursor.execute(query, (json.dumps(app_nums_list),))
             return [dict(row) for row in cursor.fetchall()]
     
     def close(self):
         """データベース接続を閉じる"""
         if self.conn:
             self.conn.close()
+
+
+# ========== コネクションプール ==========
+
+class TMCloudSearchPool:
+    """読み取り専用の検索インスタンスを保持するスレッドセーフなプール
+
+    起動時に一度だけ接続を作成し、リクエスト間で使い回すことで
+    接続・PRAGMA設定・スキーマ確認のコストを省き、SQLiteのページキャッシュを
+    温かいまま保つ。各インスタンスは同時に1スレッドだけが利用する
+    （チェックアウト/チェックイン方式）。
+
+    使用例:
+        pool = TMCloudSearchPool(db_path, size=4)
+        with pool.searcher() as searcher:
+            results = searcher.search_trademark_name('プル')
+    """
+
+    def __init__(self, db_path: str = None, size: int = 4, timeout: float = 30.0):
+        """初期化
+
+        Args:
+            db_path: データベースファイルのパス
+            size: プールする検索インスタンス数（同時実行可能な検索数）
+            timeout: 空きインスタンスを待つ最大秒数
+        """
+        if size < 1:
+            raise ValueError("プールサイズは1以上を指定してください")
+        
+        self.size = size
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._searchers = []
+        # LIFO: 直近に使われた（キャッシュが温かい）インスタンスを優先して再利用
+        self._idle = queue.LifoQueue()
+        self._closed = False
+        # 貸出中の件数（retire時に返却を待つ）
+        self._in_use = 0
+        self._returned = threading.Condition(self._lock)
+        
+        for _ in range(size):
+            # プール内の接続は読み取り専用（mode=ro、DDLなし）
+            searcher = TMCloudIntegratedSearch(db_path, check_same_thread=False, read_only=True)
+            # 2つ目以降は最初に解決したパスを使う
+            db_path = searcher.db_path
+            self._searchers.append(searcher)
+            self._idle.put(searcher)
+        
+        self.db_path = db_path
+    
+    @property
+    def closed(self) -> bool:
+        """クローズ済み（retire・close後）ならTrue"""
+        return self._closed
+    
+    @contextmanager
+    def searcher(self):
+        """検索インスタンスをチェックアウトする（withブロック終了時に返却）
+
+        クローズ済みのプールではRuntimeErrorになる（closedで確認できる）。
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("検索プールは既にクローズされています")
+            self._in_use += 1
+        
+        try:
+            try:
+                searcher = self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                raise TimeoutError(f"検索インスタンスの空き待ちがタイムアウトしました（{self.timeout}秒）")
+            
+            try:
+                yield searcher
+            finally:
+                # 例外で中断された読み取りトランザクションを残さない
+                if searcher.conn is not None and searcher.conn.in_transaction:
+                    searcher.conn.rollback()
+                self._idle.put(searcher)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+                self._returned.notify_all()
+    
+    def close(self):
+        """全ての接続を閉じる"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for searcher in self._searchers:
+                searcher.close()
+            self._searchers = []
+    
+    def retire(self, timeout: float = None):
+        """貸出中の検索が全て返却されるのを待ってから閉じる
+
+        DBの切り替え時に旧プールに対して呼ぶ。切り替え前にプールを取得した
+        実行中のリクエストは旧DBのまま最後まで処理される。
+
+        Args:
+            timeout: 返却を待つ最大秒数（Noneの場合は無期限。超過した場合もクローズする）
+        """
+        with self._lock:
+            self._returned.wait_for(lambda: self._in_use == 0, timeout=timeout)
+            # 待機後のチェックアウトを受け付けないよう、同じロックの中でクローズ済みにする
+            self._closed = True
+            searchers, self._searchers = self._searchers, []
+        for searcher in searchers:
+            searcher.close()
@@ -4,16 +4,149 @@ TMCloud 簡易Webインターフェース
 将来のFlask Webサービスへの第一歩
 """
 
-from flask import Flask, render_template_string, request, jsonify
-from tmcloud_search_integrated import TMCloudIntegratedSearch
+from flask import Flask, render_template_string, request, jsonify, make_response, abort, url_for
+from tmcloud_search_integrated import (
+    CURRENT_MANIFEST, TMCloudIntegratedSearch, TMCloudSearchPool, default_db_path,
+)
+from tmcloud_cache import configure_default_record_cache, configure_default_result_cache
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
+import hashlib
 import json
+import os
 import sys
+import threading
+import time
 
 app = Flask(__name__)
 
-# データベースパス（変更可能）
-DB_PATH = Path(__file__).parent / "tmcloud_v2_20250818_081655.db"
+BASE_DIR = Path(__file__).parent
+
+# データベースパス（指定した場合は固定。未指定の場合はtmcloud_current.jsonが指すDBを使い、
+# `tmcloud activate` による切り替えに追従する）
+DB_PATH = os.environ.get('TMCLOUD_DB')
+
+# マニフェストの変更を確認する間隔（秒）
+RELOAD_CHECK_INTERVAL = float(os.environ.get('TMCLOUD_RELOAD_INTERVAL', '5'))
+
+# 検索インスタンスのプールサイズ（同時に実行できる検索数）
+POOL_SIZE = int(os.environ.get('TMCLOUD_POOL_SIZE', '4'))
+
+# 画像キャッシュ（デコード済みJPEGを保持する件数。DBのビルドIDごとに分ける）
+IMAGE_CACHE_SIZE = int(os.environ.get('TMCLOUD_IMAGE_CACHE_SIZE', '1024'))
+_image_cache = OrderedDict()
+_image_cache_lock = threading.Lock()
+
+# 検索結果キャッシュ（プロセス内の上限MB・有効期限秒と、ワーカープロセス間で共有するSQLiteファイル）
+RESULT_CACHE_MB = int(os.environ.get('TMCLOUD_RESULT_CACHE_MB', '256'))
+RESULT_CACHE_TTL = float(os.environ.get('TMCLOUD_RESULT_CACHE_TTL', '3600'))
+RESULT_CACHE_DB = os.environ.get('TMCLOUD_RESULT_CACHE_DB')
+configure_default_result_cache(max_bytes=RESULT_CACHE_MB * 1024 * 1024, ttl=RESULT_CACHE_TTL,
+                               disk_path=RESULT_CACHE_DB)
+
+# 統一フォーマットのレコード（出願番号ごとのbasic_info）をプロセス内に保持する上限MB
+RECORD_CACHE_MB = int(os.environ.get('TMCLOUD_RECORD_CACHE_MB', '128'))
+configure_default_record_cache(max_bytes=RECORD_CACHE_MB * 1024 * 1024)
+
+# 検索APIのfields指定に使えるプロファイル名
+FIELD_PROFILE_NAMES = tuple(TMCloudIntegratedSearch.FIELD_PROFILES)
+
+# 検索プール（起動時に一度だけ作成し、全リクエストで共有。DB切り替え時に差し替える）
+_search_pool = None
+_search_pool_lock = threading.Lock()
+# 現在のプールを作成したときのマニフェストの更新時刻と、最後に確認した時刻
+_pool_manifest_mtime = None
+_manifest_checked_at = 0.0
+
+
+def current_db_path():
+    """検索に使うDB（環境変数の指定 > マニフェスト > 最新のtmcloud_v2_*.db）"""
+    return DB_PATH or default_db_path(BASE_DIR)
+
+
+def _manifest_mtime():
+    try:
+        return os.stat(BASE_DIR / CURRENT_MANIFEST).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def get_search_pool():
+    """検索プールを取得（未作成なら作成、マニフェストが変わっていれば切り替え）"""
+    global _search_pool, _pool_manifest_mtime, _manifest_checked_at
+    if _search_pool is None:
+        with _search_pool_lock:
+            if _search_pool is None:
+                _pool_manifest_mtime = _manifest_mtime()
+                _search_pool = TMCloudSearchPool(current_db_path(), size=POOL_SIZE)
+    elif DB_PATH is None:
+        now = time.monotonic()
+        if now - _manifest_checked_at >= RELOAD_CHECK_INTERVAL:
+            _manifest_checked_at = now
+            if _manifest_mtime() != _pool_manifest_mtime:
+                reload_search_pool(wait=False)
+    return _search_pool
+
+
+@contextmanager
+def pool_searcher():
+    """現在の検索プールから検索インスタンスを借りる（withブロック終了時に返却）
+
+    プールの参照を取得してから借りるまでの間にDB切り替えで旧プールが閉じられた場合は、
+    差し替え後のプールで借り直す。
+    """
+    while True:
+        pool = get_search_pool()
+        checked_out = False
+        try:
+            with pool.searcher() as searcher:
+                checked_out = True
+                yield searcher
+            return
+        except RuntimeError:
+            if checked_out or not pool.closed or pool is _search_pool:
+                raise
+
+
+def reload_search_pool(wait=True):
+    """マニフェストが指すDBに検索プールを切り替える（ホットリロード）
+
+    新しいプールを作成してから参照を差し替えるため、切り替え中も検索は止まらない。
+    旧プールは貸出中の検索が全て返却された後にバックグラウンドで閉じる。
+
+    Args:
+        wait: Falseの場合、他のスレッドが切り替え中なら何もせずに戻る
+
+    Returns:
+        切り替えた場合True
+    """
+    global _search_pool, _pool_manifest_mtime
+    if not _search_pool_lock.acquire(blocking=wait):
+        return False
+    try:
+        mtime = _manifest_mtime()
+        old_pool = _search_pool
+        db_path = current_db_path()
+        _pool_manifest_mtime = mtime
+        if old_pool is not None and Path(old_pool.db_path).resolve() == Path(db_path).resolve():
+            return False
+        try:
+            new_pool = TMCloudSearchPool(db_path, size=POOL_SIZE)
+        except Exception as e:
+            # 切り替え先が開けない場合は現在のDBで継続する
+            print(f"DB切り替えエラー（{db_path}）: {e}")
+            return False
+        _search_pool = new_pool
+        with _image_cache_lock:
+            _image_cache.clear()
+    finally:
+        _search_pool_lock.release()
+    
+    print(f"DBを切り替えました: {db_path}")
+    if old_pool is not None:
+        threading.Thread(target=old_pool.retire, daemon=True).start()
+    return True
 
 # HTMLテンプレート（シンプル版）
 HTML_TEMPLATE = """
@@ -44,6 +177,8 @@ HTML_TEMPLATE = """
             text-indent: -55px;  /* 最初の行だけ左に戻す */
         }
         .intermediate-records { margin-left: 140px; }
+        .result-details { margin: 5px 0; }
+        .result-details summary { cursor: pointer; color: #0066cc; }
         #searchConditions { max-height: 400px; overflow-y: auto; }
         .condition-item { transition: all 0.3s ease; }
         .condition-item:hover { background: #e8f4f8 !important; }
@@ -323,6 +458,7 @@ HTML_TEMPLATE = """
                         body: JSON.stringify({
                             conditions: conditions,
                             operator: operator,
+                            fields: 'summary',  // 一覧用の項目のみ（詳細は開いたときに取得）
                             sort_by: 'app_date_desc'  // デフォルトのソート
                         })
                     });
@@ -375,6 +511,150 @@ HTML_TEMPLATE = """
             return `${dateStr.slice(0,4)}/${dateStr.slice(4,6)}/${dateStr.slice(6,8)}`;
         }
         
+        // 一覧（fields=summary）では取得しない項目の表示
+        function renderDetails(info) {
+            let html = '';
+            
+            // 審判情報
+            html += addArrayField('審判番号', info.appeal_nums);
+            html += addArrayField('審判種別', info.appeal_types);
+            
+            // 詳細な説明
+            if (info.detailed_description) {
+                html += `<div class="field"><span class="field-label">詳細な説明:</span><br>`;
+                html += `<div style="margin-left: 120px; white-space: pre-wrap;">${esc(info.detailed_description)}</div>`;
+                html += `</div>`;
+            }
+            
+            // ウィーンコード
+            html += addArrayField('ウィーンコード', info.vienna_codes);
+            
+            // 拒絶条文コード
+            html += addArrayField('拒絶条文', info.rejection_reason_codes);
+            
+            // 審決分類
+            html += addArrayField('審決分類', info.appeal_disposition_codes);
+            
+            // 中間記録を審査・審判・登録に分けて表示
+            if (info.progress_records) {
+                // バックエンドから分類済みのデータを受け取る
+                const examRecords = info.progress_records.exam || [];
+                const trialRecords = info.progress_records.trial || [];
+                const registrationRecords = info.progress_records.registration || [];
+                
+                // 審査中間記録
+                if (examRecords.length > 0) {
+                    html += `<div class="field"><span class="field-label">審査中間記録:</span></div>`;
+                    examRecords.forEach(record => {
+                        const [code, date] = record.split(':');
+                        html += `<div class="intermediate-records">• ${esc(code)} (${esc(date)})</div>`;
+                    });
+                }
+                
+                // 審判中間記録
+                if (trialRecords.length > 0) {
+                    html += `<div class="field"><span class="field-label">審判中間記録:</span></div>`;
+                    trialRecords.forEach(record => {
+                        const [code, date] = record.split(':');
+                        html += `<div class="intermediate-records">• ${esc(code)} (${esc(date)})</div>`;
+                    });
+                }
+                
+                // 登録中間記録
+                if (registrationRecords.length > 0) {
+                    html += `<div class="field"><span class="field-label">登録中間記録:</span></div>`;
+                    registrationRecords.forEach(record => {
+                        const [code, date] = record.split(':');
+                        html += `<div class="intermediate-records">• ${esc(code)} (${esc(date)})</div>`;
+                    });
+                }
+            }
+            
+            // 審判中間記録（trial_intermediate_recordsから）  
+            if (info.trial_intermediate_records && info.trial_intermediate_records.length > 0) {
+                html += `<div class="field"><span class="field-label">審判中間記録:</span></div>`;
+                info.trial_intermediate_records.forEach(record => {
+                    const recordText = record['中間記録'] || record['中間コード'] || '';
+                    const date = record['日付'] || '';
+                    if (recordText || date) {
+                        html += `<div class="intermediate-records">• ${esc(recordText)} (${esc(date)})</div>`;
+                    }
+                });
+            }
+            
+            // 登録中間記録（registration_intermediate_recordsから）
+            if (info.registration_intermediate_records && info.registration_intermediate_records.length > 0) {
+                html += `<div class="field"><span class="field-label">登録中間記録:</span></div>`;
+                info.registration_intermediate_records.forEach(record => {
+                    const recordText = record['中間記録'] || record['中間コード'] || '';
+                    const date = record['日付'] || '';
+                    if (recordText || date) {
+                        html += `<div class="intermediate-records">• ${esc(recordText)} (${esc(date)})</div>`;
+                    }
+                });
+            }
+            
+            if (info.goods_services && Object.keys(info.goods_services).length > 0) {
+                html += '<div class="field"><span class="field-label">商品・役務:</span></div>';
+                // 区分を数値として昇順ソート
+                const sortedClasses = Object.keys(info.goods_services).sort((a, b) => parseInt(a) - parseInt(b));
+                for (const cls of sortedClasses) {
+                    const goods = info.goods_services[cls];
+                    // 全文表示（折りたたみ廃止）
+                    html += `<div class="goods-services">区分${esc(cls)}: ${esc(goods)}</div>`;
+                }
+            }
+            
+            if (info.similar_groups && Object.keys(info.similar_groups).length > 0) {
+                html += '<div class="field"><span class="field-label">類似群コード:</span></div>';
+                // 区分を数値として昇順ソート
+                const sortedClasses = Object.keys(info.similar_groups).sort((a, b) => parseInt(a) - parseInt(b));
+                for (const cls of sortedClasses) {
+                    const codes = info.similar_groups[cls];
+                    html += `<div class="similar-codes">区分${esc(cls)}: ${codes.map(c => esc(c)).join(', ')}</div>`;
+                }
+            }
+            
+            return html;
+        }
+        
+        // 詳細項目（全項目を取得済みならそのまま表示し、一覧用の場合は開いたときに取得する）
+        function resultDetails(info, fields) {
+            if (fields === 'full') {
+                return renderDetails(info);
+            }
+            return `<details class="result-details" data-app-num="${esc(info.app_num)}" ontoggle="loadDetails(this)"><summary>詳細（商品・役務、類似群コード、中間記録など）</summary><div class="details-body"></div></details>`;
+        }
+        
+        // 取得済みの詳細（並び替えで再描画しても取得し直さない）
+        const detailsCache = {};
+        
+        // 出願番号検索（fields=full）で全項目を取得して表示
+        async function loadDetails(element) {
+            if (!element.open || element.dataset.loaded) return;
+            const appNum = element.dataset.appNum;
+            const body = element.querySelector('.details-body');
+            element.dataset.loaded = '1';
+            try {
+                if (detailsCache[appNum] === undefined) {
+                    body.innerHTML = '読み込み中...';
+                    const response = await fetch(`/search?type=app_num&format=json&fields=full&keyword=${encodeURIComponent(appNum)}`);
+                    if (!response.ok) {
+                        throw new Error(`HTTP error! status: ${response.status}`);
+                    }
+                    const data = await response.json();
+                    if (!data.results || data.results.length === 0) {
+                        throw new Error('詳細が見つかりません');
+                    }
+                    detailsCache[appNum] = renderDetails(data.results[0].basic_info || data.results[0]);
+                }
+                body.innerHTML = detailsCache[appNum] || '<div>詳細な項目はありません。</div>';
+            } catch (error) {
+                delete element.dataset.loaded;
+                body.innerHTML = 'エラー: ' + esc(error.message);
+            }
+        }
+        
         function displayResults(data) {
             const resultsDiv = document.getElementById('results');
             
@@ -449,9 +729,9 @@ HTML_TEMPLATE = """
                 
                 // 商標名または商標画像を表示
                 let trademarkDisplay = '';
-                if (info.trademark_name === '[商標画像]' && info.trademark_image_data) {
-                    // Base64エンコードされた画像を表示
-                    trademarkDisplay = `<img src="data:image/jpeg;base64,${info.trademark_image_data}" alt="商標画像" style="max-width: 200px; max-height: 200px; display: block; margin: 10px 0;">`;
+                if (info.trademark_name === '[商標画像]' && info.image_url) {
+                    // 一覧はサムネイルを表示し、クリックで原寸画像を開く（ブラウザキャッシュ対象）
+                    trademarkDisplay = `<a href="${esc(info.image_url)}" target="_blank"><img src="${esc(info.thumb_url || info.image_url)}" alt="商標画像" loading="lazy" style="max-width: 200px; max-height: 200px; display: block; margin: 10px 0;"></a>`;
                 } else {
                     trademarkDisplay = esc(info.trademark_name || 'N/A');
                 }
@@ -525,10 +805,6 @@ HTML_TEMPLATE = """
                 html += addField('審査種別', info.exam_type);
                 html += addField('査定種別', info.decision_type);
                 
-                // 審判情報
-                html += addArrayField('審判番号', info.appeal_nums);
-                html += addArrayField('審判種別', info.appeal_types);
-                
                 // 出願人住所・国県コード
                 html += addArrayField('出願人住所', info.applicant_addresses);
                 html += addArrayField('国県コード', info.applicant_country_codes);
@@ -536,22 +812,6 @@ HTML_TEMPLATE = """
                 // 商標タイプ
                 html += addField('商標タイプ', info.trademark_type);
                 
-                // 詳細な説明
-                if (info.detailed_description) {
-                    html += `<div class="field"><span class="field-label">詳細な説明:</span><br>`;
-                    html += `<div style="margin-left: 120px; white-space: pre-wrap;">${esc(info.detailed_description)}</div>`;
-                    html += `</div>`;
-                }
-                
-                // ウィーンコード
-                html += addArrayField('ウィーンコード', info.vienna_codes);
-                
-                // 拒絶条文コード
-                html += addArrayField('拒絶条文', info.rejection_reason_codes);
-                
-                // 審決分類
-                html += addArrayField('審決分類', info.appeal_disposition_codes);
-                
                 // 優先権情報
                 if (info.priority_claims && info.priority_claims.length > 0) {
                     html += `<div class="field"><span class="field-label">優先権主張:</span><br>`;
@@ -626,91 +886,12 @@ HTML_TEMPLATE = """
                     html += `</div>`;
                 }
                 
-                // 中間記録を審査・審判・登録に分けて表示
-                if (info.progress_records) {
-                    // バックエンドから分類済みのデータを受け取る
-                    const examRecords = info.progress_records.exam || [];
-                    const trialRecords = info.progress_records.trial || [];
-                    const registrationRecords = info.progress_records.registration || [];
-                    
-                    // 審査中間記録
-                    if (examRecords.length > 0) {
-                        html += `<div class="field"><span class="field-label">審査中間記録:</span></div>`;
-                        examRecords.forEach(record => {
-                            const [code, date] = record.split(':');
-                            html += `<div class="intermediate-records">• ${esc(code)} (${esc(date)})</div>`;
-                        });
-                    }
-                    
-                    // 審判中間記録
-                    if (trialRecords.length > 0) {
-                        html += `<div class="field"><span class="field-label">審判中間記録:</span></div>`;
-                        trialRecords.forEach(record => {
-                            const [code, date] = record.split(':');
-                            html += `<div class="intermediate-records">• ${esc(code)} (${esc(date)})</div>`;
-                        });
-                    }
-                    
-                    // 登録中間記録
-                    if (registrationRecords.length > 0) {
-                        html += `<div class="field"><span class="field-label">登録中間記録:</span></div>`;
-                        registrationRecords.forEach(record => {
-                            const [code, date] = record.split(':');
-                            html += `<div class="intermediate-records">• ${esc(code)} (${esc(date)})</div>`;
-                        });
-                    }
-                }
-                
-                // 審判中間記録（trial_intermediate_recordsから）  
-                if (info.trial_intermediate_records && info.trial_intermediate_records.length > 0) {
-                    html += `<div class="field"><span class="field-label">審判中間記録:</span></div>`;
-                    info.trial_intermediate_records.forEach(record => {
-                        const recordText = record['中間記録'] || record['中間コード'] || '';
-                        const date = record['日付'] || '';
-                        if (recordText || date) {
-                            html += `<div class="intermediate-records">• ${esc(recordText)} (${esc(date)})</div>`;
-                        }
-                    });
-                }
-                
-                // 登録中間記録（registration_intermediate_recordsから）
-                if (info.registration_intermediate_records && info.registration_intermediate_records.length > 0) {
-                    html += `<div class="field"><span class="field-label">登録中間記録:</span></div>`;
-                    info.registration_intermediate_records.forEach(record => {
-                        const recordText = record['中間記録'] || record['中間コード'] || '';
-                        const date = record['日付'] || '';
-                        if (recordText || date) {
-                            html += `<div class="intermediate-records">• ${esc(recordText)} (${esc(date)})</div>`;
-                        }
-                    });
-                }
-                
                 // 旧フィールド（互換性のため残す）
                 html += addField('最終処分コード', info.disposition_code);
                 html += addField('最終処分日', formatDate(info.disposition_date));
                 html += addField('ステータス', info.status);
                 
-                if (info.goods_services && Object.keys(info.goods_services).length > 0) {
-                    html += '<div class="field"><span class="field-label">商品・役務:</span></div>';
-                    // 区分を数値として昇順ソート
-                    const sortedClasses = Object.keys(info.goods_services).sort((a, b) => parseInt(a) - parseInt(b));
-                    for (const cls of sortedClasses) {
-                        const goods = info.goods_services[cls];
-                        // 全文表示（折りたたみ廃止）
-                        html += `<div class="goods-services">区分${esc(cls)}: ${esc(goods)}</div>`;
-                    }
-                }
-                
-                if (info.similar_groups && Object.keys(info.similar_groups).length > 0) {
-                    html += '<div class="field"><span class="field-label">類似群コード:</span></div>';
-                    // 区分を数値として昇順ソート
-                    const sortedClasses = Object.keys(info.similar_groups).sort((a, b) => parseInt(a) - parseInt(b));
-                    for (const cls of sortedClasses) {
-                        const codes = info.similar_groups[cls];
-                        html += `<div class="similar-codes">区分${esc(cls)}: ${codes.map(c => esc(c)).join(', ')}</div>`;
-                    }
-                }
-                
+                html += resultDetails(info, data.fields);
                 html += '</div>';
             });
             
@@ -801,8 +982,8 @@ HTML_TEMPLATE = """
                 html += `<h3>${index + 1}. ${esc(info.trademark_name || 'N/A')}</h3>`;
                 
                 // 画像表示  
-                if (info.image) {
-                    html += `<div class="trademark-image"><img src="data:image/jpeg;base64,${info.image}" alt="商標画像"></div>`;
+                if (info.image_url) {
+                    html += `<div class="trademark-image"><a href="${esc(info.image_url)}" target="_blank"><img src="${esc(info.thumb_url || info.image_url)}" alt="商標画像" loading="lazy"></a></div>`;
                 }
                 
                 // 基本情報（条件付き表示）
@@ -818,7 +999,6 @@ HTML_TEMPLATE = """
                 }
                 
                 html += addArrayField('区分', info.classes);
-                html += addArrayField('ウィーン図形分類', info.vienna_codes);
                 
                 const hasValidDefensiveInfo = (
                     info.defensive_num || 
@@ -852,91 +1032,12 @@ HTML_TEMPLATE = """
                     html += `</div>`;
                 }
                 
-                // 中間記録を審査・審判・登録に分けて表示
-                if (info.progress_records) {
-                    // バックエンドから分類済みのデータを受け取る
-                    const examRecords = info.progress_records.exam || [];
-                    const trialRecords = info.progress_records.trial || [];
-                    const registrationRecords = info.progress_records.registration || [];
-                    
-                    // 審査中間記録
-                    if (examRecords.length > 0) {
-                        html += `<div class="field"><span class="field-label">審査中間記録:</span></div>`;
-                        examRecords.forEach(record => {
-                            const [code, date] = record.split(':');
-                            html += `<div class="intermediate-records">• ${esc(code)} (${esc(date)})</div>`;
-                        });
-                    }
-                    
-                    // 審判中間記録
-                    if (trialRecords.length > 0) {
-                        html += `<div class="field"><span class="field-label">審判中間記録:</span></div>`;
-                        trialRecords.forEach(record => {
-                            const [code, date] = record.split(':');
-                            html += `<div class="intermediate-records">• ${esc(code)} (${esc(date)})</div>`;
-                        });
-                    }
-                    
-                    // 登録中間記録
-                    if (registrationRecords.length > 0) {
-                        html += `<div class="field"><span class="field-label">登録中間記録:</span></div>`;
-                        registrationRecords.forEach(record => {
-                            const [code, date] = record.split(':');
-                            html += `<div class="intermediate-records">• ${esc(code)} (${esc(date)})</div>`;
-                        });
-                    }
-                }
-                
-                // 審判中間記録（trial_intermediate_recordsから）  
-                if (info.trial_intermediate_records && info.trial_intermediate_records.length > 0) {
-                    html += `<div class="field"><span class="field-label">審判中間記録:</span></div>`;
-                    info.trial_intermediate_records.forEach(record => {
-                        const recordText = record['中間記録'] || record['中間コード'] || '';
-                        const date = record['日付'] || '';
-                        if (recordText || date) {
-                            html += `<div class="intermediate-records">• ${esc(recordText)} (${esc(date)})</div>`;
-                        }
-                    });
-                }
-                
-                // 登録中間記録（registration_intermediate_recordsから）
-                if (info.registration_intermediate_records && info.registration_intermediate_records.length > 0) {
-                    html += `<div class="field"><span class="field-label">登録中間記録:</span></div>`;
-                    info.registration_intermediate_records.forEach(record => {
-                        const recordText = record['中間記録'] || record['中間コード'] || '';
-                        const date = record['日付'] || '';
-                        if (recordText || date) {
-                            html += `<div class="intermediate-records">• ${esc(recordText)} (${esc(date)})</div>`;
-                        }
-                    });
-                }
-                
                 // 旧フィールド（互換性のため残す）
                 html += addField('最終処分コード', info.disposition_code);
                 html += addField('最終処分日', formatDate(info.disposition_date));
                 html += addField('ステータス', info.status);
                 
-                if (info.goods_services && Object.keys(info.goods_services).length > 0) {
-                    html += '<div class="field"><span class="field-label">商品・役務:</span></div>';
-                    // 区分を数値として昇順ソート
-                    const sortedClasses = Object.keys(info.goods_services).sort((a, b) => parseInt(a) - parseInt(b));
-                    for (const cls of sortedClasses) {
-                        const goods = info.goods_services[cls];
-                        // 全文表示（折りたたみ廃止）
-                        html += `<div class="goods-services">区分${esc(cls)}: ${esc(goods)}</div>`;
-                    }
-                }
-                
-                if (info.similar_groups && Object.keys(info.similar_groups).length > 0) {
-                    html += '<div class="field"><span class="field-label">類似群コード:</span></div>';
-                    // 区分を数値として昇順ソート
-                    const sortedClasses = Object.keys(info.similar_groups).sort((a, b) => parseInt(a) - parseInt(b));
-                    for (const cls of sortedClasses) {
-                        const codes = info.similar_groups[cls];
-                        html += `<div class="similar-codes">区分${esc(cls)}: ${codes.map(c => esc(c)).join(', ')}</div>`;
-                    }
-                }
-                
+                html += resultDetails(info, data.fields);
                 html += '</div>';
             });
             
@@ -956,6 +1057,40 @@ HTML_TEMPLATE = """
 </html>
 """
 
+def add_image_urls(results):
+    """画像のある検索結果に画像URLを付与する（画像本体はJSONに含めない）"""
+    for result in results:
+        info = result.get('basic_info', result)
+        if info.get('has_image'):
+            info['image_url'] = url_for('trademark_image', app_num=info['app_num'])
+            info['thumb_url'] = url_for('trademark_image', app_num=info['app_num'], size='thumb')
+    return results
+
+
+def load_trademark_image(app_num, size='full'):
+    """商標画像をデコード済みのバイト列とETagで取得（DBのビルドIDごとのLRUキャッシュ）
+
+    週次更新で差し替え・追加された画像をすぐに返すため、キーにビルドIDを含め、
+    画像が無い場合（None）はキャッシュしない。
+    """
+    with pool_searcher() as searcher:
+        key = (searcher._current_build_id(), app_num, size)
+        with _image_cache_lock:
+            image = _image_cache.get(key)
+            if image is not None:
+                _image_cache.move_to_end(key)
+                return image
+        data = searcher.get_trademark_image(app_num, size=size)
+    if data is None:
+        return None
+    image = (data, hashlib.sha1(data).hexdigest())
+    with _image_cache_lock:
+        _image_cache[key] = image
+        while len(_image_cache) > IMAGE_CACHE_SIZE:
+            _image_cache.popitem(last=False)
+    return image
+
+
 @app.route('/')
 def index():
     """トップページ"""
@@ -970,52 +1105,60 @@ def search():
             search_type = request.args.get('type', 'trademark')
             keyword = request.args.get('keyword', '')
             format_type = request.args.get('format', 'html')
+            # 一覧ページは一覧用の項目のみ（詳細は画面で開いたときに出願番号検索で取得する）
+            fields = request.args.get('fields', 'summary' if format_type == 'html' else 'full')
         # POSTリクエストの場合
         else:
             data = request.json
             search_type = data.get('search_type', 'trademark')
             keyword = data.get('keyword', '')
             format_type = 'json'
+            fields = data.get('fields', 'full')
         
         if not keyword:
             return jsonify({'error': 'キーワードを入力してください'}), 400
         
-        # 毎回新しい接続を作成（コネクション切れ対策）
-        searcher = TMCloudIntegratedSearch(str(DB_PATH))
+        # 取得項目（summary: 一覧用の軽量版 / full: 全項目）
+        if fields not in FIELD_PROFILE_NAMES:
+            return jsonify({'error': f'不明なfields指定です: {fields}'}), 400
         
-        if search_type == 'trademark':
-            print(f"[DEBUG] Trademark search for: {keyword}", file=sys.stderr)
-            results = searcher.search_trademark_name(keyword, limit=3000, unified_format=True)
-            print(f"[DEBUG] Trademark search returned {len(results)} results", file=sys.stderr)
-        elif search_type == 'phonetic':
-            print(f"[DEBUG] Phonetic search for: {keyword}", file=sys.stderr)
-            results = searcher.search_phonetic(keyword, limit=3000, unified_format=True)
-            print(f"[DEBUG] Phonetic search returned {len(results)} results", file=sys.stderr)
-        elif search_type == 'phonetic_exact':
-            print(f"[DEBUG] Phonetic exact search for: {keyword}", file=sys.stderr)
-            results = searcher.search_phonetic(keyword, limit=3000, unified_format=True)
-            print(f"[DEBUG] Phonetic exact search returned {len(results)} results", file=sys.stderr)
-        elif search_type == 'app_num':
-            result = searcher.search_by_app_num(keyword, unified_format=True)  # 単一番号検索
-            results = [result] if result else []  # リストに変換
-        elif search_type == 'reg_num':
-            result = searcher.search_by_reg_num(keyword, unified_format=True)  # 単一番号検索
-            results = [result] if result else []  # リストに変換
-        elif search_type == 'intl_reg_num':
-            result = searcher.search_by_intl_reg_num(keyword, unified_format=True)  # 国際登録番号検索
-            results = [result] if result else []  # リストに変換
-        elif search_type == 'applicant':
-            results = searcher.search_applicant(keyword, limit=3000, unified_format=True)
-        elif search_type == 'similar_group':
-            results = searcher.search_by_similar_group(keyword, limit=3000, unified_format=True)
-        elif search_type == 'goods_services':
-            results = searcher.search_goods_services(keyword, limit=3000, item_and=True, unified_format=True)
-        elif search_type == 'rejection_reason':
-            results = searcher.search_rejection_reason(keyword, limit=3000, unified_format=True)
-        elif search_type == 'vienna_code':
-            results = searcher.search_by_vienna_code(keyword, limit=3000, unified_format=True)
-        else:
-            return jsonify({'error': '不明な検索タイプ'})
+        # プールから検索インスタンスを借りる（接続とページキャッシュを再利用）
+        with pool_searcher() as searcher:
+            if search_type == 'trademark':
+                print(f"[DEBUG] Trademark search for: {keyword}", file=sys.stderr)
+                results = searcher.search_trademark_name(keyword, limit=3000, unified_format=True, fields=fields)
+                print(f"[DEBUG] Trademark search returned {len(results)} results", file=sys.stderr)
+            elif search_type == 'phonetic':
+                print(f"[DEBUG] Phonetic search for: {keyword}", file=sys.stderr)
+                results = searcher.search_phonetic(keyword, limit=3000, unified_format=True, fields=fields)
+                print(f"[DEBUG] Phonetic search returned {len(results)} results", file=sys.stderr)
+            elif search_type == 'phonetic_exact':
+                print(f"[DEBUG] Phonetic exact search for: {keyword}", file=sys.stderr)
+                results = searcher.search_phonetic(keyword, limit=3000, unified_format=True, fields=fields)
+                print(f"[DEBUG] Phonetic exact search returned {len(results)} results", file=sys.stderr)
+            elif search_type == 'app_num':
+                result = searcher.search_by_app_num(keyword, unified_format=True, fields=fields)  # 単一番号検索
+                results = [result] if result else []  # リストに変換
+            elif search_type == 'reg_num':
+                result = searcher.search_by_reg_num(keyword, unified_format=True, fields=fields)  # 単一番号検索
+                results = [result] if result else []  # リストに変換
+            elif search_type == 'intl_reg_num':
+                result = searcher.search_by_intl_reg_num(keyword, unified_format=True)  # 国際登録番号検索
+                results = [result] if result else []  # リストに変換
+            elif search_type == 'applicant':
+                results = searcher.search_applicant(keyword, limit=3000, unified_format=True, fields=fields)
+            elif search_type == 'similar_group':
+                results = searcher.search_by_similar_group(keyword, limit=3000, unified_format=True, fields=fields)
+            elif search_type == 'goods_services':
+                results = searcher.search_goods_services(keyword, limit=3000, item_and=True, unified_format=True, fields=fields)
+            elif search_type == 'rejection_reason':
+                results = searcher.search_rejection_reason(keyword, limit=3000, unified_format=True, fields=fields)
+            elif search_type == 'vienna_code':
+                results = searcher.search_by_vienna_code(keyword, limit=3000, unified_format=True, fields=fields)
+            else:
+                return jsonify({'error': '不明な検索タイプ'})
+        
+        add_image_urls(results)
         
         # GETリクエストでformat=htmlの場合はHTMLとして表示
         if request.method == 'GET' and format_type == 'html':
@@ -1028,7 +1171,8 @@ def search():
                     'results': results,
                     'count': len(results),
                     'search_type': search_type,
-                    'keyword': keyword
+                    'keyword': keyword,
+                    'fields': fields
                 }, ensure_ascii=False) + 
                 ');\n});\n</script>\n</body>'
             )
@@ -1038,7 +1182,8 @@ def search():
             'results': results,
             'count': len(results),
             'search_type': search_type,
-            'keyword': keyword
+            'keyword': keyword,
+            'fields': fields
         })
         
     except Exception as e:
@@ -1051,35 +1196,66 @@ def search_complex():
         data = request.json
         conditions = data.get('conditions', [])
         operator = data.get('operator', 'AND')
+        fields = data.get('fields', 'full')
         
         if not conditions:
             return jsonify({'error': '検索条件を入力してください'}), 400
         
-        # 毎回新しい接続を作成
-        searcher = TMCloudIntegratedSearch(str(DB_PATH))
+        if fields not in FIELD_PROFILE_NAMES:
+            return jsonify({'error': f'不明なfields指定です: {fields}'}), 400
         
         # デフォルトのlimit設定
         limit = 3000
         
-        # 複合検索実行
-        results = searcher.search_complex(conditions, operator=operator, limit=limit, unified_format=True)
+        # 複合検索実行（プールから検索インスタンスを借りる）
+        with pool_searcher() as searcher:
+            results = searcher.search_complex(conditions, operator=operator, limit=limit, unified_format=True, fields=fields)
+        add_image_urls(results)
         
         return jsonify({
             'results': results,
             'count': len(results),
             'search_type': 'complex',
             'conditions': conditions,
-            'operator': operator
+            'operator': operator,
+            'fields': fields
         })
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/image/<app_num>')
+def trademark_image(app_num):
+    """商標画像（JPEG）を返す
+
+    ?size=thumb でサムネイル（未生成の場合は原寸）を返す。
+    内容のハッシュをETagとし、ブラウザには毎回ETagで再検証させる（no-cache）。
+    If-None-Matchが一致すれば304を返すため、週次更新で変わった画像だけが再送される。
+    """
+    size = request.args.get('size', 'full')
+    if size not in ('full', 'thumb'):
+        abort(400)
+    
+    image = load_trademark_image(app_num, size)
+    if image is None:
+        abort(404)
+    
+    data, etag = image
+    response = make_response(data)
+    response.mimetype = 'image/jpeg'
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
 if __name__ == '__main__':
-    import os
-    print(f"データベース: {DB_PATH}")
+    print(f"データベース: {current_db_path()}")
     print("サーバー起動中...")
     
+    # 起動時に検索プールを作成（最初のリクエストで接続コストを払わない）
+    get_search_pool()
+    print(f"検索プール: {POOL_SIZE}接続")
+    
     # 環境変数から設定を読み込み（本番対応）
     debug = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
     host = os.environ.get('FLASK_HOST', '0.0.0.0')  # 全インターフェースでリッスン
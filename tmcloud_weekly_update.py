@@ -1 +0,0 @@
-tmcloud_weekly_update_v18.py
\ No newline at end of file
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TMCloud 週次差分更新
+
+特許庁の週次TSV（upd_*.tsv）を既存のデータベースに適用する。
+各行はテーブルの主キーで置き換え（UPSERT）、add_del_idが「1」（削除）の行は
+主キーで削除する。FTS・正規化カラム・主画像・サムネイルは、更新のあった
+出願番号の分だけ作り直す（全件の再構築はしない）。
+
+更新は1トランザクションで適用するため、読み取り側（WAL）は
+コミットまで更新前の内容を参照し続ける。
+
+Usage:
+    python3 tmcloud_weekly_update.py <TSVディレクトリ|YYYYMMDD> [--db DBファイル]
+    ./tmcloud update <TSVディレクトリ|YYYYMMDD> [--db DBファイル]
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import List, Set, Tuple
+
+from tmcloud_images import build_image_primary, build_thumbnails
+from tmcloud_import_v2 import (
+    CUSTOM_IMPORTERS, IMPORT_BATCH_SIZE, IMPORT_MAPPINGS, TABLE_SPECS, TSV_DIR,
+    insert_image_rows, insert_sql, iter_table_rows, read_image_rows,
+)
+from tmcloud_migrate import (
+    build_similar_group_index, delete_search_ngrams, fill_norm_columns, fill_pronunciation_rev,
+    insert_search_ngrams, migrate, set_meta, stamp_build,
+)
+
+
+# 追加削除識別（add_del_id）の削除を表す値
+DELETE_ID = '1'
+
+
+def resolve_tsv_dir(value: str) -> Path:
+    """TSVディレクトリの解決（YYYYMMDDのみの場合はTSV_DIRと同じ階層の日付ディレクトリ）"""
+    path = Path(value)
+    if path.is_dir():
+        return path
+    return TSV_DIR.parent / value
+
+
+def primary_key_columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    """テーブルの主キーカラム（定義順）"""
+    info = conn.execute(f"PRAGMA table_info({table})").fetchall()
+    return [row[1] for row in sorted(info, key=lambda row: row[5]) if row[5]]
+
+
+def _create_app_num_table(conn: sqlite3.Connection, name: str):
+    """出願番号の一時テーブルを空の状態で用意"""
+    conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS {name} (app_num TEXT PRIMARY KEY)")
+    conn.execute(f"DELETE FROM temp.{name}")
+
+
+def _add_app_nums(conn: sqlite3.Connection, name: str, app_nums: Set[str]):
+    """出願番号の一時テーブルに追加"""
+    conn.executemany(f"INSERT OR IGNORE INTO temp.{name} (app_num) VALUES (?)",
+                     ((app_num,) for app_num in app_nums if app_num))
+
+
+# ========== テーブルごとの差分適用 ==========
+
+def apply_table_delta(conn: sqlite3.Connection, table: str, tsv_path: Path) -> Tuple[int, int]:
+    """1テーブル分の差分を適用する（コミットは呼び出し元で行う）
+
+    同じ主キーの追加・削除が1ファイル内に混在してもファイルの順に適用されるよう、
+    追加と削除が切り替わるところでまとめて書き込む。
+
+    置き換えは主キーで削除してから挿入する（分割番号・サブデータ番号は空欄＝NULLで
+    格納され、NULLを含む主キーはINSERT OR REPLACEでは衝突しないため）。
+
+    Returns:
+        (置き換えた件数, 削除した件数)
+    """
+    columns = [column[0] for column in TABLE_SPECS[table]['columns']]
+    key_columns = primary_key_columns(conn, table)
+    del_pos = columns.index('add_del_id') if 'add_del_id' in columns else None
+    app_pos = columns.index('app_num') if 'app_num' in columns else None
+
+    upsert_sql = insert_sql(table)
+    key_delete_sql = None
+    if key_columns:
+        key_positions = [columns.index(column) for column in key_columns]
+        key_delete_sql = f"DELETE FROM {table} WHERE " + ' AND '.join(f"{column} IS ?" for column in key_columns)
+    delete_sql = key_delete_sql if del_pos is not None else None
+
+    def row_key(row):
+        return tuple(row[pos] for pos in key_positions)
+
+    cursor = conn.cursor()
+    counts = {'upsert': 0, 'delete': 0}
+    touched = set()
+    batch = []
+    batch_kind = None
+
+    def flush():
+        if not batch:
+            return
+        if batch_kind == 'delete':
+            cursor.executemany(delete_sql, [row_key(row) for row in batch])
+        elif key_delete_sql:
+            # 同じ主キーの行がバッチ内に複数ある場合は後の行を残す
+            rows = {row_key(row): row for row in batch}
+            cursor.executemany(key_delete_sql, list(rows))
+            cursor.executemany(upsert_sql, list(rows.values()))
+        else:
+            cursor.executemany(upsert_sql, batch)
+        counts[batch_kind] += len(batch)
+        batch.clear()
+
+    for row in iter_table_rows(table, tsv_path):
+        kind = 'delete' if delete_sql and row[del_pos] == DELETE_ID else 'upsert'
+        if kind != batch_kind or len(batch) >= IMPORT_BATCH_SIZE:
+            flush()
+            batch_kind = kind
+        batch.append(row)
+        if app_pos is not None:
+            touched.add(row[app_pos])
+    flush()
+
+    _add_app_nums(conn, 'update_app_nums', touched)
+    return counts['upsert'], counts['delete']
+
+
+def scan_app_nums(table: str, tsv_path: Path) -> Set[str]:
+    """差分ファイルに含まれる出願番号（書き込み前に旧データを処理する場合に使う）"""
+    columns = [column[0] for column in TABLE_SPECS[table]['columns']]
+    app_pos = columns.index('app_num')
+    return {row[app_pos] for row in iter_table_rows(table, tsv_path) if row[app_pos]}
+
+
+def apply_image_delta(conn: sqlite3.Connection, tsv_path: Path) -> Set[str]:
+    """商標画像の差分を適用する（出願番号ごとに全ページを置き換える）
+
+    Returns:
+        画像が更新された出願番号
+    """
+    images = read_image_rows(tsv_path)
+    app_nums = {img['app_num'] for img in images if img['app_num']}
+
+    # 差分には出願番号の全ページが含まれるため、旧ページは残さない
+    _create_app_num_table(conn, 'update_image_app_nums')
+    _add_app_nums(conn, 'update_image_app_nums', app_nums)
+    conn.execute("""
+        DELETE FROM trademark_images
+        WHERE app_num IN (SELECT app_num FROM temp.update_image_app_nums)
+    """)
+    conn.execute("DELETE FROM temp.update_image_app_nums")
+
+    count = insert_image_rows(conn, images)
+    _add_app_nums(conn, 'update_app_nums', app_nums)
+    print(f"  trademark_images: {count}件（{len(app_nums)}出願）")
+    return app_nums
+
+
+# ========== 派生データ ==========
+
+# 差分で旧い値の削除が必要な外部コンテンツFTS
+# (FTSテーブル, コンテンツテーブル, カラム, 対象出願番号の一時テーブル)
+DELTA_FTS_TABLES = [
+    ('trademark_search_fts', 'trademark_search', 'search_use_t', 'update_search_app_nums'),
+    ('trademark_search_trigram', 'trademark_search', 'search_use_t_norm', 'update_search_app_nums'),
+    ('trademark_pronunciation_trigram', 'trademark_pronunciations', 'pronunciation_norm', 'update_pron_app_nums'),
+]
+
+# 書き込み前に出願番号を集めておくテーブル → 一時テーブル
+DELTA_FTS_SOURCES = {
+    'trademark_search': 'update_search_app_nums',
+    'trademark_pronunciations': 'update_pron_app_nums',
+}
+
+
+def _delete_search_fts(conn: sqlite3.Connection):
+    """差分に含まれる出願番号のFTS・n-gram行を削除（外部コンテンツFTSは削除時に旧い値が必要）"""
+    for fts_table, table, column, app_num_table in DELTA_FTS_TABLES:
+        conn.execute(f"""
+            INSERT INTO {fts_table}({fts_table}, rowid, {column})
+            SELECT 'delete', rowid, {column} FROM {table}
+            WHERE app_num IN (SELECT app_num FROM temp.{app_num_table})
+            AND {column} IS NOT NULL
+        """)
+    delete_search_ngrams(conn, 'update_search_app_nums')
+
+
+def _insert_search_fts(conn: sqlite3.Connection):
+    """差分に含まれる出願番号のFTS・n-gram行を登録（正規化カラムの再計算後に呼ぶ）"""
+    for fts_table, table, column, app_num_table in DELTA_FTS_TABLES:
+        conn.execute(f"""
+            INSERT INTO {fts_table}(rowid, {column})
+            SELECT rowid, {column} FROM {table}
+            WHERE app_num IN (SELECT app_num FROM temp.{app_num_table})
+            AND {column} IS NOT NULL
+        """)
+    insert_search_ngrams(conn, 'update_search_app_nums')
+
+
+def refresh_derived_columns(conn: sqlite3.Connection):
+    """対象の出願番号の正規化カラムを再計算"""
+    conn.execute("""
+        UPDATE trademark_search
+        SET search_use_t_norm = NULL
+        WHERE app_num IN (SELECT app_num FROM temp.update_app_nums)
+    """)
+    conn.execute("""
+        UPDATE trademark_pronunciations
+        SET pronunciation_norm = NULL, pronunciation_norm_rev = NULL
+        WHERE app_num IN (SELECT app_num FROM temp.update_app_nums)
+    """)
+    # 置き換えた行（出願番号を持たない申請人マスタを含む）は_normカラムがNULLになっている
+    fill_norm_columns(conn)
+    # 逆順カラムは称呼の_normカラムから作る
+    fill_pronunciation_rev(conn)
+
+
+# ========== 全体 ==========
+
+def apply_update(conn: sqlite3.Connection, tsv_dir: Path, workers: int = None) -> int:
+    """TSVディレクトリの差分をまとめて適用する
+
+    Args:
+        conn: データベース接続（スキーマは最新であること）
+        tsv_dir: upd_*.tsvのディレクトリ
+        workers: サムネイル生成のワーカープロセス数
+
+    Returns:
+        更新のあった出願番号の件数
+    """
+    # 一時テーブルは先にコミットしておく（適用に失敗してロールバックしても消えないように）
+    _create_app_num_table(conn, 'update_app_nums')
+    for app_num_table in DELTA_FTS_SOURCES.values():
+        _create_app_num_table(conn, app_num_table)
+    conn.commit()
+
+    existing_tables = {row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table'")}
+    targets = []
+    for tsv_filename, table in IMPORT_MAPPINGS:
+        tsv_path = tsv_dir / tsv_filename
+        if not tsv_path.exists():
+            continue
+        if table not in existing_tables:
+            print(f"警告: テーブル {table} がスキーマに無いため {tsv_filename} をスキップします")
+            continue
+        targets.append((tsv_path, table))
+    if not targets:
+        print(f"差分ファイルがありません: {tsv_dir}")
+        return 0
+
+    try:
+        # FTS・n-gramは書き込み前の内容で削除しておき、適用後に対象分だけ登録し直す
+        for tsv_path, table in targets:
+            if table in DELTA_FTS_SOURCES:
+                _add_app_nums(conn, DELTA_FTS_SOURCES[table], scan_app_nums(table, tsv_path))
+        _delete_search_fts(conn)
+
+        image_app_nums = set()
+        for index, (tsv_path, table) in enumerate(targets, 1):
+            print(f"[{index}/{len(targets)}] {tsv_path.name}")
+            start_time = time.time()
+            if table in CUSTOM_IMPORTERS:
+                image_app_nums |= apply_image_delta(conn, tsv_path)
+            else:
+                upserted, deleted = apply_table_delta(conn, table, tsv_path)
+                print(f"  {table}: 置換 {upserted}件 / 削除 {deleted}件")
+            print(f"  完了（{time.time() - start_time:.2f}秒）")
+
+        # 更新のあった出願番号の派生データ
+        print("派生データを更新中...")
+        refresh_derived_columns(conn)
+        _insert_search_fts(conn)
+        build_similar_group_index(conn, app_num_table='update_app_nums')
+        if image_app_nums:
+            build_image_primary(conn, app_nums=image_app_nums)
+
+        touched = conn.execute("SELECT COUNT(*) FROM temp.update_app_nums").fetchone()[0]
+        set_meta(conn, 'last_update', tsv_dir.name)
+        stamp_build(conn, f'update:{tsv_dir.name}')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.execute("DROP TABLE IF EXISTS temp.update_app_nums")
+        for app_num_table in DELTA_FTS_SOURCES.values():
+            conn.execute(f"DROP TABLE IF EXISTS temp.{app_num_table}")
+        conn.commit()
+
+    # サムネイルはチャンクごとにコミットするため、本体の適用後に作成する
+    if image_app_nums:
+        build_thumbnails(conn, workers=workers, app_nums=image_app_nums)
+    return touched
+
+
+def main(argv: List[str] = None):
+    """CLIエントリポイント"""
+    # 循環importを避けるため遅延import
+    from tmcloud_search_integrated import default_db_path
+
+    parser = argparse.ArgumentParser(description='TMCloud 週次差分更新')
+    parser.add_argument('tsv_dir', help='upd_*.tsvのディレクトリ（またはYYYYMMDD）')
+    parser.add_argument('--db', default=None,
+                        help='データベースファイル（省略時は最新のtmcloud_v2_*.db）')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='サムネイル生成のワーカープロセス数（default: CPU数）')
+    args = parser.parse_args(argv)
+
+    tsv_dir = resolve_tsv_dir(args.tsv_dir)
+    if not tsv_dir.is_dir():
+        print(f"エラー: TSVディレクトリが見つかりません: {tsv_dir}")
+        return 1
+
+    db_path = args.db or default_db_path()
+    conn = sqlite3.connect(db_path, timeout=60)
+    try:
+        print(f"差分更新: {tsv_dir} → {db_path}")
+        start_time = time.time()
+        migrate(conn)
+        touched = apply_update(conn, tsv_dir, workers=args.workers)
+        print(f"完了！ 更新出願 {touched}件（{time.time() - start_time:.2f}秒）")
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())